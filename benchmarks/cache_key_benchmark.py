@@ -0,0 +1,69 @@
+"""Benchmark of the construction of the canonical keys used by caching and request coalescing.
+
+It measures the cost of building the key of a search with domain filters, dates and a structured
+output schema, and of a fetch, from the parameters sent to the Linkup API. No request is sent.
+
+Run it with: make benchmark
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import timeit
+
+import pydantic
+
+from linkup import LinkupClient
+from linkup._cache_key import get_cache_key
+
+_N_RUNS = 10_000
+
+
+class _Company(pydantic.BaseModel):
+    name: str
+    founded_year: int | None = None
+    subsidiaries: list[str] = pydantic.Field(default_factory=list)
+
+
+def _report(name: str, seconds: float) -> None:
+    print(f"{name:<40} {seconds / _N_RUNS * 1e6:>10.1f} us/op")
+
+
+def main() -> None:
+    """Run the benchmark and print the cost of each operation."""
+    client = LinkupClient(api_key="benchmark")
+    search_params = client._get_search_params(  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        query="What is Microsoft's 2024 revenue?",
+        depth="standard",
+        output_type="structured",
+        structured_output_schema=_Company,
+        include_images=None,
+        from_date=dt.date(2024, 1, 1),
+        to_date="2024-12-31",
+        exclude_domains=["wikipedia.org", "reddit.com"],
+        include_domains=["microsoft.com", "sec.gov", "reuters.com"],
+        max_results=10,
+        include_inline_citations=None,
+        include_sources=None,
+    )
+    fetch_params = client._get_fetch_params(  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        url="HTTPS://www.Example.com:443/path/to/page/?query=1#section",
+        include_raw_html=None,
+        include_raw_content=True,
+        render_js=False,
+        extract_images=None,
+        mode=None,
+    )
+
+    _report(
+        "search key",
+        timeit.timeit(lambda: get_cache_key(url="/search", params=search_params), number=_N_RUNS),
+    )
+    _report(
+        "fetch key",
+        timeit.timeit(lambda: get_cache_key(url="/fetch", params=fetch_params), number=_N_RUNS),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark of the serialization of structured output schemas.
+
+It compares generating and serializing the JSON schema of a pydantic model, or serializing a
+dictionary schema, on each call with reusing the serialization cached by the client, as done for
+each search or research of a batch of tasks sharing the same schema. No request is sent.
+
+Run it with: make benchmark
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+from typing import Any
+
+import pydantic
+
+from linkup._client import _serialize_dict_schema, _serialize_model_schema
+
+_N_RUNS = 10_000
+
+
+class _Address(pydantic.BaseModel):
+    street: str
+    city: str
+    country: str
+
+
+class _Company(pydantic.BaseModel):
+    name: str
+    founded_year: int | None = None
+    headquarters: _Address
+    subsidiaries: list[str] = pydantic.Field(default_factory=list)
+    revenue_by_year: dict[str, float] = pydantic.Field(default_factory=dict)
+
+
+def _report(name: str, seconds: float) -> None:
+    print(f"{name:<40} {seconds / _N_RUNS * 1e6:>10.1f} us/op")
+
+
+def main() -> None:
+    """Run the benchmark and print the cost of each operation."""
+    _report(
+        "model schema (uncached)",
+        timeit.timeit(lambda: json.dumps(_Company.model_json_schema()), number=_N_RUNS),
+    )
+    _report(
+        "model schema (cached)",
+        timeit.timeit(lambda: _serialize_model_schema(_Company), number=_N_RUNS),
+    )
+
+    schema: dict[str, Any] = _Company.model_json_schema()
+    _report(
+        "dict schema (uncached)",
+        timeit.timeit(lambda: json.dumps(schema), number=_N_RUNS),
+    )
+    _report(
+        "dict schema (cached)",
+        timeit.timeit(lambda: _serialize_dict_schema(schema), number=_N_RUNS),
+    )
+
+
+if __name__ == "__main__":
+    main()
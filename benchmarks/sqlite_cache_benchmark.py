@@ -0,0 +1,53 @@
+"""Benchmark of writes to the SQLite cache once it holds a realistic number of entries.
+
+It fills a cache with 200,000 entries of 1 kB, at its size bound, and measures the cost of a
+write, which also evicts the least recently used entries to stay under the bound. No request is
+sent.
+
+Run it with: make benchmark
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import timeit
+from pathlib import Path
+
+from linkup import SQLiteCache
+
+_N_RUNS = 1_000
+_N_ENTRIES = 200_000
+_VALUE_SIZE = 1_000
+
+
+def _report(name: str, seconds: float) -> None:
+    print(f"{name:<40} {seconds / _N_RUNS * 1e6:>10.1f} us/op")
+
+
+def main() -> None:
+    """Run the benchmark and print the cost of each operation."""
+    with tempfile.TemporaryDirectory() as directory:
+        cache = SQLiteCache(
+            Path(directory) / "cache.db",
+            max_bytes=_N_ENTRIES * _VALUE_SIZE,
+            compress_min_bytes=None,
+        )
+        for i in range(_N_ENTRIES):
+            cache.set(f"entry-{i}", os.urandom(_VALUE_SIZE))
+        keys = iter(range(_N_ENTRIES, _N_ENTRIES + _N_RUNS))
+        value = os.urandom(_VALUE_SIZE)
+
+        _report(
+            f"set with {_N_ENTRIES} entries",
+            timeit.timeit(lambda: cache.set(f"entry-{next(keys)}", value), number=_N_RUNS),
+        )
+        _report(
+            f"get with {_N_ENTRIES} entries",
+            timeit.timeit(lambda: cache.get(f"entry-{_N_ENTRIES}"), number=_N_RUNS),
+        )
+        cache.close()
+
+
+if __name__ == "__main__":
+    main()
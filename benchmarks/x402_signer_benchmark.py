@@ -0,0 +1,82 @@
+"""Benchmark of the construction and signing costs of x402 signers.
+
+It compares creating a new signer for each job (create_x402_signer) with reusing the signer shared
+by the process (get_x402_signer), and measures the cost of signing a payment, with a random
+account and made-up payment requirements, without sending any request.
+
+Run it with: make benchmark
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import timeit
+
+from eth_account import Account
+from x402 import PaymentRequired, PaymentRequirements
+from x402.http import encode_payment_required_header
+
+from linkup.x402 import create_x402_signer, get_x402_signer
+
+_N_RUNS = 200
+
+
+def _get_402_response() -> tuple[dict[str, str], bytes]:
+    payment_required = PaymentRequired(
+        x402_version=2,
+        resource={"url": "https://api.linkup.so/v1/search"},  # pyright: ignore[reportArgumentType]
+        accepts=[
+            PaymentRequirements(
+                scheme="exact",
+                network="eip155:8453",
+                asset="0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
+                amount="5000",
+                pay_to="0x0000000000000000000000000000000000000001",
+                max_timeout_seconds=60,
+                extra={"name": "USD Coin", "version": "2"},
+            )
+        ],
+    )
+    return {"PAYMENT-REQUIRED": encode_payment_required_header(payment_required)}, b"{}"
+
+
+def _report(name: str, seconds: float) -> None:
+    print(f"{name:<40} {seconds / _N_RUNS * 1e6:>10.1f} us/op")
+
+
+def main() -> None:
+    """Run the benchmark and print the cost of each operation."""
+    account = Account.create()
+    response_headers, response_body = _get_402_response()
+
+    _report(
+        "create_x402_signer (per job)",
+        timeit.timeit(lambda: create_x402_signer(account), number=_N_RUNS),
+    )
+    get_x402_signer(account)
+    _report(
+        "get_x402_signer (shared)",
+        timeit.timeit(lambda: get_x402_signer(account), number=_N_RUNS),
+    )
+
+    signer = get_x402_signer(account)
+    _report(
+        "create_payment_headers",
+        timeit.timeit(
+            lambda: signer.create_payment_headers(response_headers, response_body),
+            number=_N_RUNS,
+        ),
+    )
+
+    async def async_sign() -> float:
+        start = time.perf_counter()
+        for _ in range(_N_RUNS):
+            await signer.async_create_payment_headers(response_headers, response_body)
+        return time.perf_counter() - start
+
+    _report("async_create_payment_headers", asyncio.run(async_sign()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,18 @@
+from ._cache import (
+    LinkupCacheBackend,
+    LinkupMemoryCache,
+    LinkupNegativeCache,
+    LinkupSQLiteCache,
+    LinkupStalePolicy,
+    LinkupTieredCache,
+)
+from ._circuit_breaker import LinkupCircuitBreaker
 from ._client import LinkupClient
+from ._concurrency import LinkupAdaptiveConcurrencyLimiter
 from ._errors import (
     LinkupAuthenticationError,
     LinkupBudgetLimitExceededError,
+    LinkupCircuitOpenError,
     LinkupFailedFetchError,
     LinkupFetchResponseTooLargeError,
     LinkupFetchTargetUnreachableError,
@@ -19,12 +30,23 @@ from ._errors import (
     LinkupUnknownError,
     LinkupUnsupportedTaskTypeError,
 )
+from ._hedging import LinkupHedgingPolicy
+from ._polling import LinkupPollingPolicy
+from ._rate_limit import LinkupRateLimiter
+from ._retry import LinkupRetryPolicy
+from ._task_poller import LinkupTaskPoller
 from ._types import (
     JSONObject,
+    LinkupCacheStats,
+    LinkupCircuitStateChange,
+    LinkupCoalescingStats,
+    LinkupConcurrencyAdjustment,
     LinkupFetchImageExtraction,
     LinkupFetchResponse,
     LinkupFetchTask,
     LinkupFetchTaskInput,
+    LinkupHedgingStats,
+    LinkupPoolStats,
     LinkupResearchTask,
     LinkupResearchTaskInput,
     LinkupResearchTasksPage,
@@ -41,13 +63,22 @@ from ._types import (
     LinkupTaskMetadata,
     LinkupTaskQuota,
     LinkupTasksPage,
+    LinkupX402PaymentStats,
 )
 from ._version import __version__
 
 # Aliases to allow usage like `import linkup` and `client = linkup.Client(...)`
+AdaptiveConcurrencyLimiter = LinkupAdaptiveConcurrencyLimiter
 AuthenticationError = LinkupAuthenticationError
 BudgetLimitExceededError = LinkupBudgetLimitExceededError
+CacheBackend = LinkupCacheBackend
+CacheStats = LinkupCacheStats
+CircuitBreaker = LinkupCircuitBreaker
+CircuitOpenError = LinkupCircuitOpenError
+CircuitStateChange = LinkupCircuitStateChange
 Client = LinkupClient
+CoalescingStats = LinkupCoalescingStats
+ConcurrencyAdjustment = LinkupConcurrencyAdjustment
 FailedFetchError = LinkupFailedFetchError
 FetchImageExtraction = LinkupFetchImageExtraction
 FetchResponse = LinkupFetchResponse
@@ -57,14 +88,23 @@ FetchUnsupportedContentTypeError = LinkupFetchUnsupportedContentTypeError
 FetchTask = LinkupFetchTask
 FetchTaskInput = LinkupFetchTaskInput
 FetchUrlIsFileError = LinkupFetchUrlIsFileError
+HedgingPolicy = LinkupHedgingPolicy
+HedgingStats = LinkupHedgingStats
 InsufficientCreditError = LinkupInsufficientCreditError
 InvalidRequestError = LinkupInvalidRequestError
 IpNotWhitelistedError = LinkupIpNotWhitelistedError
+MemoryCache = LinkupMemoryCache
+NegativeCache = LinkupNegativeCache
 NoResultError = LinkupNoResultError
 PaymentRequiredError = LinkupPaymentRequiredError
+PollingPolicy = LinkupPollingPolicy
+PoolStats = LinkupPoolStats
+RateLimiter = LinkupRateLimiter
 ResearchTask = LinkupResearchTask
 ResearchTaskInput = LinkupResearchTaskInput
 ResearchTasksPage = LinkupResearchTasksPage
+RetryPolicy = LinkupRetryPolicy
+SQLiteCache = LinkupSQLiteCache
 SearchImageResult = LinkupSearchImageResult
 SearchResults = LinkupSearchResults
 SearchStructuredResponse = LinkupSearchStructuredResponse
@@ -73,22 +113,34 @@ SearchTaskInput = LinkupSearchTaskInput
 SearchTextResult = LinkupSearchTextResult
 Source = LinkupSource
 SourcedAnswer = LinkupSourcedAnswer
+StalePolicy = LinkupStalePolicy
 Task = LinkupTask
 TaskNotFoundError = LinkupTaskNotFoundError
 TaskInput = LinkupTaskInput
 TaskMetadata = LinkupTaskMetadata
+TaskPoller = LinkupTaskPoller
 TaskQuota = LinkupTaskQuota
 TasksPage = LinkupTasksPage
 TasksQueueLimitExceededError = LinkupTasksQueueLimitExceededError
+TieredCache = LinkupTieredCache
 TimeoutError = LinkupTimeoutError  # noqa: A001
 TooManyRequestsError = LinkupTooManyRequestsError
 UnknownError = LinkupUnknownError
 UnsupportedTaskTypeError = LinkupUnsupportedTaskTypeError
+X402PaymentStats = LinkupX402PaymentStats
 
 __all__ = [
+    "AdaptiveConcurrencyLimiter",
     "AuthenticationError",
     "BudgetLimitExceededError",
+    "CacheBackend",
+    "CacheStats",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitStateChange",
     "Client",
+    "CoalescingStats",
+    "ConcurrencyAdjustment",
     "FailedFetchError",
     "FetchImageExtraction",
     "FetchResponse",
@@ -98,13 +150,23 @@ __all__ = [
     "FetchTaskInput",
     "FetchUnsupportedContentTypeError",
     "FetchUrlIsFileError",
+    "HedgingPolicy",
+    "HedgingStats",
     "InsufficientCreditError",
     "InvalidRequestError",
     "IpNotWhitelistedError",
     "JSONObject",
+    "LinkupAdaptiveConcurrencyLimiter",
     "LinkupAuthenticationError",
     "LinkupBudgetLimitExceededError",
+    "LinkupCacheBackend",
+    "LinkupCacheStats",
+    "LinkupCircuitBreaker",
+    "LinkupCircuitOpenError",
+    "LinkupCircuitStateChange",
     "LinkupClient",
+    "LinkupCoalescingStats",
+    "LinkupConcurrencyAdjustment",
     "LinkupFailedFetchError",
     "LinkupFetchImageExtraction",
     "LinkupFetchResponse",
@@ -114,14 +176,23 @@ __all__ = [
     "LinkupFetchTaskInput",
     "LinkupFetchUnsupportedContentTypeError",
     "LinkupFetchUrlIsFileError",
+    "LinkupHedgingPolicy",
+    "LinkupHedgingStats",
     "LinkupInsufficientCreditError",
     "LinkupInvalidRequestError",
     "LinkupIpNotWhitelistedError",
+    "LinkupMemoryCache",
+    "LinkupNegativeCache",
     "LinkupNoResultError",
     "LinkupPaymentRequiredError",
+    "LinkupPollingPolicy",
+    "LinkupPoolStats",
+    "LinkupRateLimiter",
     "LinkupResearchTask",
     "LinkupResearchTaskInput",
     "LinkupResearchTasksPage",
+    "LinkupRetryPolicy",
+    "LinkupSQLiteCache",
     "LinkupSearchImageResult",
     "LinkupSearchResults",
     "LinkupSearchStructuredResponse",
@@ -130,22 +201,33 @@ __all__ = [
     "LinkupSearchTextResult",
     "LinkupSource",
     "LinkupSourcedAnswer",
+    "LinkupStalePolicy",
     "LinkupTask",
     "LinkupTaskInput",
     "LinkupTaskMetadata",
     "LinkupTaskNotFoundError",
+    "LinkupTaskPoller",
     "LinkupTaskQuota",
     "LinkupTasksPage",
     "LinkupTasksQueueLimitExceededError",
+    "LinkupTieredCache",
     "LinkupTimeoutError",
     "LinkupTooManyRequestsError",
     "LinkupUnknownError",
     "LinkupUnsupportedTaskTypeError",
+    "LinkupX402PaymentStats",
+    "MemoryCache",
+    "NegativeCache",
     "NoResultError",
     "PaymentRequiredError",
+    "PollingPolicy",
+    "PoolStats",
+    "RateLimiter",
     "ResearchTask",
     "ResearchTaskInput",
     "ResearchTasksPage",
+    "RetryPolicy",
+    "SQLiteCache",
     "SearchImageResult",
     "SearchResults",
     "SearchStructuredResponse",
@@ -154,16 +236,20 @@ __all__ = [
     "SearchTextResult",
     "Source",
     "SourcedAnswer",
+    "StalePolicy",
     "Task",
     "TaskInput",
     "TaskMetadata",
     "TaskNotFoundError",
+    "TaskPoller",
     "TaskQuota",
     "TasksPage",
     "TasksQueueLimitExceededError",
+    "TieredCache",
     "TimeoutError",
     "TooManyRequestsError",
     "UnknownError",
     "UnsupportedTaskTypeError",
+    "X402PaymentStats",
     "__version__",
 ]
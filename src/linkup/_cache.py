@@ -0,0 +1,966 @@
+"""Caches of Linkup API responses."""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+import httpx
+
+from ._errors import (
+    LinkupCircuitOpenError,
+    LinkupFailedFetchError,
+    LinkupFetchTargetUnreachableError,
+    LinkupFetchUnsupportedContentTypeError,
+    LinkupNoResultError,
+    LinkupTimeoutError,
+    LinkupTooManyRequestsError,
+    LinkupUnknownError,
+)
+from ._types import LinkupCacheStats
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+@runtime_checkable
+class LinkupCacheBackend(Protocol):
+    """Backend storing Linkup API response bodies, used by the caches of a LinkupClient.
+
+    LinkupMemoryCache, LinkupSQLiteCache and LinkupTieredCache implement it, and other storages
+    (e.g. a Redis server shared by several workers) can be plugged by implementing it. Expired
+    entries must not be returned.
+    """
+
+    def get(self, key: str) -> bytes | None: ...  # pragma: no cover
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None: ...  # pragma: no cover
+
+    def delete(self, key: str) -> None: ...  # pragma: no cover
+
+    async def async_get(self, key: str) -> bytes | None: ...  # pragma: no cover
+
+    async def async_set(
+        self, key: str, value: bytes, ttl: float | None = None
+    ) -> None: ...  # pragma: no cover
+
+    async def async_delete(self, key: str) -> None: ...  # pragma: no cover
+
+    def size_bytes(self) -> int: ...  # pragma: no cover
+
+
+class _LinkupCacheEntry:
+    def __init__(self, value: bytes, expires_at: float) -> None:
+        self.value: bytes = value
+        self.expires_at: float = expires_at
+
+
+class LinkupMemoryCache:
+    """In-memory cache of Linkup API responses, with least recently used eviction and expiration.
+
+    Entries are the response bodies, and their size is the size of the bodies.
+
+    A cache can be shared between threads using synchronous calls, coroutines using asynchronous
+    calls, and several clients.
+
+    Args:
+        max_bytes: The maximum total size of the entries, in bytes. Least recently used entries are
+            evicted to respect it, and responses larger than it are not cached.
+        ttl: The default time to live of the entries, in seconds.
+
+    Raises:
+        ValueError: If max_bytes or ttl is not positive.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, ttl: float = 300.0) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.max_bytes: int = max_bytes
+        self.ttl: float = ttl
+
+        self._lock = threading.Lock()
+        self._entries: collections.OrderedDict[str, _LinkupCacheEntry] = collections.OrderedDict()
+        self._size_bytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._stale_hits: int = 0
+        self._evictions: int = 0
+
+    def get(self, key: str) -> bytes | None:
+        """Get a fresh entry of the cache.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            The value of the entry, or None if there is no entry for the key or if it expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    def get_stale(self, key: str, max_stale: float) -> tuple[bytes, float] | None:
+        """Get an entry of the cache, even if it expired, as long as it expired recently enough.
+
+        Expired entries are kept until they are evicted to respect the size bound of the cache, or
+        until they are looked up after they expired for more than max_stale seconds.
+
+        Args:
+            key: The key of the entry.
+            max_stale: The maximum duration since the expiration of the entry, in seconds.
+
+        Returns:
+            The value of the entry and the duration since its expiration in seconds, which is 0 if
+            the entry is fresh, or None if there is no usable entry for the key.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            staleness = 0.0
+            if entry is not None:
+                staleness = max(0.0, time.monotonic() - entry.expires_at)
+                if staleness > max_stale:
+                    self._remove(key)
+                    entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if staleness > 0:
+                self._stale_hits += 1
+            else:
+                self._hits += 1
+            return entry.value, staleness
+
+    async def async_get_stale(self, key: str, max_stale: float) -> tuple[bytes, float] | None:
+        """Asynchronously get an entry of the cache, even if it expired recently enough.
+
+        Args:
+            key: The key of the entry.
+            max_stale: The maximum duration since the expiration of the entry, in seconds.
+
+        Returns:
+            The value of the entry and the duration since its expiration in seconds, which is 0 if
+            the entry is fresh, or None if there is no usable entry for the key.
+        """
+        return self.get_stale(key, max_stale=max_stale)
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        """Set an entry of the cache, evicting the least recently used entries if needed.
+
+        Args:
+            key: The key of the entry.
+            value: The value of the entry.
+            ttl: The time to live of the entry, in seconds. If None, the default time to live of
+                the cache is used.
+        """
+        with self._lock:
+            self._remove(key)
+            if len(value) > self.max_bytes:
+                return
+            expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+            self._entries[key] = _LinkupCacheEntry(value=value, expires_at=expires_at)
+            self._size_bytes += len(value)
+            while self._size_bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def delete(self, key: str) -> None:
+        """Delete an entry of the cache, if any.
+
+        Args:
+            key: The key of the entry.
+        """
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Delete all the entries of the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    async def async_get(self, key: str) -> bytes | None:
+        """Asynchronously get a fresh entry of the cache.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            The value of the entry, or None if there is no entry for the key or if it expired.
+        """
+        return self.get(key)
+
+    async def async_set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        """Asynchronously set an entry of the cache, evicting least recently used entries if needed.
+
+        Args:
+            key: The key of the entry.
+            value: The value of the entry.
+            ttl: The time to live of the entry, in seconds. If None, the default time to live of
+                the cache is used.
+        """
+        self.set(key, value, ttl=ttl)
+
+    async def async_delete(self, key: str) -> None:
+        """Asynchronously delete an entry of the cache, if any.
+
+        Args:
+            key: The key of the entry.
+        """
+        self.delete(key)
+
+    def size_bytes(self) -> int:
+        """Get the total size of the entries of the cache.
+
+        Returns:
+            The size of the entries, in bytes.
+        """
+        with self._lock:
+            return self._size_bytes
+
+    def stats(self) -> LinkupCacheStats:
+        """Get statistics of the cache.
+
+        Returns:
+            The cache statistics, including the hit, miss and eviction counts.
+        """
+        with self._lock:
+            return LinkupCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                stale_hits=self._stale_hits,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+            )
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size_bytes -= len(entry.value)
+
+
+class LinkupParsedResponses:
+    """Parsed responses of the entries of Linkup API response caches, so that hits skip parsing.
+
+    The parsed response of an entry is reused as long as the cache returns the very same response
+    body object for the key, as a LinkupMemoryCache does until the entry is replaced or evicted.
+    Backends returning a new body on each hit (e.g. a LinkupSQLiteCache) get their responses
+    parsed again. Immutable responses, such as completed and failed tasks, can also be reused
+    without looking up the cache.
+
+    Parsed responses are kept up to max_bytes of response bodies, in least recently used order.
+
+    Args:
+        max_bytes: The maximum total size of the bodies of the kept parsed responses, in bytes.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024) -> None:
+        self.max_bytes: int = max_bytes
+
+        self._lock = threading.Lock()
+        self._entries: collections.OrderedDict[str, tuple[bytes, Any]] = collections.OrderedDict()
+        self._size_bytes: int = 0
+
+    def get(self, key: str, content: bytes | None = None) -> Any:  # noqa: ANN401
+        """Get the parsed response of a cache entry.
+
+        Args:
+            key: The key of the cache entry.
+            content: The response body returned by the cache for the key. If None, the parsed
+                response is returned whatever its body, which is only correct for immutable
+                responses.
+
+        Returns:
+            The parsed response, or None if it is unknown or was parsed from another body.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (content is not None and entry[0] is not content):
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, content: bytes, parsed: Any) -> None:  # noqa: ANN401
+        """Keep the parsed response of a cache entry.
+
+        Args:
+            key: The key of the cache entry.
+            content: The response body stored in the cache for the key.
+            parsed: The parsed response.
+        """
+        with self._lock:
+            self._remove(key)
+            if len(content) > self.max_bytes:
+                return
+            self._entries[key] = (content, parsed)
+            self._size_bytes += len(content)
+            while self._size_bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size_bytes -= len(entry[0])
+
+
+class LinkupStalePolicy:
+    """Policy to serve expired entries of the search cache, to keep latencies flat.
+
+    With stale-while-revalidate, a search whose cached response expired less than
+    stale_while_revalidate seconds ago is answered at once with this stale response, while the
+    response is refreshed in the background. Concurrent refreshes of the same search are
+    de-duplicated.
+
+    With stale-if-error, a search whose cached response expired less than stale_if_error seconds
+    ago, and whose request to the Linkup API fails with one of the stale_if_error_on errors, is
+    answered with this stale response instead of raising the error.
+
+    Policies only apply to the searches matching their depths and output types, so that different
+    policies can be used for different kinds of searches.
+
+    Args:
+        stale_while_revalidate: The maximum duration since the expiration of a cached response for
+            it to be served while being refreshed, in seconds.
+        stale_if_error: The maximum duration since the expiration of a cached response for it to
+            be served when the request fails, in seconds.
+        depths: The search depths the policy applies to. If None, it applies to all depths.
+        output_types: The search output types the policy applies to. If None, it applies to all
+            output types.
+        stale_if_error_on: The errors for which a stale response is served. Errors are matched with
+            isinstance, so the Linkup errors (e.g. LinkupUnknownError, which is raised for 5xx
+            status codes) or httpx errors (e.g. httpx.TransportError) can be used.
+
+    Raises:
+        ValueError: If stale_while_revalidate or stale_if_error is negative.
+    """
+
+    def __init__(
+        self,
+        stale_while_revalidate: float = 0.0,
+        stale_if_error: float = 0.0,
+        depths: Sequence[str] | None = None,
+        output_types: Sequence[str] | None = None,
+        stale_if_error_on: tuple[type[Exception], ...] = (
+            LinkupTimeoutError,
+            LinkupTooManyRequestsError,
+            LinkupUnknownError,
+            LinkupCircuitOpenError,
+            httpx.TransportError,
+        ),
+    ) -> None:
+        if stale_while_revalidate < 0:
+            raise ValueError("stale_while_revalidate must not be negative")
+        if stale_if_error < 0:
+            raise ValueError("stale_if_error must not be negative")
+
+        self.stale_while_revalidate: float = stale_while_revalidate
+        self.stale_if_error: float = stale_if_error
+        self.depths: tuple[str, ...] | None = None if depths is None else tuple(depths)
+        self.output_types: tuple[str, ...] | None = (
+            None if output_types is None else tuple(output_types)
+        )
+        self.stale_if_error_on: tuple[type[Exception], ...] = stale_if_error_on
+
+    @property
+    def max_stale(self) -> float:
+        """The maximum duration since the expiration of a cached response for it to be served."""
+        return max(self.stale_while_revalidate, self.stale_if_error)
+
+    def applies_to(self, depth: str, output_type: str) -> bool:
+        """Check whether the policy applies to a search.
+
+        Args:
+            depth: The depth of the search.
+            output_type: The output type of the search.
+
+        Returns:
+            Whether the policy applies to the search.
+        """
+        return (self.depths is None or depth in self.depths) and (
+            self.output_types is None or output_type in self.output_types
+        )
+
+    def can_serve_while_revalidating(self, staleness: float) -> bool:
+        """Check whether a stale response can be served while it is refreshed.
+
+        Args:
+            staleness: The duration since the expiration of the response, in seconds.
+
+        Returns:
+            Whether the response can be served while it is refreshed.
+        """
+        return staleness <= self.stale_while_revalidate
+
+    def can_serve_on_error(self, staleness: float, error: Exception) -> bool:
+        """Check whether a stale response can be served instead of raising an error.
+
+        Args:
+            staleness: The duration since the expiration of the response, in seconds.
+            error: The error raised by the request.
+
+        Returns:
+            Whether the response can be served instead of raising the error.
+        """
+        return staleness <= self.stale_if_error and isinstance(error, self.stale_if_error_on)
+
+
+class LinkupNegativeCache:
+    """Cache of the deterministic errors of searches and fetches, to avoid repeating them.
+
+    When a search or a fetch fails with one of the cached error classes, e.g. because a URL can't be
+    fetched, the same call raises the same error without calling the Linkup API until the error
+    expires. Errors are cached for a short time, depending on their class, since the outcome can
+    change (e.g. a web page can become reachable again).
+
+    A negative cache can be shared between threads using synchronous calls, coroutines using
+    asynchronous calls, and several clients.
+
+    Args:
+        ttls: The time to live of the cached errors by error class, in seconds. Errors are matched
+            with isinstance, in order, and errors matching no class are not cached. If None,
+            LinkupNoResultError and LinkupFetchTargetUnreachableError are cached for 5 minutes,
+            LinkupFailedFetchError for 10 minutes, and LinkupFetchUnsupportedContentTypeError for
+            1 hour.
+        max_entries: The maximum number of cached errors. The least recently used errors are
+            evicted to respect it.
+
+    Raises:
+        ValueError: If a time to live is not positive, or if max_entries is lower than 1.
+    """
+
+    def __init__(
+        self,
+        ttls: dict[type[Exception], float] | None = None,
+        max_entries: int = 10_000,
+    ) -> None:
+        if ttls is None:
+            ttls = {
+                LinkupNoResultError: 5 * 60,
+                LinkupFailedFetchError: 10 * 60,
+                LinkupFetchUnsupportedContentTypeError: 60 * 60,
+                LinkupFetchTargetUnreachableError: 5 * 60,
+            }
+        if any(ttl <= 0 for ttl in ttls.values()):
+            raise ValueError("ttls must be positive")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.ttls: dict[type[Exception], float] = dict(ttls)
+        self.max_entries: int = max_entries
+
+        self._lock = threading.Lock()
+        self._entries: collections.OrderedDict[
+            str, tuple[type[Exception], tuple[object, ...], float]
+        ] = collections.OrderedDict()
+
+    def get(self, key: str) -> Exception | None:
+        """Get the cached error of a call, if it didn't expire.
+
+        Args:
+            key: The key of the call.
+
+        Returns:
+            A new instance of the cached error, to be raised, or None if no error is cached for the
+            call.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            error_class, error_args, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return error_class(*error_args)
+
+    def set(self, key: str, error: Exception) -> None:
+        """Cache the error of a call, if its class is cached.
+
+        Args:
+            key: The key of the call.
+            error: The error raised by the call.
+        """
+        ttl = next(
+            (ttl for error_class, ttl in self.ttls.items() if isinstance(error, error_class)), None
+        )
+        if ttl is None:
+            return
+        with self._lock:
+            self._entries[key] = (type(error), error.args, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Delete the cached error of a call, if any.
+
+        Args:
+            key: The key of the call.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Delete all the cached errors."""
+        with self._lock:
+            self._entries.clear()
+
+
+class LinkupSQLiteCache:
+    """Persistent cache of Linkup API responses, stored in a SQLite database.
+
+    The database uses write-ahead logging, so that several processes can read and write the same
+    cache concurrently. Entries are the raw response bodies, compressed with zlib when they are
+    larger than compress_min_bytes, and least recently used entries are evicted to respect a size
+    bound.
+
+    A cache can be shared between threads using synchronous calls, coroutines using asynchronous
+    calls, and several clients. Statistics other than the number and size of entries are tracked
+    per process.
+
+    Args:
+        path: The path of the SQLite database file, created if needed.
+        max_bytes: The maximum total size of the stored entries, in bytes. Least recently used
+            entries are evicted to respect it, and responses larger than it are not cached.
+        ttl: The default time to live of the entries, in seconds.
+        compress_min_bytes: The size from which entries are compressed, in bytes. If None, entries
+            are never compressed.
+
+    Raises:
+        ValueError: If max_bytes or ttl is not positive.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        max_bytes: int = 1024 * 1024 * 1024,
+        ttl: float = 24 * 60 * 60,
+        compress_min_bytes: int | None = 1024,
+    ) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.path: str = os.fspath(path)
+        self.max_bytes: int = max_bytes
+        self.ttl: float = ttl
+        self.compress_min_bytes: int | None = compress_min_bytes
+
+        self._lock = threading.Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+        self._connection = sqlite3.connect(
+            self.path, timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS linkup_cache ("
+                "key TEXT PRIMARY KEY, "
+                "value BLOB NOT NULL, "
+                "compressed INTEGER NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "expires_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS linkup_cache_accessed_at ON linkup_cache (accessed_at)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS linkup_cache_expires_at ON linkup_cache (expires_at)"
+            )
+            self._create_totals()
+
+    def get(self, key: str) -> bytes | None:
+        """Get a fresh entry of the cache.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            The value of the entry, or None if there is no entry for the key or if it expired.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, compressed FROM linkup_cache WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            self._connection.execute(
+                "UPDATE linkup_cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._hits += 1
+        value, compressed = row
+        return zlib.decompress(value) if compressed else bytes(value)
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        """Set an entry of the cache, evicting expired and least recently used entries if needed.
+
+        Args:
+            key: The key of the entry.
+            value: The value of the entry.
+            ttl: The time to live of the entry, in seconds. If None, the default time to live of
+                the cache is used.
+        """
+        compressed = self.compress_min_bytes is not None and len(value) >= self.compress_min_bytes
+        if compressed:
+            value = zlib.compress(value)
+        now = time.time()
+        with self._lock:
+            if len(value) > self.max_bytes:
+                self._connection.execute("DELETE FROM linkup_cache WHERE key = ?", (key,))
+                return
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                # An upsert rather than INSERT OR REPLACE, whose implicit deletions don't fire the
+                # triggers maintaining the totals
+                self._connection.execute(
+                    "INSERT INTO linkup_cache "
+                    "(key, value, compressed, size, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET value = excluded.value, "
+                    "compressed = excluded.compressed, size = excluded.size, "
+                    "expires_at = excluded.expires_at, accessed_at = excluded.accessed_at",
+                    (
+                        key,
+                        value,
+                        compressed,
+                        len(value),
+                        now + (self.ttl if ttl is None else ttl),
+                        now,
+                    ),
+                )
+                self._evict(now=now)
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def delete(self, key: str) -> None:
+        """Delete an entry of the cache, if any.
+
+        Args:
+            key: The key of the entry.
+        """
+        with self._lock:
+            self._connection.execute("DELETE FROM linkup_cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Delete all the entries of the cache."""
+        with self._lock:
+            self._connection.execute("DELETE FROM linkup_cache")
+
+    async def async_get(self, key: str) -> bytes | None:
+        """Asynchronously get a fresh entry of the cache, without blocking the event loop.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            The value of the entry, or None if there is no entry for the key or if it expired.
+        """
+        return await asyncio.to_thread(self.get, key)
+
+    async def async_set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        """Asynchronously set an entry of the cache, without blocking the event loop.
+
+        Args:
+            key: The key of the entry.
+            value: The value of the entry.
+            ttl: The time to live of the entry, in seconds. If None, the default time to live of
+                the cache is used.
+        """
+        await asyncio.to_thread(self.set, key, value, ttl)
+
+    async def async_delete(self, key: str) -> None:
+        """Asynchronously delete an entry of the cache, if any, without blocking the event loop.
+
+        Args:
+            key: The key of the entry.
+        """
+        await asyncio.to_thread(self.delete, key)
+
+    def size_bytes(self) -> int:
+        """Get the total size of the stored entries of the cache.
+
+        Returns:
+            The size of the entries, in bytes, after compression.
+        """
+        with self._lock:
+            (size_bytes,) = self._connection.execute(
+                "SELECT size FROM linkup_cache_totals WHERE id = 0"
+            ).fetchone()
+            return size_bytes
+
+    def close(self) -> None:
+        """Close the connection to the database."""
+        with self._lock:
+            self._connection.close()
+
+    def stats(self) -> LinkupCacheStats:
+        """Get statistics of the cache.
+
+        Returns:
+            The cache statistics, including the hit, miss and eviction counts of the process.
+        """
+        with self._lock:
+            entries, size_bytes = self._connection.execute(
+                "SELECT entries, size FROM linkup_cache_totals WHERE id = 0"
+            ).fetchone()
+            return LinkupCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=entries,
+                size_bytes=size_bytes,
+            )
+
+    def _create_totals(self) -> None:
+        # The number and size of the entries are kept up to date by triggers, in the transactions
+        # changing the entries, so that bounding the size doesn't need to scan the whole table
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS linkup_cache_totals ("
+                "id INTEGER PRIMARY KEY CHECK (id = 0), "
+                "entries INTEGER NOT NULL, "
+                "size INTEGER NOT NULL)"
+            )
+            # Databases created before the totals were tracked are scanned once
+            self._connection.execute(
+                "INSERT OR IGNORE INTO linkup_cache_totals (id, entries, size) "
+                "SELECT 0, COUNT(*), COALESCE(SUM(size), 0) FROM linkup_cache"
+            )
+            self._connection.execute(
+                "CREATE TRIGGER IF NOT EXISTS linkup_cache_insert AFTER INSERT ON linkup_cache "
+                "BEGIN UPDATE linkup_cache_totals "
+                "SET entries = entries + 1, size = size + NEW.size WHERE id = 0; END"
+            )
+            self._connection.execute(
+                "CREATE TRIGGER IF NOT EXISTS linkup_cache_delete AFTER DELETE ON linkup_cache "
+                "BEGIN UPDATE linkup_cache_totals "
+                "SET entries = entries - 1, size = size - OLD.size WHERE id = 0; END"
+            )
+            self._connection.execute(
+                "CREATE TRIGGER IF NOT EXISTS linkup_cache_update "
+                "AFTER UPDATE OF size ON linkup_cache "
+                "BEGIN UPDATE linkup_cache_totals "
+                "SET size = size - OLD.size + NEW.size WHERE id = 0; END"
+            )
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+
+    def _evict(self, now: float) -> None:
+        self._connection.execute("DELETE FROM linkup_cache WHERE expires_at <= ?", (now,))
+        (size_bytes,) = self._connection.execute(
+            "SELECT size FROM linkup_cache_totals WHERE id = 0"
+        ).fetchone()
+        if size_bytes <= self.max_bytes:
+            return
+        # Only the least recently used entries needed to respect the bound are read
+        evicted_keys: list[tuple[str]] = []
+        cursor = self._connection.execute("SELECT key, size FROM linkup_cache ORDER BY accessed_at")
+        try:
+            for key, size in cursor:
+                if size_bytes <= self.max_bytes:
+                    break
+                evicted_keys.append((key,))
+                size_bytes -= size
+        finally:
+            cursor.close()
+        self._connection.executemany("DELETE FROM linkup_cache WHERE key = ?", evicted_keys)
+        self._evictions += len(evicted_keys)
+
+
+class LinkupTieredCache:
+    """Cache of Linkup API responses composed of a fast first tier over a larger second tier.
+
+    Entries are written to both tiers, and looked up in the first tier then in the second one.
+    Entries found in the second tier are promoted to the first tier, so that the next lookups are
+    faster. A typical composition is a LinkupMemoryCache over a LinkupSQLiteCache, or over a
+    backend shared by several processes.
+
+    Args:
+        l1: The first tier, looked up first.
+        l2: The second tier, looked up when the first tier has no fresh entry.
+        promotion_ttl: The time to live of the entries promoted to the first tier, in seconds. If
+            None, the default time to live of the first tier is used. It should not be longer than
+            the time to live of the entries of the second tier.
+    """
+
+    def __init__(
+        self,
+        l1: LinkupCacheBackend,
+        l2: LinkupCacheBackend,
+        promotion_ttl: float | None = None,
+    ) -> None:
+        self.l1: LinkupCacheBackend = l1
+        self.l2: LinkupCacheBackend = l2
+        self.promotion_ttl: float | None = promotion_ttl
+
+    def get(self, key: str) -> bytes | None:
+        """Get a fresh entry of the cache, promoting it to the first tier if needed.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            The value of the entry, or None if there is no entry for the key in any tier.
+        """
+        value = self.l1.get(key)
+        if value is None:
+            value = self.l2.get(key)
+            if value is not None:
+                self.l1.set(key, value, ttl=self.promotion_ttl)
+        return value
+
+    def get_stale(self, key: str, max_stale: float) -> tuple[bytes, float] | None:
+        """Get an entry of the cache, even if it expired in the first tier recently enough.
+
+        A fresh entry of the second tier is preferred over a stale entry of the first tier, and
+        promoted to the first tier.
+
+        Args:
+            key: The key of the entry.
+            max_stale: The maximum duration since the expiration of the entry, in seconds.
+
+        Returns:
+            The value of the entry and the duration since its expiration in seconds, which is 0 if
+            the entry is fresh, or None if there is no usable entry for the key.
+
+        Raises:
+            TypeError: If the first tier is not a LinkupMemoryCache.
+        """
+        cached_entry = self._get_l1_stale(key, max_stale=max_stale)
+        if cached_entry is not None and cached_entry[1] == 0:
+            return cached_entry
+        value = self.l2.get(key)
+        if value is None:
+            return cached_entry
+        self.l1.set(key, value, ttl=self.promotion_ttl)
+        return value, 0.0
+
+    async def async_get_stale(self, key: str, max_stale: float) -> tuple[bytes, float] | None:
+        """Asynchronously get an entry of the cache, even if it expired in the first tier recently.
+
+        A fresh entry of the second tier is preferred over a stale entry of the first tier, and
+        promoted to the first tier.
+
+        Args:
+            key: The key of the entry.
+            max_stale: The maximum duration since the expiration of the entry, in seconds.
+
+        Returns:
+            The value of the entry and the duration since its expiration in seconds, which is 0 if
+            the entry is fresh, or None if there is no usable entry for the key.
+
+        Raises:
+            TypeError: If the first tier is not a LinkupMemoryCache.
+        """
+        cached_entry = self._get_l1_stale(key, max_stale=max_stale)
+        if cached_entry is not None and cached_entry[1] == 0:
+            return cached_entry
+        value = await self.l2.async_get(key)
+        if value is None:
+            return cached_entry
+        await self.l1.async_set(key, value, ttl=self.promotion_ttl)
+        return value, 0.0
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        """Set an entry in both tiers of the cache.
+
+        Args:
+            key: The key of the entry.
+            value: The value of the entry.
+            ttl: The time to live of the entry, in seconds. If None, the default time to live of
+                each tier is used.
+        """
+        self.l1.set(key, value, ttl=ttl)
+        self.l2.set(key, value, ttl=ttl)
+
+    def delete(self, key: str) -> None:
+        """Delete an entry from both tiers of the cache, if any.
+
+        Args:
+            key: The key of the entry.
+        """
+        self.l1.delete(key)
+        self.l2.delete(key)
+
+    async def async_get(self, key: str) -> bytes | None:
+        """Asynchronously get a fresh entry of the cache, promoting it to the first tier if needed.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            The value of the entry, or None if there is no entry for the key in any tier.
+        """
+        value = await self.l1.async_get(key)
+        if value is None:
+            value = await self.l2.async_get(key)
+            if value is not None:
+                await self.l1.async_set(key, value, ttl=self.promotion_ttl)
+        return value
+
+    async def async_set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        """Asynchronously set an entry in both tiers of the cache.
+
+        Args:
+            key: The key of the entry.
+            value: The value of the entry.
+            ttl: The time to live of the entry, in seconds. If None, the default time to live of
+                each tier is used.
+        """
+        await self.l1.async_set(key, value, ttl=ttl)
+        await self.l2.async_set(key, value, ttl=ttl)
+
+    async def async_delete(self, key: str) -> None:
+        """Asynchronously delete an entry from both tiers of the cache, if any.
+
+        Args:
+            key: The key of the entry.
+        """
+        await self.l1.async_delete(key)
+        await self.l2.async_delete(key)
+
+    def size_bytes(self) -> int:
+        """Get the total size of the entries of both tiers of the cache.
+
+        Returns:
+            The size of the entries, in bytes. Entries stored in both tiers are counted twice.
+        """
+        return self.l1.size_bytes() + self.l2.size_bytes()
+
+    def _get_l1_stale(self, key: str, max_stale: float) -> tuple[bytes, float] | None:
+        if not isinstance(self.l1, LinkupMemoryCache):
+            raise TypeError("Stale lookups require the first tier to be a LinkupMemoryCache")
+        return self.l1.get_stale(key, max_stale=max_stale)
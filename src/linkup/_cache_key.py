@@ -0,0 +1,67 @@
+"""Canonical keys of the requests to the Linkup API, used by caching and request coalescing."""
+
+from __future__ import annotations
+
+import datetime as dt
+import hashlib
+import json
+import urllib.parse
+from typing import Any, cast
+
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+def get_cache_key(url: str, params: dict[str, Any]) -> str:
+    """Get the canonical key of a request to the Linkup API.
+
+    Semantically identical requests get the same key, even if their parameters are written
+    differently: domain lists are deduplicated and sorted, dates are normalized to the ISO format,
+    fetched URLs are canonicalized, and structured output schemas are replaced by their hash.
+
+    Args:
+        url: The URL of the endpoint, e.g. "/search".
+        params: The JSON parameters of the request.
+
+    Returns:
+        The canonical key of the request.
+    """
+    canonical_params = dict(params)
+    for name in ("includeDomains", "excludeDomains"):
+        domains = canonical_params.get(name)
+        if isinstance(domains, list):
+            canonical_params[name] = sorted(
+                {domain.strip().lower().rstrip(".") for domain in cast("list[str]", domains)}
+            )
+    for name in ("fromDate", "toDate"):
+        date = canonical_params.get(name)
+        if isinstance(date, str):
+            canonical_params[name] = _get_canonical_date(date)
+    schema = canonical_params.get("structuredOutputSchema")
+    if isinstance(schema, str):
+        canonical_params["structuredOutputSchema"] = hashlib.blake2b(
+            schema.encode(), digest_size=16
+        ).hexdigest()
+    fetched_url = canonical_params.get("url")
+    if isinstance(fetched_url, str):
+        canonical_params["url"] = _get_canonical_url(fetched_url)
+    return f"{url} {json.dumps(canonical_params, sort_keys=True, separators=(',', ':'))}"
+
+
+def _get_canonical_date(date: str) -> str:
+    try:
+        return dt.date.fromisoformat(date.strip()).isoformat()
+    except ValueError:
+        return date
+
+
+def _get_canonical_url(url: str) -> str:
+    # e.g. "HTTPS://Example.com:443/Path/?q=1#section" -> "https://example.com/Path?q=1"
+    parts = urllib.parse.urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    userinfo, _, host = parts.netloc.rpartition("@")
+    host = host.lower()
+    default_port = _DEFAULT_PORTS.get(scheme)
+    if default_port is not None and host.endswith(f":{default_port}"):
+        host = host[: -len(default_port) - 1]
+    netloc = f"{userinfo}@{host}" if userinfo else host
+    return urllib.parse.urlunsplit((scheme, netloc, parts.path.rstrip("/"), parts.query, ""))
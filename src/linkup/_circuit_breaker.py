@@ -0,0 +1,240 @@
+"""Circuit breaker for requests to the Linkup API."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Literal
+
+import httpx
+
+from ._errors import LinkupCircuitOpenError, LinkupTimeoutError
+from ._types import LinkupCircuitStateChange
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class _LinkupCircuit:
+    def __init__(self) -> None:
+        self.state: Literal["closed", "open", "half_open"] = "closed"
+        self.failures: int = 0
+        self.opened_at: float = 0.0
+        self.trials: int = 0
+        self.trial_started_at: float = 0.0
+
+
+class LinkupCircuitBreaker:
+    """Circuit breaker to fail fast when an endpoint of the Linkup API is failing.
+
+    A circuit is tracked for each endpoint. It starts closed, letting requests through, and opens
+    after failure_threshold consecutive failed requests. While open, requests fail immediately with
+    a LinkupCircuitOpenError, without being sent. After recovery_timeout, the circuit becomes
+    half-open and lets half_open_max_calls trial requests through: it closes again when a trial
+    request succeeds, and opens again when one fails.
+
+    Requests failing with errors which don't indicate an unavailable Linkup API (e.g. a
+    LinkupNoResultError) are not considered as failed.
+
+    A circuit breaker can be shared between threads using synchronous calls, coroutines using
+    asynchronous calls, and several clients.
+
+    Args:
+        failure_threshold: The number of consecutive failed requests opening the circuit.
+        recovery_timeout: The duration the circuit stays open before letting trial requests
+            through, in seconds.
+        half_open_max_calls: The number of concurrent trial requests let through when the circuit
+            is half-open.
+        failure_on: The errors which count as failures. Errors are matched with isinstance, so the
+            Linkup errors (e.g. LinkupTimeoutError) or httpx errors (e.g. httpx.TransportError) can
+            be used.
+        failure_status_codes: The HTTP status codes which count as failures, whatever the error
+            they are raised as.
+        on_state_change: An optional listener called with a LinkupCircuitStateChange each time the
+            state of a circuit changes. Other listeners can be added with add_listener. Exceptions
+            raised by listeners are logged and ignored.
+
+    Raises:
+        ValueError: If failure_threshold or half_open_max_calls is lower than 1.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        failure_on: tuple[type[Exception], ...] = (LinkupTimeoutError, httpx.TransportError),
+        failure_status_codes: tuple[int, ...] = (500, 502, 503, 504),
+        on_state_change: Callable[[LinkupCircuitStateChange], None] | None = None,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be at least 1")
+
+        self.failure_threshold: int = failure_threshold
+        self.recovery_timeout: float = recovery_timeout
+        self.half_open_max_calls: int = half_open_max_calls
+        self.failure_on: tuple[type[Exception], ...] = failure_on
+        self.failure_status_codes: tuple[int, ...] = failure_status_codes
+
+        self._lock = threading.Lock()
+        self._circuits: dict[str, _LinkupCircuit] = {}
+        self._listeners: list[Callable[[LinkupCircuitStateChange], None]] = []
+        if on_state_change is not None:
+            self._listeners.append(on_state_change)
+
+    def add_listener(self, listener: Callable[[LinkupCircuitStateChange], None]) -> None:
+        """Add a listener called with a LinkupCircuitStateChange each time a circuit changes state.
+
+        Args:
+            listener: The listener to add.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[LinkupCircuitStateChange], None]) -> None:
+        """Remove a listener added with add_listener or on_state_change.
+
+        Args:
+            listener: The listener to remove.
+
+        Raises:
+            ValueError: If the listener was not added.
+        """
+        with self._lock:
+            self._listeners.remove(listener)
+
+    def get_state(self, endpoint: str) -> Literal["closed", "open", "half_open"]:
+        """Get the current state of the circuit of an endpoint.
+
+        Args:
+            endpoint: The endpoint, e.g. "/search".
+
+        Returns:
+            The state of the circuit: "closed", "open" or "half_open".
+        """
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None:
+                return "closed"
+            if circuit.state == "open" and self._is_recovered(circuit):
+                return "half_open"
+            return circuit.state
+
+    def before_request(self, endpoint: str) -> None:
+        """Check that a request to an endpoint can be sent.
+
+        Args:
+            endpoint: The endpoint of the request, e.g. "/search".
+
+        Raises:
+            LinkupCircuitOpenError: If the circuit of the endpoint is open, or half-open with
+                enough trial requests in flight.
+        """
+        event = None
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint, _LinkupCircuit())
+            now = time.monotonic()
+            if circuit.state == "open":
+                if not self._is_recovered(circuit):
+                    remaining = circuit.opened_at + self.recovery_timeout - now
+                    raise LinkupCircuitOpenError(
+                        f"The circuit breaker is open for {endpoint}, after too many consecutive "
+                        f"failures. Retry in {remaining:.1f}s."
+                    )
+                event = self._transition(endpoint, circuit, "half_open")
+            if circuit.state == "half_open":
+                if circuit.trials >= self.half_open_max_calls:
+                    # Trials which never reported their result (e.g. cancelled) expire
+                    if now - circuit.trial_started_at < self.recovery_timeout:
+                        raise LinkupCircuitOpenError(
+                            f"The circuit breaker is half-open for {endpoint}, waiting for the "
+                            "result of trial requests."
+                        )
+                    circuit.trials = 0
+                circuit.trials += 1
+                circuit.trial_started_at = now
+        self._publish(event)
+
+    def record_success(self, endpoint: str) -> None:
+        """Record the success of a request to an endpoint.
+
+        Args:
+            endpoint: The endpoint of the request, e.g. "/search".
+        """
+        event = None
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint, _LinkupCircuit())
+            circuit.failures = 0
+            if circuit.state == "half_open":
+                event = self._transition(endpoint, circuit, "closed")
+        self._publish(event)
+
+    def record_failure(
+        self, endpoint: str, error: Exception, response: httpx.Response | None
+    ) -> None:
+        """Record the failure of a request to an endpoint.
+
+        If the error doesn't count as a failure, the request is recorded as a success.
+
+        Args:
+            endpoint: The endpoint of the request, e.g. "/search".
+            error: The error raised by the request.
+            response: The response of the request, if any.
+        """
+        if not isinstance(error, self.failure_on) and (
+            response is None or response.status_code not in self.failure_status_codes
+        ):
+            self.record_success(endpoint)
+            return
+
+        event = None
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint, _LinkupCircuit())
+            circuit.failures += 1
+            if circuit.state == "half_open" or (
+                circuit.state == "closed" and circuit.failures >= self.failure_threshold
+            ):
+                circuit.opened_at = time.monotonic()
+                event = self._transition(endpoint, circuit, "open")
+        self._publish(event)
+
+    def _is_recovered(self, circuit: _LinkupCircuit) -> bool:
+        return time.monotonic() - circuit.opened_at >= self.recovery_timeout
+
+    def _transition(
+        self,
+        endpoint: str,
+        circuit: _LinkupCircuit,
+        state: Literal["closed", "open", "half_open"],
+    ) -> LinkupCircuitStateChange:
+        event = LinkupCircuitStateChange(
+            endpoint=endpoint, previous_state=circuit.state, state=state, timestamp=time.time()
+        )
+        circuit.state = state
+        circuit.trials = 0
+        if state == "closed":
+            circuit.failures = 0
+        return event
+
+    def _publish(self, event: LinkupCircuitStateChange | None) -> None:
+        if event is None:
+            return
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            _notify(listener, event)
+
+
+def _notify(
+    listener: Callable[[LinkupCircuitStateChange], None], event: LinkupCircuitStateChange
+) -> None:
+    # A failing listener must neither replace the error of the request nor skip the other listeners
+    try:
+        listener(event)
+    except Exception:
+        logger.exception("Circuit breaker listener %r failed", listener)
@@ -2,13 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import collections
+import concurrent.futures
+import contextlib
+import contextvars
+import copy
+import functools
+import importlib.util
 import json
 import os
-from typing import TYPE_CHECKING, Any, Literal, cast, overload
+import threading
+import time
+import uuid
+import weakref
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast, overload
 
+import httpcore
 import httpx
 import pydantic
 
+from ._cache import LinkupMemoryCache, LinkupParsedResponses, LinkupTieredCache
+from ._cache_key import get_cache_key
 from ._errors import (
     LinkupAuthenticationError,
     LinkupBudgetLimitExceededError,
@@ -29,11 +44,14 @@ from ._errors import (
     LinkupUnknownError,
     LinkupUnsupportedTaskTypeError,
 )
+from ._polling import LinkupPollingPolicy
 from ._types import (
     JSONObject,
+    LinkupCoalescingStats,
     LinkupFetchResponse,
     LinkupFetchTask,
     LinkupFetchTaskInput,
+    LinkupPoolStats,
     LinkupResearchTask,
     LinkupResearchTaskInput,
     LinkupResearchTasksPage,
@@ -45,18 +63,32 @@ from ._types import (
     LinkupTask,
     LinkupTaskInput,
     LinkupTasksPage,
+    LinkupX402PaymentStats,
 )
 from ._version import __version__
 
 if TYPE_CHECKING:
     import datetime
-
+    from collections.abc import Awaitable, Callable, Generator
+    from types import TracebackType
+
+    from ._cache import LinkupCacheBackend, LinkupNegativeCache, LinkupStalePolicy
+    from ._circuit_breaker import LinkupCircuitBreaker
+    from ._concurrency import LinkupAdaptiveConcurrencyLimiter
+    from ._hedging import LinkupHedgingPolicy
+    from ._rate_limit import LinkupRateLimiter
+    from ._retry import LinkupRetryPolicy
     from .x402 import LinkupX402Signer
 
 
 class LinkupClient:
     """The Linkup Client class, providing functions to call the Linkup API endpoints using Python.
 
+    The client keeps long-lived HTTP connection pools, one for synchronous calls and one for
+    asynchronous calls, so that consecutive requests reuse open keep-alive connections. Use it as a
+    context manager, or call close (and aclose when using asynchronous calls) once done, to release
+    these connections.
+
     Args:
         api_key: The API key for the Linkup API. If None, the API key will be read from the
             environment variable LINKUP_API_KEY.
@@ -67,10 +99,79 @@ class LinkupClient:
         auth_header: Custom header name to use for the API key (e.g. "Ocp-Apim-Subscription-Key").
             When set, the API key value is sent as <auth_header>: <api_key> instead of the default
             Authorization: Bearer <api_key>.
+        x402_preemptive_payment: Whether to cache the x402 payment requirements of each endpoint,
+            by the request parameters the price depends on (e.g. the search depth), so that later
+            similar requests are sent with a freshly signed payment instead of going through the
+            402 round trip. The 402 round trip is still used when the payment requirements change.
+            Ignored without x402_signer.
+        x402_signing_workers: The number of threads of a dedicated pool used to sign x402 payments
+            of asynchronous calls, with the synchronous method of x402_signer, so that signing
+            doesn't block the event loop. If None, payments are signed on the event loop with the
+            asynchronous method of x402_signer.
+        http2: Whether to use HTTP/2 connections when the Linkup API supports it, so that
+            concurrent requests are multiplexed over a few connections instead of needing one
+            connection each. Requires the http2 optional dependencies. Ignored for user-provided
+            HTTP clients and transports.
+        limits: Optional limits of the connection pools created by the client, e.g. to keep more
+            idle connections open than the 20 kept by default. Ignored for user-provided HTTP
+            clients and transports.
+        http_client: An optional httpx.Client to use for synchronous calls, e.g. to share a
+            connection pool or to configure proxies, limits or event hooks. It is not closed by
+            the Linkup client, and its base URL is not used.
+        async_http_client: An optional httpx.AsyncClient to use for asynchronous calls. It is not
+            closed by the Linkup client, and its base URL is not used.
+        transport: An optional httpx transport to use for the connection pool of synchronous
+            calls, e.g. an httpx.MockTransport. Cannot be used together with http_client.
+        async_transport: An optional httpx async transport to use for the connection pool of
+            asynchronous calls. Cannot be used together with async_http_client.
+        retry_policy: An optional policy to automatically retry failed requests, with exponential
+            backoff. If None, failed requests are not retried.
+        rate_limits: Optional client-side rate limiters, by endpoint ("/search", "/fetch",
+            "/tasks" or "/research"). Requests to a rate-limited endpoint wait locally until the
+            rate limiter allows them. The same rate limiter can be used for several endpoints to
+            limit them together.
+        adaptive_concurrency: An optional adaptive limiter of the number of concurrent
+            asynchronous requests, which raises the limit while requests succeed and cuts it when
+            they are rate limited or time out. Synchronous calls are not limited.
+        circuit_breaker: An optional circuit breaker, making requests to an endpoint fail fast with
+            a LinkupCircuitOpenError after too many consecutive failures, until the endpoint
+            recovers.
+        hedging_policy: An optional policy to send hedged requests for fast searches: when a
+            search hasn't answered after the hedging delay, a duplicate request is sent and the
+            first successful response is used.
+        search_cache: An optional cache of search responses, so that repeated searches with the
+            same parameters are answered without calling the Linkup API.
+        fetch_cache: An optional cache of fetch responses, so that fetching the same web page with
+            the same parameters is answered without calling the Linkup API. A persistent cache
+            (e.g. a LinkupSQLiteCache) can be shared across processes.
+        parsed_responses_max_bytes: The maximum total size of the response bodies whose parsed
+            responses are kept in memory, in bytes, on top of the search, fetch and task caches, so
+            that cache hits and completed tasks retrieved again aren't parsed again. 0 disables it.
+        coalesce_requests: Whether identical searches and fetches made concurrently share a single
+            request to the Linkup API, all receiving its response or error. Calls are identical when
+            their method, URL and parameters are; the shared request uses the timeout and the
+            deadline of the first call.
+        task_cache: An optional cache of completed and failed tasks, which don't change anymore, so
+            that retrieving them again is answered without calling the Linkup API, and listing them
+            again reuses the cached tasks. Tasks found in list pages are cached too.
+        stale_policies: Optional policies to serve expired responses of the search cache, while
+            refreshing them in the background or when the request fails. The first policy applying
+            to the depth and output type of a search is used. They require the search cache to be a
+            LinkupMemoryCache, or a LinkupTieredCache whose first tier is a LinkupMemoryCache.
+        negative_cache: An optional cache of the deterministic errors of searches and fetches (e.g.
+            LinkupNoResultError or LinkupFailedFetchError), so that repeating a call which failed
+            raises the same error without calling the Linkup API, until the error expires.
+        polling_policy: An optional policy for the delays between the polls of wait_for_task and
+            wait_for_tasks. If None, a default LinkupPollingPolicy is used.
 
     Raises:
         ValueError: If the API key is not provided and not found in the environment variable.
         ValueError: If both api_key and x402_signer are provided.
+        ValueError: If both an HTTP client and a transport are provided for the same kind of calls.
+        ValueError: If x402_signing_workers is lower than 1.
+        ValueError: If parsed_responses_max_bytes is negative.
+        ValueError: If stale_policies are provided with a search cache not supporting stale lookups.
+        ImportError: If http2 is True and the http2 optional dependencies are not installed.
     """
 
     __version__ = __version__
@@ -81,11 +182,66 @@ class LinkupClient:
         base_url: str = "https://api.linkup.so/v1",
         x402_signer: LinkupX402Signer | None = None,
         auth_header: str | None = None,
+        x402_preemptive_payment: bool = False,
+        x402_signing_workers: int | None = None,
+        http2: bool = False,
+        limits: httpx.Limits | None = None,
+        http_client: httpx.Client | None = None,
+        async_http_client: httpx.AsyncClient | None = None,
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
+        retry_policy: LinkupRetryPolicy | None = None,
+        rate_limits: dict[str, LinkupRateLimiter] | None = None,
+        adaptive_concurrency: LinkupAdaptiveConcurrencyLimiter | None = None,
+        circuit_breaker: LinkupCircuitBreaker | None = None,
+        hedging_policy: LinkupHedgingPolicy | None = None,
+        search_cache: LinkupCacheBackend | None = None,
+        fetch_cache: LinkupCacheBackend | None = None,
+        parsed_responses_max_bytes: int = 32 * 1024 * 1024,
+        coalesce_requests: bool = False,
+        task_cache: LinkupCacheBackend | None = None,
+        stale_policies: list[LinkupStalePolicy] | None = None,
+        negative_cache: LinkupNegativeCache | None = None,
+        polling_policy: LinkupPollingPolicy | None = None,
     ) -> None:
         if api_key is not None and x402_signer is not None:
             raise ValueError("Cannot provide both api_key and x402_signer")
+        if http_client is not None and transport is not None:
+            raise ValueError("Cannot provide both http_client and transport")
+        if async_http_client is not None and async_transport is not None:
+            raise ValueError("Cannot provide both async_http_client and async_transport")
+        if x402_signing_workers is not None and x402_signing_workers < 1:
+            raise ValueError("x402_signing_workers must be at least 1")
+        if parsed_responses_max_bytes < 0:
+            raise ValueError("parsed_responses_max_bytes must not be negative")
+        if stale_policies and not (
+            isinstance(search_cache, LinkupMemoryCache)
+            or (
+                isinstance(search_cache, LinkupTieredCache)
+                and isinstance(search_cache.l1, LinkupMemoryCache)
+            )
+        ):
+            raise ValueError(
+                "stale_policies require search_cache to be a LinkupMemoryCache, or a "
+                "LinkupTieredCache whose first tier is a LinkupMemoryCache"
+            )
+        if http2 and importlib.util.find_spec("h2") is None:
+            raise ImportError(
+                "The http2 optional dependencies are required to use HTTP/2. "
+                "Install them with: pip install 'linkup-sdk[http2]'"
+            )
 
         self._x402_signer: LinkupX402Signer | None = x402_signer
+        self._x402_preemptive_payment: bool = x402_preemptive_payment
+        self._x402_lock = threading.Lock()
+        # Payment requirements by method, endpoint and price parameters of the requests
+        self._x402_requirements: dict[
+            tuple[str, str, tuple[object, ...]], tuple[dict[str, str], bytes]
+        ] = {}
+        self._x402_hits: int = 0
+        self._x402_misses: int = 0
+        self._x402_signing_workers: int | None = x402_signing_workers
+        self._x402_signing_executor: concurrent.futures.ThreadPoolExecutor | None = None
 
         if x402_signer is not None:
             self._api_key: pydantic.SecretStr | None = None
@@ -100,6 +256,325 @@ class LinkupClient:
 
         self._base_url: str = base_url
         self._auth_header: str | None = auth_header
+        self._http2: bool = http2
+        self._limits: httpx.Limits = limits or httpx.Limits(
+            max_connections=100, max_keepalive_connections=20
+        )
+        self._retry_policy: LinkupRetryPolicy | None = retry_policy
+        self._rate_limits: dict[str, LinkupRateLimiter] = dict(rate_limits or {})
+        self._adaptive_concurrency: LinkupAdaptiveConcurrencyLimiter | None = adaptive_concurrency
+        self._circuit_breaker: LinkupCircuitBreaker | None = circuit_breaker
+        self._hedging_policy: LinkupHedgingPolicy | None = hedging_policy
+        self._hedging_executor: concurrent.futures.ThreadPoolExecutor | None = None
+        # Idle threads of the hedging pool, kept across pools when the client is closed
+        self._hedging_slots = threading.BoundedSemaphore(
+            hedging_policy.max_workers if hedging_policy is not None else 1
+        )
+        self._search_cache: LinkupCacheBackend | None = search_cache
+        self._fetch_cache: LinkupCacheBackend | None = fetch_cache
+        self._coalesce_requests: bool = coalesce_requests
+        self._coalescing_lock = threading.Lock()
+        self._in_flight: dict[str, concurrent.futures.Future[httpx.Response]] = {}
+        self._async_in_flight: dict[
+            tuple[asyncio.AbstractEventLoop, str], asyncio.Task[httpx.Response]
+        ] = {}
+        self._coalescing_calls: int = 0
+        self._coalesced_calls: int = 0
+        self._task_cache: LinkupCacheBackend | None = task_cache
+        self._stale_policies: list[LinkupStalePolicy] = list(stale_policies or [])
+        self._revalidation_lock = threading.Lock()
+        self._revalidating: set[str] = set()
+        self._revalidation_executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self._revalidation_tasks: set[asyncio.Task[None]] = set()
+        self._negative_cache: LinkupNegativeCache | None = negative_cache
+        self._parsed_responses = LinkupParsedResponses(max_bytes=parsed_responses_max_bytes)
+        self._polling_policy: LinkupPollingPolicy = polling_policy or LinkupPollingPolicy()
+
+        self._transport: httpx.BaseTransport | None = transport
+        self._async_transport: httpx.AsyncBaseTransport | None = async_transport
+
+        self._client_lock = threading.Lock()
+        self._owns_client: bool = http_client is None
+        self._client: httpx.Client | None = http_client
+        self._owns_async_client: bool = async_http_client is None
+        self._async_client: httpx.AsyncClient | None = async_http_client
+        # Connections of an async pool are bound to the event loop which opened them, so the client
+        # creates a pool per event loop, e.g. for several asyncio.run calls or threads
+        self._async_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = weakref.WeakKeyDictionary()
+
+        self._created_tasks_lock = threading.Lock()
+        # Payload and created tasks by idempotency key
+        self._created_tasks: collections.OrderedDict[
+            str, tuple[list[dict[str, Any]], list[LinkupTask]]
+        ] = collections.OrderedDict()
+        # Payload and completion of the calls creating tasks, by idempotency key
+        self._creating_tasks: dict[
+            str, tuple[list[dict[str, Any]], concurrent.futures.Future[None]]
+        ] = {}
+
+        self._stats_lock = threading.Lock()
+        self._requests_in_flight: int = 0
+        self._max_requests_in_flight: int = 0
+
+    def __enter__(self) -> LinkupClient:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    async def __aenter__(self) -> LinkupClient:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    def close(self) -> None:
+        """Close the connection pool used by synchronous calls.
+
+        The client can still be used afterwards, in which case a new connection pool is opened.
+        User-provided HTTP clients are left open.
+        """
+        with self._client_lock:
+            executors = (
+                self._hedging_executor,
+                self._x402_signing_executor,
+                self._revalidation_executor,
+            )
+            self._hedging_executor = self._x402_signing_executor = None
+            self._revalidation_executor = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=False)
+        if not self._owns_client:
+            return
+        with self._client_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        """Asynchronously close the connection pools used by synchronous and asynchronous calls.
+
+        For asynchronous calls, the connection pool of the running event loop is closed: the pools
+        opened from other event loops are bound to them, and are dropped with them. The client can
+        still be used afterwards, in which case new connection pools are opened.
+        User-provided HTTP clients are left open.
+        """
+        if self._owns_async_client:
+            with self._client_lock:
+                async_client = self._async_clients.pop(asyncio.get_running_loop(), None)
+            if async_client is not None:
+                await async_client.aclose()
+        self.close()
+
+    def warmup(self, n_connections: int = 1, timeout: float | None = None) -> None:
+        """Open connections to the Linkup API ahead of the synchronous calls.
+
+        The connections are opened concurrently and kept in the connection pool of synchronous
+        calls, so that the next calls don't pay for the connection setup. Idle connections are kept
+        open according to the keep-alive limits of the connection pool: for the pools created by
+        the client, at most limits.max_keepalive_connections connections (20 by default) are
+        opened, and user-provided HTTP clients are capped by the limits of their connection pool.
+        With other transports, whose limits are unknown, the connections which would wait for a
+        free slot of the pool for more than 0.1 seconds are not opened. With HTTP/2, fewer
+        connections may be opened since requests are multiplexed.
+
+        Args:
+            n_connections: The number of connections to open.
+            timeout: The timeout for opening each connection, in seconds. If None, there will be
+                no timeout.
+
+        Raises:
+            LinkupTimeoutError: If opening a connection times out.
+        """
+        client = self._get_client()
+        n_connections = self._get_warmup_connections(
+            n_connections, http_client=client, owned=self._owns_client
+        )
+        request_kwargs = self._get_warmup_request_kwargs(timeout=timeout, owned=self._owns_client)
+        try:
+            # A response releases its connection to the pool once read, which would let the next
+            # request reuse it instead of opening a new one: responses are only read once all of
+            # them are received, each on its own connection, so that the connections are released
+            # together and kept alive
+            with contextlib.ExitStack() as stack:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=n_connections) as executor:
+
+                    def open_connection(_: int) -> httpx.Response | None:
+                        try:
+                            return stack.enter_context(client.stream(**request_kwargs))
+                        except httpx.PoolTimeout:
+                            return None
+
+                    responses = list(executor.map(open_connection, range(n_connections)))
+                for response in responses:
+                    if response is not None:
+                        response.read()
+        except httpx.TimeoutException as e:
+            raise LinkupTimeoutError(
+                "The request to the Linkup API timed out. Try increasing the timeout value."
+            ) from e
+
+    async def async_warmup(self, n_connections: int = 1, timeout: float | None = None) -> None:
+        """Asynchronously open connections to the Linkup API ahead of the asynchronous calls.
+
+        The connections are opened concurrently and kept in the connection pool of asynchronous
+        calls, so that the next calls don't pay for the connection setup. Idle connections are kept
+        open according to the keep-alive limits of the connection pool: for the pools created by
+        the client, at most limits.max_keepalive_connections connections (20 by default) are
+        opened, and user-provided HTTP clients are capped by the limits of their connection pool.
+        With other transports, whose limits are unknown, the connections which would wait for a
+        free slot of the pool for more than 0.1 seconds are not opened. With HTTP/2, fewer
+        connections may be opened since requests are multiplexed.
+
+        Args:
+            n_connections: The number of connections to open.
+            timeout: The timeout for opening each connection, in seconds. If None, there will be
+                no timeout.
+
+        Raises:
+            LinkupTimeoutError: If opening a connection times out.
+        """
+        client = self._get_async_client()
+        n_connections = self._get_warmup_connections(
+            n_connections, http_client=client, owned=self._owns_async_client
+        )
+        request_kwargs = self._get_warmup_request_kwargs(
+            timeout=timeout, owned=self._owns_async_client
+        )
+        # A response releases its connection to the pool once read, which would let the next
+        # request reuse it instead of opening a new one: responses are only read once all of them
+        # are received, each on its own connection, so that the connections are released together
+        # and kept alive
+        async with contextlib.AsyncExitStack() as stack:
+            results = await asyncio.gather(
+                *(
+                    stack.enter_async_context(client.stream(**request_kwargs))
+                    for _ in range(n_connections)
+                ),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, httpx.Response):
+                    await result.aread()
+        for result in results:
+            if isinstance(result, httpx.PoolTimeout):
+                continue
+            if isinstance(result, httpx.TimeoutException):
+                raise LinkupTimeoutError(
+                    "The request to the Linkup API timed out. Try increasing the timeout value."
+                ) from result
+            if isinstance(result, BaseException):
+                raise result
+
+    @contextlib.contextmanager
+    def deadline(self, seconds: float) -> Generator[None]:
+        """Set a total time budget for the calls made within the context.
+
+        The budget is shared by all the requests of the calls, including retries, x402 payment
+        requests, hedge requests, and the waits for retries, rate limiters and adaptive concurrency
+        slots: no request is sent once the budget is spent, and a request which would wait for a
+        rate limiter past the deadline fails immediately.
+
+        Asynchronous requests are cancelled when the budget is spent. Synchronous requests can't be
+        interrupted: their timeout is capped to the remaining budget, but httpx applies it to each
+        read of the response, so a slowly received response can outlast the budget, in which case
+        it is discarded and the call fails once it is received.
+
+        The budget applies to synchronous and asynchronous calls, including those of the asyncio
+        tasks created within the context, which inherit its context. Nested deadlines can only
+        shorten the budget.
+
+        Args:
+            seconds: The total time budget, in seconds.
+
+        Yields:
+            Nothing, the calls made within the context are subject to the deadline.
+
+        Raises:
+            LinkupTimeoutError: From the calls made within the context, if the budget is spent.
+        """
+        deadline = time.monotonic() + seconds
+        current_deadline = _deadline.get()
+        if current_deadline is not None:
+            deadline = min(deadline, current_deadline)
+        token = _deadline.set(deadline)
+        try:
+            yield
+        finally:
+            _deadline.reset(token)
+
+    def pool_stats(self) -> LinkupPoolStats:
+        """Get statistics about the connection pools used by synchronous and asynchronous calls.
+
+        Connection statistics are read from the internals of the default httpx transport, and are
+        not available (zero) with other transports.
+
+        Returns:
+            The connection pools statistics.
+        """
+        with self._client_lock:
+            http_clients = [self._client, self._async_client, *self._async_clients.values()]
+        pool_infos = [
+            pool_info
+            for http_client in http_clients
+            if (pool_info := _get_connection_pool_info(http_client)) is not None
+        ]
+        active_http2_connections = sum(info.active_http2_connections for info in pool_infos)
+        http2_streams = sum(info.http2_streams for info in pool_infos)
+        with self._stats_lock:
+            requests_in_flight = self._requests_in_flight
+            max_requests_in_flight = self._max_requests_in_flight
+
+        return LinkupPoolStats(
+            http2=self._http2,
+            connections=sum(info.connections for info in pool_infos),
+            http2_connections=sum(info.http2_connections for info in pool_infos),
+            idle_connections=sum(info.idle_connections for info in pool_infos),
+            requests_in_flight=requests_in_flight,
+            max_requests_in_flight=max_requests_in_flight,
+            streams_per_connection=(
+                http2_streams / active_http2_connections if active_http2_connections else 0.0
+            ),
+        )
+
+    def x402_payment_stats(self) -> LinkupX402PaymentStats:
+        """Get statistics about the pre-emptive x402 payments sent by the client.
+
+        Returns:
+            The pre-emptive x402 payments statistics.
+        """
+        with self._x402_lock:
+            return LinkupX402PaymentStats(
+                hits=self._x402_hits,
+                misses=self._x402_misses,
+                cached_endpoints=len(self._x402_requirements),
+            )
+
+    def coalescing_stats(self) -> LinkupCoalescingStats:
+        """Get statistics about the coalescing of identical concurrent requests by the client.
+
+        Returns:
+            The request coalescing statistics.
+        """
+        with self._coalescing_lock:
+            return LinkupCoalescingStats(
+                calls=self._coalescing_calls,
+                coalesced_calls=self._coalesced_calls,
+                in_flight=len(self._in_flight) + len(self._async_in_flight),
+            )
 
     @overload
     def search(
@@ -284,19 +759,61 @@ class LinkupClient:
             include_inline_citations=include_inline_citations,
             include_sources=include_sources,
         )
+        if self._search_cache is None and self._negative_cache is None:
+            # Without caches, computing the cache key and looking for a stale policy is wasted work
+            return self._search_and_cache(
+                None,
+                params=params,
+                output_type=output_type,
+                include_sources=include_sources,
+                timeout=timeout,
+            )
 
-        response: httpx.Response = self._request(
-            method="POST",
-            url="/search",
-            json=params,
-            timeout=timeout,
+        cache_key = get_cache_key(url="/search", params=params)
+        stale_policy = self._get_stale_policy(depth=depth, output_type=output_type)
+        cached_content, staleness = self._get_cached_search_content(cache_key, stale_policy)
+        cached_response = (
+            None
+            if cached_content is None
+            else self._parse_cached_content(
+                cache_key,
+                cached_content,
+                parse=functools.partial(
+                    self._parse_search_response,
+                    output_type=output_type,
+                    include_sources=include_sources,
+                ),
+            )
         )
+        if cached_response is not None:
+            if stale_policy is None or staleness == 0:
+                return cached_response
+            if stale_policy.can_serve_while_revalidating(staleness):
+                self._revalidate_search(
+                    cache_key,
+                    params=params,
+                    output_type=output_type,
+                    include_sources=include_sources,
+                    timeout=timeout,
+                )
+                return cached_response
 
-        return self._parse_search_response(
-            response_data=response.json(),
-            output_type=output_type,
-            include_sources=include_sources,
-        )
+        try:
+            return self._search_and_cache(
+                cache_key,
+                params=params,
+                output_type=output_type,
+                include_sources=include_sources,
+                timeout=timeout,
+            )
+        except Exception as e:
+            if (
+                cached_response is not None
+                and stale_policy is not None
+                and stale_policy.can_serve_on_error(staleness, error=e)
+            ):
+                return cached_response
+            raise
 
     @overload
     async def async_search(
@@ -481,19 +998,63 @@ class LinkupClient:
             include_inline_citations=include_inline_citations,
             include_sources=include_sources,
         )
+        if self._search_cache is None and self._negative_cache is None:
+            # Without caches, computing the cache key and looking for a stale policy is wasted work
+            return await self._async_search_and_cache(
+                None,
+                params=params,
+                output_type=output_type,
+                include_sources=include_sources,
+                timeout=timeout,
+            )
 
-        response: httpx.Response = await self._async_request(
-            method="POST",
-            url="/search",
-            json=params,
-            timeout=timeout,
+        cache_key = get_cache_key(url="/search", params=params)
+        stale_policy = self._get_stale_policy(depth=depth, output_type=output_type)
+        cached_content, staleness = await self._async_get_cached_search_content(
+            cache_key, stale_policy
         )
-
-        return self._parse_search_response(
-            response_data=response.json(),
-            output_type=output_type,
-            include_sources=include_sources,
+        cached_response = (
+            None
+            if cached_content is None
+            else self._parse_cached_content(
+                cache_key,
+                cached_content,
+                parse=functools.partial(
+                    self._parse_search_response,
+                    output_type=output_type,
+                    include_sources=include_sources,
+                ),
+            )
         )
+        if cached_response is not None:
+            if stale_policy is None or staleness == 0:
+                return cached_response
+            if stale_policy.can_serve_while_revalidating(staleness):
+                self._async_revalidate_search(
+                    cache_key,
+                    params=params,
+                    output_type=output_type,
+                    include_sources=include_sources,
+                    timeout=timeout,
+                )
+                return cached_response
+
+        try:
+            return await self._async_search_and_cache(
+                cache_key,
+                params=params,
+                output_type=output_type,
+                include_sources=include_sources,
+                timeout=timeout,
+            )
+        except Exception as e:
+            if (
+                cached_response is not None
+                and stale_policy is not None
+                and stale_policy.can_serve_on_error(staleness, error=e)
+            ):
+                return cached_response
+            raise
 
     def research(
         self,
@@ -681,7 +1242,10 @@ class LinkupClient:
             timeout=timeout,
         )
 
-        return self._parse_research_tasks_page(response.json())
+        cached_tasks: dict[str, bytes] = {}
+        tasks_page = self._parse_research_tasks_page(response.json(), cached_tasks=cached_tasks)
+        self._cache_tasks(cached_tasks)
+        return tasks_page
 
     async def async_list_research(
         self,
@@ -723,7 +1287,10 @@ class LinkupClient:
             timeout=timeout,
         )
 
-        return self._parse_research_tasks_page(response.json())
+        cached_tasks: dict[str, bytes] = {}
+        tasks_page = self._parse_research_tasks_page(response.json(), cached_tasks=cached_tasks)
+        await self._async_cache_tasks(cached_tasks)
+        return tasks_page
 
     def get_research(self, research_id: str, timeout: float | None = None) -> LinkupResearchTask:
         """Retrieve a single research task by identifier.
@@ -741,13 +1308,30 @@ class LinkupClient:
             LinkupAuthenticationError: If the Linkup API key is invalid.
             LinkupTimeoutError: If the request times out.
         """
+        url = f"/research/{research_id}"
+        if self._task_cache is not None:
+            # Completed and failed tasks don't change, so their parsed tasks can always be reused
+            cached_research_task = self._parsed_responses.get(url)
+            if cached_research_task is None:
+                cached_content = self._task_cache.get(url)
+                if cached_content is not None:
+                    cached_research_task = self._parse_cached_content(
+                        url, cached_content, parse=self._parse_research_task
+                    )
+            if cached_research_task is not None:
+                return cached_research_task
+
         response = self._request(
             method="GET",
-            url=f"/research/{research_id}",
+            url=url,
             timeout=timeout,
         )
 
-        return self._parse_research_task(response.json())
+        research_task = self._parse_research_task(response.json())
+        if self._task_cache is not None and research_task.status in _TERMINAL_STATUSES:
+            self._task_cache.set(url, response.content)
+            self._parsed_responses.set(url, response.content, research_task)
+        return research_task
 
     async def async_get_research(
         self, research_id: str, timeout: float | None = None
@@ -767,16 +1351,36 @@ class LinkupClient:
             LinkupAuthenticationError: If the Linkup API key is invalid.
             LinkupTimeoutError: If the request times out.
         """
+        url = f"/research/{research_id}"
+        if self._task_cache is not None:
+            # Completed and failed tasks don't change, so their parsed tasks can always be reused
+            cached_research_task = self._parsed_responses.get(url)
+            if cached_research_task is None:
+                cached_content = await self._task_cache.async_get(url)
+                if cached_content is not None:
+                    cached_research_task = self._parse_cached_content(
+                        url, cached_content, parse=self._parse_research_task
+                    )
+            if cached_research_task is not None:
+                return cached_research_task
+
         response = await self._async_request(
             method="GET",
-            url=f"/research/{research_id}",
+            url=url,
             timeout=timeout,
         )
 
-        return self._parse_research_task(response.json())
+        research_task = self._parse_research_task(response.json())
+        if self._task_cache is not None and research_task.status in _TERMINAL_STATUSES:
+            await self._task_cache.async_set(url, response.content)
+            self._parsed_responses.set(url, response.content, research_task)
+        return research_task
 
     def create_tasks(
-        self, tasks: list[LinkupTaskInput], timeout: float | None = None
+        self,
+        tasks: list[LinkupTaskInput],
+        timeout: float | None = None,
+        idempotency_key: str | None = None,
     ) -> list[LinkupTask]:
         """Create a mixed batch of search, fetch, and research tasks.
 
@@ -785,6 +1389,14 @@ class LinkupClient:
                 LinkupFetchTaskInput, and LinkupResearchTaskInput.
             timeout: The timeout for the HTTP request, in seconds. If None, the request will have
                 no timeout.
+            idempotency_key: A key identifying the batch of tasks, sent in the Idempotency-Key
+                header so that the Linkup API doesn't create the tasks twice for retried requests.
+                If tasks were already created by the client with this key, they are returned
+                without sending a request, and concurrent calls with this key wait for the call
+                sending the request, only sending their own if it fails. The client only records
+                the batches it successfully created, so after a failed or timed out request, not
+                creating the tasks twice relies on the Linkup API honoring the key. If None, a
+                random key is used, which only protects the automatic retries.
 
         Returns:
             The newly created tasks with "pending" status and no output.
@@ -792,24 +1404,42 @@ class LinkupClient:
         Raises:
             TypeError: If a task has an unsupported model type, or if a structured output schema has
                 an unsupported type.
+            ValueError: If idempotency_key was already used by the client for different tasks.
             LinkupInvalidRequestError: If the task payload is invalid.
             LinkupAuthenticationError: If the Linkup API key is invalid.
             LinkupInsufficientCreditError: If you have run out of credit.
             LinkupTasksQueueLimitExceededError: If too many tasks are already pending or processing.
             LinkupTimeoutError: If the request times out.
         """
-        response = self._request(
-            method="POST",
-            url="/tasks",
-            json=self._get_tasks_payload(tasks),
-            timeout=timeout,
-        )
+        payload = self._get_tasks_payload(tasks)
+        if idempotency_key is not None:
+            while (claim := self._claim_idempotency_key(idempotency_key, payload)) is not None:
+                if isinstance(claim, list):
+                    return claim
+                claim.result()
+
+        created_tasks: list[LinkupTask] | None = None
+        try:
+            response = self._request(
+                method="POST",
+                url="/tasks",
+                json=payload,
+                timeout=timeout,
+                headers={"Idempotency-Key": idempotency_key or str(uuid.uuid4())},
+            )
 
-        response_data = cast("list[dict[str, Any]]", response.json())
-        return [self._parse_task(task) for task in response_data]
+            response_data = cast("list[dict[str, Any]]", response.json())
+            created_tasks = [self._parse_task(task) for task in response_data]
+            return created_tasks
+        finally:
+            if idempotency_key is not None:
+                self._release_idempotency_key(idempotency_key, payload, created_tasks)
 
     async def async_create_tasks(
-        self, tasks: list[LinkupTaskInput], timeout: float | None = None
+        self,
+        tasks: list[LinkupTaskInput],
+        timeout: float | None = None,
+        idempotency_key: str | None = None,
     ) -> list[LinkupTask]:
         """Asynchronously create a mixed batch of search, fetch, and research tasks.
 
@@ -818,6 +1448,14 @@ class LinkupClient:
                 LinkupFetchTaskInput, and LinkupResearchTaskInput.
             timeout: The timeout for the HTTP request, in seconds. If None, the request will have
                 no timeout.
+            idempotency_key: A key identifying the batch of tasks, sent in the Idempotency-Key
+                header so that the Linkup API doesn't create the tasks twice for retried requests.
+                If tasks were already created by the client with this key, they are returned
+                without sending a request, and concurrent calls with this key wait for the call
+                sending the request, only sending their own if it fails. The client only records
+                the batches it successfully created, so after a failed or timed out request, not
+                creating the tasks twice relies on the Linkup API honoring the key. If None, a
+                random key is used, which only protects the automatic retries.
 
         Returns:
             The newly created tasks with "pending" status and no output.
@@ -825,21 +1463,37 @@ class LinkupClient:
         Raises:
             TypeError: If a task has an unsupported model type, or if a structured output schema has
                 an unsupported type.
+            ValueError: If idempotency_key was already used by the client for different tasks.
             LinkupInvalidRequestError: If the task payload is invalid.
             LinkupAuthenticationError: If the Linkup API key is invalid.
             LinkupInsufficientCreditError: If you have run out of credit.
             LinkupTasksQueueLimitExceededError: If too many tasks are already pending or processing.
             LinkupTimeoutError: If the request times out.
         """
-        response = await self._async_request(
-            method="POST",
-            url="/tasks",
-            json=self._get_tasks_payload(tasks),
-            timeout=timeout,
-        )
+        payload = self._get_tasks_payload(tasks)
+        if idempotency_key is not None:
+            while (claim := self._claim_idempotency_key(idempotency_key, payload)) is not None:
+                if isinstance(claim, list):
+                    return claim
+                # Cancelling a call must not cancel the wait of the other calls with the same key
+                await asyncio.shield(asyncio.wrap_future(claim))
+
+        created_tasks: list[LinkupTask] | None = None
+        try:
+            response = await self._async_request(
+                method="POST",
+                url="/tasks",
+                json=payload,
+                timeout=timeout,
+                headers={"Idempotency-Key": idempotency_key or str(uuid.uuid4())},
+            )
 
-        response_data = cast("list[dict[str, Any]]", response.json())
-        return [self._parse_task(task) for task in response_data]
+            response_data = cast("list[dict[str, Any]]", response.json())
+            created_tasks = [self._parse_task(task) for task in response_data]
+            return created_tasks
+        finally:
+            if idempotency_key is not None:
+                self._release_idempotency_key(idempotency_key, payload, created_tasks)
 
     def list_tasks(
         self,
@@ -892,7 +1546,10 @@ class LinkupClient:
             timeout=timeout,
         )
 
-        return self._parse_tasks_page(response.json())
+        cached_tasks: dict[str, bytes] = {}
+        tasks_page = self._parse_tasks_page(response.json(), cached_tasks=cached_tasks)
+        self._cache_tasks(cached_tasks)
+        return tasks_page
 
     async def async_list_tasks(
         self,
@@ -945,7 +1602,10 @@ class LinkupClient:
             timeout=timeout,
         )
 
-        return self._parse_tasks_page(response.json())
+        cached_tasks: dict[str, bytes] = {}
+        tasks_page = self._parse_tasks_page(response.json(), cached_tasks=cached_tasks)
+        await self._async_cache_tasks(cached_tasks)
+        return tasks_page
 
     def get_task(self, task_id: str, timeout: float | None = None) -> LinkupTask:
         """Retrieve a single task by identifier.
@@ -963,13 +1623,30 @@ class LinkupClient:
             LinkupAuthenticationError: If the Linkup API key is invalid.
             LinkupTimeoutError: If the request times out.
         """
+        url = f"/tasks/{task_id}"
+        if self._task_cache is not None:
+            # Completed and failed tasks don't change, so their parsed tasks can always be reused
+            cached_task = self._parsed_responses.get(url)
+            if cached_task is None:
+                cached_content = self._task_cache.get(url)
+                if cached_content is not None:
+                    cached_task = self._parse_cached_content(
+                        url, cached_content, parse=self._parse_task
+                    )
+            if cached_task is not None:
+                return cached_task
+
         response = self._request(
             method="GET",
-            url=f"/tasks/{task_id}",
+            url=url,
             timeout=timeout,
         )
 
-        return self._parse_task(cast("dict[str, Any]", response.json()))
+        task = self._parse_task(cast("dict[str, Any]", response.json()))
+        if self._task_cache is not None and task.status in _TERMINAL_STATUSES:
+            self._task_cache.set(url, response.content)
+            self._parsed_responses.set(url, response.content, task)
+        return task
 
     async def async_get_task(self, task_id: str, timeout: float | None = None) -> LinkupTask:
         """Asynchronously retrieve a single task by identifier.
@@ -987,13 +1664,174 @@ class LinkupClient:
             LinkupAuthenticationError: If the Linkup API key is invalid.
             LinkupTimeoutError: If the request times out.
         """
+        url = f"/tasks/{task_id}"
+        if self._task_cache is not None:
+            # Completed and failed tasks don't change, so their parsed tasks can always be reused
+            cached_task = self._parsed_responses.get(url)
+            if cached_task is None:
+                cached_content = await self._task_cache.async_get(url)
+                if cached_content is not None:
+                    cached_task = self._parse_cached_content(
+                        url, cached_content, parse=self._parse_task
+                    )
+            if cached_task is not None:
+                return cached_task
+
         response = await self._async_request(
             method="GET",
-            url=f"/tasks/{task_id}",
+            url=url,
             timeout=timeout,
         )
 
-        return self._parse_task(cast("dict[str, Any]", response.json()))
+        task = self._parse_task(cast("dict[str, Any]", response.json()))
+        if self._task_cache is not None and task.status in _TERMINAL_STATUSES:
+            await self._task_cache.async_set(url, response.content)
+            self._parsed_responses.set(url, response.content, task)
+        return task
+
+    def wait_for_task(
+        self, task: _TaskT, deadline: float | None = None, timeout: float | None = None
+    ) -> _TaskT:
+        """Wait for a task to be completed or failed, polling it with adaptive delays.
+
+        The delays between polls follow the polling policy of the client: they start short, back
+        off with jitter, and take into account the expected duration of the task, given its type
+        and its depth, mode or reasoning depth.
+
+        Args:
+            task: The task to wait for, e.g. as returned by create_tasks or research.
+            deadline: The total time budget of the wait, in seconds. If None, the wait is only
+                limited by the deadline set with the deadline context manager, if any.
+            timeout: The timeout for each HTTP request, in seconds. If None, the requests will have
+                no timeout.
+
+        Returns:
+            The task, with "completed" or "failed" status. It is returned as is, without polling,
+            if it is already completed or failed.
+
+        Raises:
+            LinkupTimeoutError: If the deadline is exceeded before the task is completed or failed,
+                or if a request times out.
+            LinkupTaskNotFoundError: If the task identifier does not match an existing task.
+            LinkupAuthenticationError: If the Linkup API key is invalid.
+        """
+        return cast("_TaskT", self.wait_for_tasks([task], deadline=deadline, timeout=timeout)[0])
+
+    async def async_wait_for_task(
+        self, task: _TaskT, deadline: float | None = None, timeout: float | None = None
+    ) -> _TaskT:
+        """Asynchronously wait for a task to be completed or failed, polling it adaptively.
+
+        The delays between polls follow the polling policy of the client: they start short, back
+        off with jitter, and take into account the expected duration of the task, given its type
+        and its depth, mode or reasoning depth.
+
+        Args:
+            task: The task to wait for, e.g. as returned by create_tasks or research.
+            deadline: The total time budget of the wait, in seconds. If None, the wait is only
+                limited by the deadline set with the deadline context manager, if any.
+            timeout: The timeout for each HTTP request, in seconds. If None, the requests will have
+                no timeout.
+
+        Returns:
+            The task, with "completed" or "failed" status. It is returned as is, without polling,
+            if it is already completed or failed.
+
+        Raises:
+            LinkupTimeoutError: If the deadline is exceeded before the task is completed or failed,
+                or if a request times out.
+            LinkupTaskNotFoundError: If the task identifier does not match an existing task.
+            LinkupAuthenticationError: If the Linkup API key is invalid.
+        """
+        tasks = await self.async_wait_for_tasks([task], deadline=deadline, timeout=timeout)
+        return cast("_TaskT", tasks[0])
+
+    def wait_for_tasks(
+        self, tasks: list[LinkupTask], deadline: float | None = None, timeout: float | None = None
+    ) -> list[LinkupTask]:
+        """Wait for tasks to be completed or failed, polling each of them with adaptive delays.
+
+        Each task is polled on its own schedule, following the polling policy of the client, and
+        is not polled anymore once it is completed or failed.
+
+        Args:
+            tasks: The tasks to wait for, e.g. as returned by create_tasks.
+            deadline: The total time budget of the wait, in seconds. If None, the wait is only
+                limited by the deadline set with the deadline context manager, if any.
+            timeout: The timeout for each HTTP request, in seconds. If None, the requests will have
+                no timeout.
+
+        Returns:
+            The tasks, in the same order, with "completed" or "failed" status.
+
+        Raises:
+            LinkupTimeoutError: If the deadline is exceeded before all the tasks are completed or
+                failed, or if a request times out.
+            LinkupTaskNotFoundError: If a task identifier does not match an existing task.
+            LinkupAuthenticationError: If the Linkup API key is invalid.
+        """
+        with self._wait_deadline(deadline):
+            tasks = list(tasks)
+            start = time.monotonic()
+            polls = [0] * len(tasks)
+            next_polls = [
+                start + self._get_poll_delay(task, polls=0, start=start) for task in tasks
+            ]
+            while True:
+                waited = [
+                    i for i, task in enumerate(tasks) if task.status not in _TERMINAL_STATUSES
+                ]
+                if not waited:
+                    return tasks
+                i = min(waited, key=lambda i: next_polls[i])
+                delay = max(0.0, next_polls[i] - time.monotonic())
+                if not _is_before_deadline(delay=delay):
+                    raise LinkupTimeoutError(
+                        "The deadline would be exceeded before the tasks are completed or failed."
+                    )
+                time.sleep(delay)
+                tasks[i] = self.get_task(tasks[i].id, timeout=timeout)
+                polls[i] += 1
+                next_polls[i] = time.monotonic() + self._get_poll_delay(
+                    tasks[i], polls=polls[i], start=start
+                )
+
+    async def async_wait_for_tasks(
+        self, tasks: list[LinkupTask], deadline: float | None = None, timeout: float | None = None
+    ) -> list[LinkupTask]:
+        """Asynchronously wait for tasks to be completed or failed, polling them adaptively.
+
+        Each task is polled concurrently on its own schedule, following the polling policy of the
+        client, and is not polled anymore once it is completed or failed.
+
+        Args:
+            tasks: The tasks to wait for, e.g. as returned by async_create_tasks.
+            deadline: The total time budget of the wait, in seconds. If None, the wait is only
+                limited by the deadline set with the deadline context manager, if any.
+            timeout: The timeout for each HTTP request, in seconds. If None, the requests will have
+                no timeout.
+
+        Returns:
+            The tasks, in the same order, with "completed" or "failed" status.
+
+        Raises:
+            LinkupTimeoutError: If the deadline is exceeded before all the tasks are completed or
+                failed, or if a request times out.
+            LinkupTaskNotFoundError: If a task identifier does not match an existing task.
+            LinkupAuthenticationError: If the Linkup API key is invalid.
+        """
+        with self._wait_deadline(deadline):
+            start = time.monotonic()
+            waits = [
+                asyncio.ensure_future(self._async_poll_task(task, start=start, timeout=timeout))
+                for task in tasks
+            ]
+        try:
+            return list(await asyncio.gather(*waits))
+        finally:
+            # Stop polling the other tasks when one of them fails
+            for wait in waits:
+                wait.cancel()
 
     def fetch(
         self,
@@ -1045,15 +1883,33 @@ class LinkupClient:
             extract_images=extract_images,
             mode=mode,
         )
+        cache_key = None
+        if self._fetch_cache is not None or self._negative_cache is not None:
+            cache_key = get_cache_key(url="/fetch", params=params)
+        if self._fetch_cache is not None and cache_key is not None:
+            cached_content = self._fetch_cache.get(cache_key)
+            if cached_content is not None:
+                return self._parse_cached_content(
+                    cache_key, cached_content, parse=self._parse_fetch_response
+                )
 
-        response: httpx.Response = self._request(
-            method="POST",
-            url="/fetch",
-            json=params,
-            timeout=timeout,
-        )
+        self._raise_cached_error(cache_key)
+        try:
+            response: httpx.Response = self._request(
+                method="POST",
+                url="/fetch",
+                json=params,
+                timeout=timeout,
+            )
+        except Exception as e:
+            self._cache_error(cache_key, error=e)
+            raise
 
-        return self._parse_fetch_response(response_data=response.json())
+        fetch_response = self._parse_fetch_response(response_data=response.json())
+        if self._fetch_cache is not None and cache_key is not None:
+            self._fetch_cache.set(cache_key, response.content)
+            self._parsed_responses.set(cache_key, response.content, fetch_response)
+        return fetch_response
 
     async def async_fetch(
         self,
@@ -1105,15 +1961,33 @@ class LinkupClient:
             extract_images=extract_images,
             mode=mode,
         )
+        cache_key = None
+        if self._fetch_cache is not None or self._negative_cache is not None:
+            cache_key = get_cache_key(url="/fetch", params=params)
+        if self._fetch_cache is not None and cache_key is not None:
+            cached_content = await self._fetch_cache.async_get(cache_key)
+            if cached_content is not None:
+                return self._parse_cached_content(
+                    cache_key, cached_content, parse=self._parse_fetch_response
+                )
 
-        response: httpx.Response = await self._async_request(
-            method="POST",
-            url="/fetch",
-            json=params,
-            timeout=timeout,
-        )
+        self._raise_cached_error(cache_key)
+        try:
+            response: httpx.Response = await self._async_request(
+                method="POST",
+                url="/fetch",
+                json=params,
+                timeout=timeout,
+            )
+        except Exception as e:
+            self._cache_error(cache_key, error=e)
+            raise
 
-        return self._parse_fetch_response(response_data=response.json())
+        fetch_response = self._parse_fetch_response(response_data=response.json())
+        if self._fetch_cache is not None and cache_key is not None:
+            await self._fetch_cache.async_set(cache_key, response.content)
+            self._parsed_responses.set(cache_key, response.content, fetch_response)
+        return fetch_response
 
     def _user_agent(self) -> str:  # pragma: no cover
         return f"Linkup-Python/{self.__version__}"
@@ -1127,6 +2001,76 @@ class LinkupClient:
                 headers["Authorization"] = f"Bearer {self._api_key.get_secret_value()}"
         return headers
 
+    def _get_client(self) -> httpx.Client:
+        with self._client_lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    base_url=self._base_url,
+                    headers=self._headers(),
+                    http2=self._http2,
+                    limits=self._limits,
+                    transport=self._transport,
+                )
+            return self._client
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        if self._async_client is not None:
+            return self._async_client
+        loop = asyncio.get_running_loop()
+        with self._client_lock:
+            async_client = self._async_clients.get(loop)
+            if async_client is None:
+                # Pools of closed event loops can't be used anymore, even if their loop is alive
+                closed_loops = [other for other in self._async_clients if other.is_closed()]
+                for closed_loop in closed_loops:
+                    del self._async_clients[closed_loop]
+                async_client = httpx.AsyncClient(
+                    base_url=self._base_url,
+                    headers=self._headers(),
+                    http2=self._http2,
+                    limits=self._limits,
+                    transport=self._async_transport,
+                )
+                self._async_clients[loop] = async_client
+            return async_client
+
+    def _get_warmup_connections(
+        self, n_connections: int, http_client: httpx.Client | httpx.AsyncClient, owned: bool
+    ) -> int:
+        # Connections beyond the keep-alive limit would be closed as soon as they are released, and
+        # requests beyond the connection limit would wait for the held ones forever
+        if owned:
+            limits = [self._limits.max_connections, self._limits.max_keepalive_connections]
+        elif (pool_info := _get_connection_pool_info(http_client)) is not None:
+            limits = [pool_info.max_connections, pool_info.max_keepalive_connections]
+        else:
+            return n_connections
+        return min(n_connections, *(limit for limit in limits if limit is not None))
+
+    def _get_warmup_request_kwargs(self, timeout: float | None, owned: bool) -> dict[str, Any]:
+        request_kwargs = self._get_request_kwargs(
+            method="HEAD", url="", json=None, params=None, timeout=timeout, owned_client=owned
+        )
+        # The limits of the pools of other transports are unknown: a connection that would wait for
+        # the held ones is not opened instead
+        request_kwargs["timeout"] = httpx.Timeout(
+            request_kwargs["timeout"], pool=_WARMUP_POOL_TIMEOUT
+        )
+        return request_kwargs
+
+    @contextlib.contextmanager
+    def _track_in_flight(self) -> Generator[None]:
+        with self._stats_lock:
+            self._requests_in_flight += 1
+            self._max_requests_in_flight = max(
+                self._max_requests_in_flight, self._requests_in_flight
+            )
+        try:
+            yield
+        finally:
+            with self._stats_lock:
+                self._requests_in_flight -= 1
+
     def _request(
         self,
         method: str,
@@ -1135,82 +2079,748 @@ class LinkupClient:
         json: dict[str, Any] | list[dict[str, Any]] | None = None,
         params: dict[str, Any] | None = None,
         timeout: float | None,
+        headers: dict[str, str] | None = None,
     ) -> httpx.Response:
+        request = functools.partial(
+            self._request_with_retries,
+            method=method,
+            url=url,
+            json=json,
+            params=params,
+            timeout=timeout,
+            headers=headers,
+        )
+        if not self._should_coalesce(url=url, json=json, params=params, headers=headers):
+            return request()
+
+        key = f"{method} {get_cache_key(url=url, params=cast('dict[str, Any]', json))}"
+        future: concurrent.futures.Future[httpx.Response] = concurrent.futures.Future()
+        with self._coalescing_lock:
+            self._coalescing_calls += 1
+            in_flight_future = self._in_flight.setdefault(key, future)
+            if in_flight_future is not future:
+                self._coalesced_calls += 1
+        if in_flight_future is not future:
+            return in_flight_future.result()
+
         try:
-            with httpx.Client(base_url=self._base_url, headers=self._headers()) as client:
-                request_kwargs: dict[str, Any] = {
-                    "method": method,
-                    "url": url,
-                    "timeout": timeout,
-                }
-                if json is not None:
-                    request_kwargs["json"] = json
-                if params is not None:
-                    request_kwargs["params"] = params
-                response: httpx.Response = client.request(
-                    **request_kwargs,
+            response = request()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._coalescing_lock:
+                del self._in_flight[key]
+
+    async def _async_request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: dict[str, Any] | list[dict[str, Any]] | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        request = functools.partial(
+            self._async_request_with_retries,
+            method=method,
+            url=url,
+            json=json,
+            params=params,
+            timeout=timeout,
+            headers=headers,
+        )
+        if not self._should_coalesce(url=url, json=json, params=params, headers=headers):
+            return await request()
+
+        loop = asyncio.get_running_loop()
+        key = (loop, f"{method} {get_cache_key(url=url, params=cast('dict[str, Any]', json))}")
+        with self._coalescing_lock:
+            self._coalescing_calls += 1
+            task = self._async_in_flight.get(key)
+            if task is not None:
+                self._coalesced_calls += 1
+            else:
+                task = loop.create_task(request())
+                self._async_in_flight[key] = task
+                task.add_done_callback(functools.partial(self._forget_async_in_flight, key))
+        # Cancelling a call must not cancel the request shared with identical calls
+        return await asyncio.shield(task)
+
+    def _should_coalesce(
+        self,
+        url: str,
+        json: dict[str, Any] | list[dict[str, Any]] | None,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+    ) -> bool:
+        return (
+            self._coalesce_requests
+            and url in ("/search", "/fetch")
+            and isinstance(json, dict)
+            and params is None
+            and headers is None
+        )
+
+    def _forget_async_in_flight(
+        self, key: tuple[asyncio.AbstractEventLoop, str], task: asyncio.Task[httpx.Response]
+    ) -> None:
+        with self._coalescing_lock:
+            if self._async_in_flight.get(key) is task:
+                del self._async_in_flight[key]
+        if not task.cancelled():
+            # Mark the error as retrieved, in case all the calls sharing the task were cancelled
+            task.exception()
+
+    def _request_with_retries(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: dict[str, Any] | list[dict[str, Any]] | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        endpoint = _get_endpoint(url)
+        attempt = 1
+        while True:
+            rate_limiter = self._rate_limits.get(endpoint)
+            if rate_limiter is not None and not rate_limiter.acquire(
+                timeout=_get_deadline_timeout(None)
+            ):
+                raise LinkupTimeoutError(
+                    "The deadline would be exceeded before the rate limiter lets the request "
+                    "through."
                 )
-                if response.status_code == 402 and self._x402_signer is not None:
-                    return self._handle_x402_payment(
-                        client=client,
-                        response=response,
+            # A spent budget fails before the circuit breaker, which only records sent requests
+            _get_deadline_timeout(None)
+            if self._circuit_breaker is not None:
+                self._circuit_breaker.before_request(endpoint)
+            response: httpx.Response | None = None
+            try:
+                if self._should_hedge(url=url, json=json):
+                    response = self._send_hedged_request(
+                        method=method,
+                        url=url,
+                        json=json,
+                        params=params,
+                        timeout=timeout,
+                        headers=headers,
+                    )
+                else:
+                    response = self._send_request(
                         method=method,
                         url=url,
                         json=json,
                         params=params,
                         timeout=timeout,
+                        headers=headers,
                     )
+                # httpx timeouts apply to each read of the response, so a slowly received response
+                # can outlast the budget
+                if not _is_before_deadline(delay=0.0):
+                    raise LinkupTimeoutError(
+                        "The deadline was exceeded while receiving the response of the Linkup API."
+                    )
+                if response.status_code != 200:
+                    self._raise_linkup_error(response=response)
+                if self._circuit_breaker is not None:
+                    self._circuit_breaker.record_success(endpoint)
+                return response
+            except Exception as e:
+                if self._circuit_breaker is not None:
+                    self._circuit_breaker.record_failure(endpoint, error=e, response=response)
+                retry_delay = self._get_retry_delay(attempt=attempt, error=e, response=response)
+                if retry_delay is None:
+                    raise
+                if not _is_before_deadline(delay=retry_delay):
+                    raise LinkupTimeoutError(
+                        "The deadline would be exceeded before the request to the Linkup API could "
+                        "be retried."
+                    ) from e
+            time.sleep(retry_delay)
+            attempt += 1
+
+    async def _async_request_with_retries(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: dict[str, Any] | list[dict[str, Any]] | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        endpoint = _get_endpoint(url)
+        attempt = 1
+        while True:
+            rate_limiter = self._rate_limits.get(endpoint)
+            if rate_limiter is not None and not await rate_limiter.async_acquire(
+                timeout=_get_deadline_timeout(None)
+            ):
+                raise LinkupTimeoutError(
+                    "The deadline would be exceeded before the rate limiter lets the request "
+                    "through."
+                )
+            response: httpx.Response | None = None
+            try:
+                async with self._limit_concurrency():
+                    # The slot is waited for and a spent budget fails before the circuit breaker,
+                    # which only records sent requests
+                    _get_deadline_timeout(None)
+                    if self._circuit_breaker is not None:
+                        self._circuit_breaker.before_request(endpoint)
+                    try:
+                        send = (
+                            self._async_send_hedged_request
+                            if self._should_hedge(url=url, json=json)
+                            else self._async_send_request
+                        )
+                        response = await _wait_within_deadline(
+                            send(
+                                method=method,
+                                url=url,
+                                json=json,
+                                params=params,
+                                timeout=timeout,
+                                headers=headers,
+                            )
+                        )
+                        if response.status_code != 200:
+                            self._raise_linkup_error(response=response)
+                    except Exception as e:
+                        if self._circuit_breaker is not None:
+                            self._circuit_breaker.record_failure(
+                                endpoint, error=e, response=response
+                            )
+                        raise
+                if self._circuit_breaker is not None:
+                    self._circuit_breaker.record_success(endpoint)
+                return response
+            except Exception as e:
+                retry_delay = self._get_retry_delay(attempt=attempt, error=e, response=response)
+                if retry_delay is None:
+                    raise
+                if not _is_before_deadline(delay=retry_delay):
+                    raise LinkupTimeoutError(
+                        "The deadline would be exceeded before the request to the Linkup API could "
+                        "be retried."
+                    ) from e
+            await asyncio.sleep(retry_delay)
+            attempt += 1
+
+    def _limit_concurrency(self) -> contextlib.AbstractAsyncContextManager[None]:
+        if self._adaptive_concurrency is None:
+            return contextlib.nullcontext()
+        return self._adaptive_concurrency.slot(timeout=_get_deadline_timeout(None))
+
+    def _get_retry_delay(
+        self, attempt: int, error: Exception, response: httpx.Response | None
+    ) -> float | None:
+        if self._retry_policy is None:
+            return None
+        return self._retry_policy.get_retry_delay(attempt=attempt, error=error, response=response)
+
+    def _should_hedge(self, url: str, json: dict[str, Any] | list[dict[str, Any]] | None) -> bool:
+        return (
+            self._hedging_policy is not None
+            and url == "/search"
+            and isinstance(json, dict)
+            and json.get("depth") in self._hedging_policy.depths
+        )
+
+    def _wait_deadline(self, deadline: float | None) -> contextlib.AbstractContextManager[None]:
+        if deadline is None:
+            return contextlib.nullcontext()
+        return self.deadline(deadline)
+
+    def _get_poll_delay(self, task: LinkupTask, polls: int, start: float) -> float:
+        if task.status in _TERMINAL_STATUSES:
+            return 0.0
+        return self._polling_policy.get_poll_delay(
+            task, polls=polls, elapsed=time.monotonic() - start
+        )
+
+    async def _async_poll_task(
+        self, task: LinkupTask, start: float, timeout: float | None
+    ) -> LinkupTask:
+        polls = 0
+        while task.status not in _TERMINAL_STATUSES:
+            delay = self._get_poll_delay(task, polls=polls, start=start)
+            if not _is_before_deadline(delay=delay):
+                raise LinkupTimeoutError(
+                    "The deadline would be exceeded before the tasks are completed or failed."
+                )
+            await asyncio.sleep(delay)
+            task = await self.async_get_task(task.id, timeout=timeout)
+            polls += 1
+        return task
+
+    def _get_stale_policy(
+        self,
+        depth: Literal["fast", "standard", "deep"],
+        output_type: Literal["searchResults", "sourcedAnswer", "structured"],
+    ) -> LinkupStalePolicy | None:
+        for stale_policy in self._stale_policies:
+            if stale_policy.applies_to(depth=depth, output_type=output_type):
+                return stale_policy
+        return None
+
+    def _get_cached_search_content(
+        self, cache_key: str, stale_policy: LinkupStalePolicy | None
+    ) -> tuple[bytes | None, float]:
+        if self._search_cache is None:
+            return None, 0.0
+        if stale_policy is None:
+            return self._search_cache.get(cache_key), 0.0
+        # Caches supporting stale lookups are checked when the client is created
+        search_cache = cast("LinkupMemoryCache | LinkupTieredCache", self._search_cache)
+        cached_entry = search_cache.get_stale(cache_key, max_stale=stale_policy.max_stale)
+        return cached_entry if cached_entry is not None else (None, 0.0)
+
+    async def _async_get_cached_search_content(
+        self, cache_key: str, stale_policy: LinkupStalePolicy | None
+    ) -> tuple[bytes | None, float]:
+        if self._search_cache is None:
+            return None, 0.0
+        if stale_policy is None:
+            return await self._search_cache.async_get(cache_key), 0.0
+        # Caches supporting stale lookups are checked when the client is created
+        search_cache = cast("LinkupMemoryCache | LinkupTieredCache", self._search_cache)
+        cached_entry = await search_cache.async_get_stale(
+            cache_key, max_stale=stale_policy.max_stale
+        )
+        return cached_entry if cached_entry is not None else (None, 0.0)
+
+    def _search_and_cache(
+        self,
+        cache_key: str | None,
+        params: dict[str, str | bool | int | list[str]],
+        output_type: Literal["searchResults", "sourcedAnswer", "structured"],
+        include_sources: bool | None,
+        timeout: float | None,
+    ) -> Any:  # noqa: ANN401
+        self._raise_cached_error(cache_key)
+        try:
+            response: httpx.Response = self._request(
+                method="POST",
+                url="/search",
+                json=params,
+                timeout=timeout,
+            )
+        except Exception as e:
+            self._cache_error(cache_key, error=e)
+            raise
+
+        search_response = self._parse_search_response(
+            response_data=response.json(),
+            output_type=output_type,
+            include_sources=include_sources,
+        )
+        if self._search_cache is not None and cache_key is not None:
+            self._search_cache.set(cache_key, response.content)
+            self._parsed_responses.set(cache_key, response.content, search_response)
+        return search_response
+
+    async def _async_search_and_cache(
+        self,
+        cache_key: str | None,
+        params: dict[str, str | bool | int | list[str]],
+        output_type: Literal["searchResults", "sourcedAnswer", "structured"],
+        include_sources: bool | None,
+        timeout: float | None,
+    ) -> Any:  # noqa: ANN401
+        self._raise_cached_error(cache_key)
+        try:
+            response: httpx.Response = await self._async_request(
+                method="POST",
+                url="/search",
+                json=params,
+                timeout=timeout,
+            )
+        except Exception as e:
+            self._cache_error(cache_key, error=e)
+            raise
+
+        search_response = self._parse_search_response(
+            response_data=response.json(),
+            output_type=output_type,
+            include_sources=include_sources,
+        )
+        if self._search_cache is not None and cache_key is not None:
+            await self._search_cache.async_set(cache_key, response.content)
+            self._parsed_responses.set(cache_key, response.content, search_response)
+        return search_response
+
+    def _raise_cached_error(self, cache_key: str | None) -> None:
+        if self._negative_cache is not None and cache_key is not None:
+            cached_error = self._negative_cache.get(cache_key)
+            if cached_error is not None:
+                raise cached_error
+
+    def _cache_error(self, cache_key: str | None, error: Exception) -> None:
+        if self._negative_cache is not None and cache_key is not None:
+            self._negative_cache.set(cache_key, error=error)
+
+    def _start_revalidation(self, cache_key: str) -> bool:
+        with self._revalidation_lock:
+            if cache_key in self._revalidating:
+                return False
+            self._revalidating.add(cache_key)
+            return True
+
+    def _end_revalidation(self, cache_key: str) -> None:
+        with self._revalidation_lock:
+            self._revalidating.discard(cache_key)
+
+    def _revalidate_search(
+        self,
+        cache_key: str,
+        params: dict[str, str | bool | int | list[str]],
+        output_type: Literal["searchResults", "sourcedAnswer", "structured"],
+        include_sources: bool | None,
+        timeout: float | None,
+    ) -> None:
+        if not self._start_revalidation(cache_key):
+            return
+        with self._client_lock:
+            if self._revalidation_executor is None:
+                self._revalidation_executor = concurrent.futures.ThreadPoolExecutor(
+                    thread_name_prefix="linkup-revalidation"
+                )
+            executor = self._revalidation_executor
+        executor.submit(
+            self._refresh_search,
+            cache_key,
+            params=params,
+            output_type=output_type,
+            include_sources=include_sources,
+            timeout=timeout,
+        )
+
+    def _refresh_search(
+        self,
+        cache_key: str,
+        params: dict[str, str | bool | int | list[str]],
+        output_type: Literal["searchResults", "sourcedAnswer", "structured"],
+        include_sources: bool | None,
+        timeout: float | None,
+    ) -> None:
+        # A failed refresh leaves the stale response in the cache, until the next refresh
+        try:
+            with contextlib.suppress(Exception):
+                self._search_and_cache(
+                    cache_key,
+                    params=params,
+                    output_type=output_type,
+                    include_sources=include_sources,
+                    timeout=timeout,
+                )
+        finally:
+            self._end_revalidation(cache_key)
+
+    def _async_revalidate_search(
+        self,
+        cache_key: str,
+        params: dict[str, str | bool | int | list[str]],
+        output_type: Literal["searchResults", "sourcedAnswer", "structured"],
+        include_sources: bool | None,
+        timeout: float | None,
+    ) -> None:
+        if not self._start_revalidation(cache_key):
+            return
+        task = asyncio.get_running_loop().create_task(
+            self._async_refresh_search(
+                cache_key,
+                params=params,
+                output_type=output_type,
+                include_sources=include_sources,
+                timeout=timeout,
+            )
+        )
+        # Keep a reference to the task, which could otherwise be garbage collected while running
+        self._revalidation_tasks.add(task)
+        task.add_done_callback(self._revalidation_tasks.discard)
+
+    async def _async_refresh_search(
+        self,
+        cache_key: str,
+        params: dict[str, str | bool | int | list[str]],
+        output_type: Literal["searchResults", "sourcedAnswer", "structured"],
+        include_sources: bool | None,
+        timeout: float | None,
+    ) -> None:
+        # The refresh outlives the call which triggered it, so it isn't bound by its deadline
+        _deadline.set(None)
+        try:
+            with contextlib.suppress(Exception):
+                await self._async_search_and_cache(
+                    cache_key,
+                    params=params,
+                    output_type=output_type,
+                    include_sources=include_sources,
+                    timeout=timeout,
+                )
+        finally:
+            self._end_revalidation(cache_key)
+
+    def _get_hedging_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._client_lock:
+            if self._hedging_executor is None:
+                self._hedging_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=cast("LinkupHedgingPolicy", self._hedging_policy).max_workers,
+                    thread_name_prefix="linkup-hedging",
+                )
+            return self._hedging_executor
+
+    def _send_hedged_request(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any] | list[dict[str, Any]] | None,
+        params: dict[str, Any] | None,
+        timeout: float | None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        hedging_policy = cast("LinkupHedgingPolicy", self._hedging_policy)
+        executor = self._get_hedging_executor()
+        slots = self._hedging_slots
+        send = functools.partial(
+            self._send_request,
+            method=method,
+            url=url,
+            json=json,
+            params=params,
+            timeout=timeout,
+            headers=headers,
+        )
+
+        def send_on_slot() -> httpx.Response:
+            try:
+                return send()
+            finally:
+                slots.release()
+
+        start = hedge_start = time.monotonic()
+        # Requests are only submitted when a thread of the pool is idle, so that they never wait in
+        # its queue: otherwise, the request is sent on the calling thread, without hedging
+        if not slots.acquire(blocking=False):
+            try:
+                response = send()
+            except Exception:
+                hedging_policy.record(latency=None, hedged=False, hedge_won=False)
+                raise
+            hedging_policy.record(latency=time.monotonic() - start, hedged=False, hedge_won=False)
+            return response
+
+        # Each request runs in a copy of the context of the call, to be subject to its deadline
+        futures = [executor.submit(contextvars.copy_context().run, send_on_slot)]
+        done, _ = concurrent.futures.wait(futures, timeout=hedging_policy.get_delay())
+        if not done and slots.acquire(blocking=False):
+            hedge_start = time.monotonic()
+            futures.append(executor.submit(contextvars.copy_context().run, send_on_slot))
+
+        # The response of a request which is still running is discarded once it completes
+        winner = futures[0]
+        for future in concurrent.futures.as_completed(futures):
+            if _is_successful(future):
+                winner = future
+                break
+
+        hedge_won = winner is not futures[0]
+        hedging_policy.record(
+            latency=(
+                time.monotonic() - (hedge_start if hedge_won else start)
+                if _is_successful(winner)
+                else None
+            ),
+            hedged=len(futures) > 1,
+            hedge_won=hedge_won,
+        )
+        return winner.result()
+
+    async def _async_send_hedged_request(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any] | list[dict[str, Any]] | None,
+        params: dict[str, Any] | None,
+        timeout: float | None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        hedging_policy = cast("LinkupHedgingPolicy", self._hedging_policy)
+        send = functools.partial(
+            self._async_send_request,
+            method=method,
+            url=url,
+            json=json,
+            params=params,
+            timeout=timeout,
+            headers=headers,
+        )
+
+        start = hedge_start = time.monotonic()
+        tasks = [asyncio.ensure_future(send())]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedging_policy.get_delay())
+            if not done:
+                hedge_start = time.monotonic()
+                tasks.append(asyncio.ensure_future(send()))
+
+            winner = tasks[0]
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                successful_tasks = [task for task in tasks if task in done and _is_successful(task)]
+                if successful_tasks:
+                    winner = successful_tasks[0]
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        hedge_won = winner is not tasks[0]
+        hedging_policy.record(
+            latency=(
+                time.monotonic() - (hedge_start if hedge_won else start)
+                if _is_successful(winner)
+                else None
+            ),
+            hedged=len(tasks) > 1,
+            hedge_won=hedge_won,
+        )
+        return winner.result()
+
+    def _send_request(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any] | list[dict[str, Any]] | None,
+        params: dict[str, Any] | None,
+        timeout: float | None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        client = self._get_client()
+        try:
+            request_headers = headers
+            payment_headers = self._create_preemptive_payment_headers(
+                method=method, url=url, json=json
+            )
+            if payment_headers is not None:
+                request_headers = {**(headers or {}), **payment_headers}
+            request_kwargs = self._get_request_kwargs(
+                method=method,
+                url=url,
+                json=json,
+                params=params,
+                timeout=timeout,
+                owned_client=self._owns_client,
+                headers=request_headers,
+            )
+            with self._track_in_flight():
+                response: httpx.Response = client.request(
+                    **request_kwargs,
+                )
+            if payment_headers is not None and response.status_code != 402:
+                with self._x402_lock:
+                    self._x402_hits += 1
+            if response.status_code == 402 and self._x402_signer is not None:
+                return self._handle_x402_payment(
+                    client=client,
+                    response=response,
+                    method=method,
+                    url=url,
+                    json=json,
+                    params=params,
+                    timeout=timeout,
+                    headers=headers,
+                )
         except httpx.TimeoutException as e:
             raise LinkupTimeoutError(
                 "The request to the Linkup API timed out. Try increasing the timeout value."
             ) from e
-        if response.status_code != 200:
-            self._raise_linkup_error(response=response)
         return response
 
-    async def _async_request(
+    async def _async_send_request(
         self,
         method: str,
         url: str,
-        *,
-        json: dict[str, Any] | list[dict[str, Any]] | None = None,
-        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | list[dict[str, Any]] | None,
+        params: dict[str, Any] | None,
         timeout: float | None,
+        headers: dict[str, str] | None = None,
     ) -> httpx.Response:
+        client = self._get_async_client()
         try:
-            async with httpx.AsyncClient(
-                base_url=self._base_url, headers=self._headers()
-            ) as client:
-                request_kwargs: dict[str, Any] = {
-                    "method": method,
-                    "url": url,
-                    "timeout": timeout,
-                }
-                if json is not None:
-                    request_kwargs["json"] = json
-                if params is not None:
-                    request_kwargs["params"] = params
+            request_headers = headers
+            payment_headers = await self._async_create_preemptive_payment_headers(
+                method=method, url=url, json=json
+            )
+            if payment_headers is not None:
+                request_headers = {**(headers or {}), **payment_headers}
+            request_kwargs = self._get_request_kwargs(
+                method=method,
+                url=url,
+                json=json,
+                params=params,
+                timeout=timeout,
+                owned_client=self._owns_async_client,
+                headers=request_headers,
+            )
+            with self._track_in_flight():
                 response: httpx.Response = await client.request(
                     **request_kwargs,
                 )
-                if response.status_code == 402 and self._x402_signer is not None:
-                    return await self._async_handle_x402_payment(
-                        client=client,
-                        response=response,
-                        method=method,
-                        url=url,
-                        json=json,
-                        params=params,
-                        timeout=timeout,
-                    )
+            if payment_headers is not None and response.status_code != 402:
+                with self._x402_lock:
+                    self._x402_hits += 1
+            if response.status_code == 402 and self._x402_signer is not None:
+                return await self._async_handle_x402_payment(
+                    client=client,
+                    response=response,
+                    method=method,
+                    url=url,
+                    json=json,
+                    params=params,
+                    timeout=timeout,
+                    headers=headers,
+                )
         except httpx.TimeoutException as e:
             raise LinkupTimeoutError(
                 "The request to the Linkup API timed out. Try increasing the timeout value."
             ) from e
-        if response.status_code != 200:
-            self._raise_linkup_error(response=response)
         return response
 
+    def _get_request_kwargs(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any] | list[dict[str, Any]] | None,
+        params: dict[str, Any] | None,
+        timeout: float | None,
+        owned_client: bool,
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        # User-provided HTTP clients don't know about the Linkup base URL and headers, so they are
+        # passed with each request
+        request_kwargs: dict[str, Any] = {
+            "method": method,
+            "url": url if owned_client else f"{self._base_url.rstrip('/')}{url}",
+            "timeout": _get_deadline_timeout(timeout),
+        }
+        if headers is not None or not owned_client:
+            request_kwargs["headers"] = {**self._headers(), **(headers or {})}
+        if json is not None:
+            request_kwargs["json"] = json
+        if params is not None:
+            request_kwargs["params"] = params
+        return request_kwargs
+
     def _handle_x402_payment(
         self,
         client: httpx.Client,
@@ -1220,6 +2830,7 @@ class LinkupClient:
         json: dict[str, Any] | list[dict[str, Any]] | None,
         params: dict[str, Any] | None,
         timeout: float | None,
+        headers: dict[str, str] | None = None,
     ) -> httpx.Response:
         if self._x402_signer is None:
             raise RuntimeError("x402 signer is not configured")
@@ -1235,24 +2846,19 @@ class LinkupClient:
                 "x402 payment signing failed.\n"
                 f"Original error: {e}."
             ) from e
+        self._record_x402_requirements(method=method, url=url, json=json, response=response)
 
-        merged_headers = {**self._headers(), **payment_headers}
-        request_kwargs: dict[str, Any] = {
-            "method": method,
-            "url": url,
-            "timeout": timeout,
-            "headers": merged_headers,
-        }
-        if json is not None:
-            request_kwargs["json"] = json
-        if params is not None:
-            request_kwargs["params"] = params
-        retry_response: httpx.Response = client.request(**request_kwargs)
-
-        if retry_response.status_code != 200:
-            self._raise_linkup_error(response=retry_response)
-
-        return retry_response
+        request_kwargs = self._get_request_kwargs(
+            method=method,
+            url=url,
+            json=json,
+            params=params,
+            timeout=timeout,
+            owned_client=self._owns_client,
+            headers={**(headers or {}), **payment_headers},
+        )
+        with self._track_in_flight():
+            return client.request(**request_kwargs)
 
     async def _async_handle_x402_payment(
         self,
@@ -1263,12 +2869,13 @@ class LinkupClient:
         json: dict[str, Any] | list[dict[str, Any]] | None,
         params: dict[str, Any] | None,
         timeout: float | None,
+        headers: dict[str, str] | None = None,
     ) -> httpx.Response:
         if self._x402_signer is None:
             raise RuntimeError("x402 signer is not configured")
 
         try:
-            payment_headers = await self._x402_signer.async_create_payment_headers(
+            payment_headers = await self._async_create_payment_headers(
                 response_headers=dict(response.headers),
                 response_body=response.content,
             )
@@ -1278,27 +2885,120 @@ class LinkupClient:
                 "x402 payment signing failed.\n"
                 f"Original error: {e}."
             ) from e
+        self._record_x402_requirements(method=method, url=url, json=json, response=response)
 
-        merged_headers = {**self._headers(), **payment_headers}
-        request_kwargs: dict[str, Any] = {
-            "method": method,
-            "url": url,
-            "timeout": timeout,
-            "headers": merged_headers,
-        }
-        if json is not None:
-            request_kwargs["json"] = json
-        if params is not None:
-            request_kwargs["params"] = params
-        retry_response: httpx.Response = await client.request(**request_kwargs)
+        request_kwargs = self._get_request_kwargs(
+            method=method,
+            url=url,
+            json=json,
+            params=params,
+            timeout=timeout,
+            owned_client=self._owns_async_client,
+            headers={**(headers or {}), **payment_headers},
+        )
+        with self._track_in_flight():
+            return await client.request(**request_kwargs)
+
+    def _get_x402_requirements(
+        self, method: str, url: str, json: dict[str, Any] | list[dict[str, Any]] | None
+    ) -> tuple[dict[str, str], bytes] | None:
+        if not self._x402_preemptive_payment:
+            return None
+        with self._x402_lock:
+            return self._x402_requirements.get(
+                (method, _get_endpoint(url), _get_x402_price_key(json))
+            )
+
+    def _forget_x402_requirements(
+        self, method: str, url: str, json: dict[str, Any] | list[dict[str, Any]] | None
+    ) -> None:
+        with self._x402_lock:
+            self._x402_requirements.pop(
+                (method, _get_endpoint(url), _get_x402_price_key(json)), None
+            )
 
-        if retry_response.status_code != 200:
-            self._raise_linkup_error(response=retry_response)
+    def _record_x402_requirements(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any] | list[dict[str, Any]] | None,
+        response: httpx.Response,
+    ) -> None:
+        if not self._x402_preemptive_payment:
+            return
+        with self._x402_lock:
+            self._x402_requirements[(method, _get_endpoint(url), _get_x402_price_key(json))] = (
+                dict(response.headers),
+                response.content,
+            )
+            self._x402_misses += 1
+
+    def _create_preemptive_payment_headers(
+        self, method: str, url: str, json: dict[str, Any] | list[dict[str, Any]] | None
+    ) -> dict[str, str] | None:
+        requirements = self._get_x402_requirements(method=method, url=url, json=json)
+        if requirements is None or self._x402_signer is None:
+            return None
+        response_headers, response_body = requirements
+        try:
+            return self._x402_signer.create_payment_headers(
+                response_headers=response_headers, response_body=response_body
+            )
+        except Exception:
+            # Requirements which can't be signed anymore (e.g. expired) go through the 402 flow
+            self._forget_x402_requirements(method=method, url=url, json=json)
+            return None
+
+    async def _async_create_preemptive_payment_headers(
+        self, method: str, url: str, json: dict[str, Any] | list[dict[str, Any]] | None
+    ) -> dict[str, str] | None:
+        requirements = self._get_x402_requirements(method=method, url=url, json=json)
+        if requirements is None or self._x402_signer is None:
+            return None
+        response_headers, response_body = requirements
+        try:
+            return await self._async_create_payment_headers(
+                response_headers=response_headers, response_body=response_body
+            )
+        except Exception:
+            # Requirements which can't be signed anymore (e.g. expired) go through the 402 flow
+            self._forget_x402_requirements(method=method, url=url, json=json)
+            return None
+
+    async def _async_create_payment_headers(
+        self, response_headers: dict[str, str], response_body: bytes
+    ) -> dict[str, str]:
+        x402_signer = cast("LinkupX402Signer", self._x402_signer)
+        if self._x402_signing_workers is None:
+            return await x402_signer.async_create_payment_headers(
+                response_headers=response_headers, response_body=response_body
+            )
+        return await asyncio.get_running_loop().run_in_executor(
+            self._get_x402_signing_executor(),
+            functools.partial(
+                x402_signer.create_payment_headers,
+                response_headers=response_headers,
+                response_body=response_body,
+            ),
+        )
 
-        return retry_response
+    def _get_x402_signing_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._client_lock:
+            if self._x402_signing_executor is None:
+                self._x402_signing_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self._x402_signing_workers, thread_name_prefix="linkup-x402"
+                )
+            return self._x402_signing_executor
 
     def _raise_linkup_error(self, response: httpx.Response) -> None:
-        error_data = response.json()
+        try:
+            error_data = response.json()
+        except ValueError:
+            # e.g. the HTML page of a 502 or 503 error of a gateway in front of the Linkup API
+            raise LinkupUnknownError(
+                f"The Linkup API returned an unknown error ({response.status_code}).\n"
+                "The response body is not JSON."
+            ) from None
 
         if "error" in error_data:
             error = error_data["error"]
@@ -1464,10 +3164,9 @@ class LinkupClient:
             if isinstance(structured_output_schema, str):
                 params["structuredOutputSchema"] = structured_output_schema
             elif isinstance(structured_output_schema, dict):
-                params["structuredOutputSchema"] = json.dumps(structured_output_schema)
+                params["structuredOutputSchema"] = _serialize_dict_schema(structured_output_schema)
             elif issubclass(structured_output_schema, pydantic.BaseModel):
-                json_schema: dict[str, Any] = structured_output_schema.model_json_schema()
-                params["structuredOutputSchema"] = json.dumps(json_schema)
+                params["structuredOutputSchema"] = _serialize_model_schema(structured_output_schema)
             else:
                 raise TypeError(
                     f"Unexpected structured_output_schema type: '{type(structured_output_schema)}'"
@@ -1522,10 +3221,9 @@ class LinkupClient:
             if isinstance(structured_output_schema, str):
                 params["structuredOutputSchema"] = structured_output_schema
             elif isinstance(structured_output_schema, dict):
-                params["structuredOutputSchema"] = json.dumps(structured_output_schema)
+                params["structuredOutputSchema"] = _serialize_dict_schema(structured_output_schema)
             elif issubclass(structured_output_schema, pydantic.BaseModel):
-                json_schema: dict[str, Any] = structured_output_schema.model_json_schema()
-                params["structuredOutputSchema"] = json.dumps(json_schema)
+                params["structuredOutputSchema"] = _serialize_model_schema(structured_output_schema)
             else:
                 raise TypeError(
                     f"Unexpected structured_output_schema type: '{type(structured_output_schema)}'"
@@ -1584,6 +3282,43 @@ class LinkupClient:
             params["type"] = task_type
         return params
 
+    def _claim_idempotency_key(
+        self, idempotency_key: str, payload: list[dict[str, Any]]
+    ) -> list[LinkupTask] | concurrent.futures.Future[None] | None:
+        # Return the tasks already created with the key, or the completion of the call creating
+        # them, or None if the calling call must create them
+        claim: list[LinkupTask] | concurrent.futures.Future[None]
+        with self._created_tasks_lock:
+            if idempotency_key in self._creating_tasks:
+                used_payload, claim = self._creating_tasks[idempotency_key]
+            elif idempotency_key in self._created_tasks:
+                used_payload, created_tasks = self._created_tasks[idempotency_key]
+                claim = list(created_tasks)
+                self._created_tasks.move_to_end(idempotency_key)
+            else:
+                self._creating_tasks[idempotency_key] = (payload, concurrent.futures.Future())
+                return None
+        if used_payload != payload:
+            raise ValueError(
+                f"The idempotency key {idempotency_key!r} was already used for different tasks"
+            )
+        return claim
+
+    def _release_idempotency_key(
+        self,
+        idempotency_key: str,
+        payload: list[dict[str, Any]],
+        created_tasks: list[LinkupTask] | None,
+    ) -> None:
+        with self._created_tasks_lock:
+            _, creation = self._creating_tasks.pop(idempotency_key)
+            if created_tasks is not None:
+                self._created_tasks[idempotency_key] = (payload, list(created_tasks))
+                self._created_tasks.move_to_end(idempotency_key)
+                while len(self._created_tasks) > _MAX_IDEMPOTENCY_KEYS:
+                    self._created_tasks.popitem(last=False)
+        creation.set_result(None)
+
     def _get_tasks_payload(self, tasks: list[LinkupTaskInput]) -> list[dict[str, Any]]:
         payload: list[dict[str, Any]] = []
 
@@ -1744,18 +3479,254 @@ class LinkupClient:
             f"The Linkup API returned an unsupported task type '{task_type}'."
         )
 
-    def _parse_research_tasks_page(self, response_data: dict[str, Any]) -> LinkupResearchTasksPage:
+    def _parse_research_tasks_page(
+        self, response_data: dict[str, Any], cached_tasks: dict[str, bytes]
+    ) -> LinkupResearchTasksPage:
         return LinkupResearchTasksPage.model_validate(
             {
                 **response_data,
-                "data": [self._parse_research_task(task) for task in response_data["data"]],
+                "data": [
+                    self._parse_listed_task(
+                        f"/research/{task_data['id']}",
+                        task_data,
+                        parse=self._parse_research_task,
+                        cached_tasks=cached_tasks,
+                    )
+                    for task_data in response_data["data"]
+                ],
             }
         )
 
-    def _parse_tasks_page(self, response_data: dict[str, Any]) -> LinkupTasksPage:
+    def _parse_tasks_page(
+        self, response_data: dict[str, Any], cached_tasks: dict[str, bytes]
+    ) -> LinkupTasksPage:
         return LinkupTasksPage.model_validate(
             {
                 **response_data,
-                "data": [self._parse_task(task) for task in response_data["data"]],
+                "data": [
+                    self._parse_listed_task(
+                        f"/tasks/{task_data['id']}",
+                        task_data,
+                        parse=self._parse_task,
+                        cached_tasks=cached_tasks,
+                    )
+                    for task_data in response_data["data"]
+                ],
             }
         )
+
+    def _parse_listed_task(
+        self,
+        url: str,
+        task_data: dict[str, Any],
+        parse: Callable[[dict[str, Any]], LinkupTask],
+        cached_tasks: dict[str, bytes],
+    ) -> LinkupTask:
+        # Known completed and failed tasks are reused, and newly listed ones are cached
+        if self._task_cache is None or task_data["status"] not in _TERMINAL_STATUSES:
+            return parse(task_data)
+        task = self._parsed_responses.get(url)
+        if task is None:
+            task = parse(task_data)
+            content = json.dumps(task_data).encode()
+            self._parsed_responses.set(url, content, task)
+            cached_tasks[url] = content
+        return task
+
+    def _cache_tasks(self, cached_tasks: dict[str, bytes]) -> None:
+        if self._task_cache is not None:
+            for url, content in cached_tasks.items():
+                self._task_cache.set(url, content)
+
+    async def _async_cache_tasks(self, cached_tasks: dict[str, bytes]) -> None:
+        if self._task_cache is not None:
+            for url, content in cached_tasks.items():
+                await self._task_cache.async_set(url, content)
+
+    def _parse_cached_content(
+        self,
+        key: str,
+        content: bytes,
+        parse: Callable[[dict[str, Any]], Any],
+    ) -> Any:  # noqa: ANN401
+        parsed = self._parsed_responses.get(key, content)
+        if parsed is None:
+            parsed = parse(json.loads(content))
+            self._parsed_responses.set(key, content, parsed)
+        return parsed
+
+
+_T = TypeVar("_T")
+_TaskT = TypeVar("_TaskT", LinkupSearchTask, LinkupFetchTask, LinkupResearchTask)
+
+# Statuses of the tasks which don't change anymore
+_TERMINAL_STATUSES = ("completed", "failed")
+
+# Request parameters on which the price of a request depends
+_X402_PRICE_PARAMS = ("depth", "mode", "reasoningDepth", "renderJs")
+
+# Number of idempotency keys for which the created tasks are kept, in least recently used order
+_MAX_IDEMPOTENCY_KEYS = 10_000
+
+# Monotonic time at which the budget set with LinkupClient.deadline is spent
+_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "linkup_deadline", default=None
+)
+
+
+def _get_deadline_timeout(timeout: float | None) -> float | None:
+    deadline = _deadline.get()
+    if deadline is None:
+        return timeout
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise LinkupTimeoutError(
+            "The deadline was exceeded before the request to the Linkup API could be sent."
+        )
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+def _is_before_deadline(delay: float) -> bool:
+    deadline = _deadline.get()
+    return deadline is None or time.monotonic() + delay < deadline
+
+
+async def _wait_within_deadline(awaitable: Awaitable[_T]) -> _T:
+    # httpx timeouts apply to each read of the response, so the whole request is bounded here
+    deadline = _deadline.get()
+    if deadline is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, timeout=max(0.0, deadline - time.monotonic()))
+    except asyncio.TimeoutError as e:
+        raise LinkupTimeoutError(
+            "The deadline was exceeded while receiving the response of the Linkup API."
+        ) from e
+
+
+# Time to wait for a connection of the pool when warming it up, after which fewer connections are
+# opened
+_WARMUP_POOL_TIMEOUT = 0.1
+
+
+class _ConnectionPoolInfo:
+    """The state of the connection pool of the default transport of an HTTP client."""
+
+    def __init__(
+        self,
+        max_connections: int,
+        max_keepalive_connections: int,
+        connections: int,
+        idle_connections: int,
+        http2_connections: int,
+        active_http2_connections: int,
+        http2_streams: int,
+    ) -> None:
+        self.max_connections: int = max_connections
+        self.max_keepalive_connections: int = max_keepalive_connections
+        self.connections: int = connections
+        self.idle_connections: int = idle_connections
+        self.http2_connections: int = http2_connections
+        self.active_http2_connections: int = active_http2_connections
+        # Requests assigned to HTTP/2 connections, excluding the ones queued for a connection
+        self.http2_streams: int = http2_streams
+
+
+def _get_connection_pool_info(
+    http_client: httpx.Client | httpx.AsyncClient | None,
+) -> _ConnectionPoolInfo | None:
+    # httpx doesn't expose the connection pool of its default transport: its state is read from
+    # httpx and httpcore internals, and is not available for other transports or if they change
+    pool: Any = getattr(getattr(http_client, "_transport", None), "_pool", None)
+    max_connections = getattr(pool, "_max_connections", None)
+    max_keepalive_connections = getattr(pool, "_max_keepalive_connections", None)
+    if not isinstance(max_connections, int) or not isinstance(max_keepalive_connections, int):
+        return None
+    try:
+        # Copied since the pool may be used by other threads meanwhile
+        connections = list(pool.connections)
+        requests = list(pool._requests)  # noqa: SLF001
+        http2_connections = [
+            connection
+            for connection in connections
+            if isinstance(
+                getattr(connection, "_connection", None),
+                (httpcore.HTTP2Connection, httpcore.AsyncHTTP2Connection),
+            )
+        ]
+        http2_streams = sum(
+            1
+            for request in requests
+            if any(request.connection is connection for connection in http2_connections)
+        )
+        idle_connections = sum(1 for connection in connections if connection.is_idle())
+        active_http2_connections = sum(
+            1 for connection in http2_connections if not connection.is_idle()
+        )
+    except AttributeError:
+        return None
+    return _ConnectionPoolInfo(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        connections=len(connections),
+        idle_connections=idle_connections,
+        http2_connections=len(http2_connections),
+        active_http2_connections=active_http2_connections,
+        http2_streams=http2_streams,
+    )
+
+
+# Serialized structured output schemas, reused across calls with the same schema
+_MAX_CACHED_SCHEMAS = 128
+_dict_schemas_lock = threading.Lock()
+_dict_schemas: collections.OrderedDict[int, tuple[dict[str, Any], dict[str, Any], str]] = (
+    collections.OrderedDict()
+)
+
+
+@functools.lru_cache(maxsize=_MAX_CACHED_SCHEMAS)
+def _serialize_model_schema(model: type[pydantic.BaseModel]) -> str:
+    return json.dumps(model.model_json_schema())
+
+
+def _serialize_dict_schema(schema: dict[str, Any]) -> str:
+    # Schemas are cached by identity, and the cached serialization is only reused if the schema
+    # wasn't mutated since, which is cheaper to check than serializing it again
+    with _dict_schemas_lock:
+        cached_schema = _dict_schemas.get(id(schema))
+        if cached_schema is not None and cached_schema[0] is schema and cached_schema[1] == schema:
+            _dict_schemas.move_to_end(id(schema))
+            return cached_schema[2]
+
+    serialized_schema = json.dumps(schema)
+    with _dict_schemas_lock:
+        # The schema itself is kept so that its identifier can't be reused by another object
+        _dict_schemas[id(schema)] = (schema, copy.deepcopy(schema), serialized_schema)
+        _dict_schemas.move_to_end(id(schema))
+        while len(_dict_schemas) > _MAX_CACHED_SCHEMAS:
+            _dict_schemas.popitem(last=False)
+    return serialized_schema
+
+
+def _get_endpoint(url: str) -> str:
+    # e.g. "/tasks/<task_id>" -> "/tasks"
+    return "/" + url.lstrip("/").split("/", 1)[0]
+
+
+def _get_x402_price_key(json: dict[str, Any] | list[dict[str, Any]] | None) -> tuple[object, ...]:
+    # The price of a request, and so its payment requirements, depends on some of its parameters
+    # (e.g. a deep search costs more than a standard one), and on those of each created task
+    payloads = json if isinstance(json, list) else [] if json is None else [json]
+    key: list[object] = []
+    for payload in payloads:
+        params = payload.get("input", payload)
+        key.append((payload.get("type"), *(params.get(name) for name in _X402_PRICE_PARAMS)))
+    return tuple(key)
+
+
+def _is_successful(
+    future: concurrent.futures.Future[httpx.Response] | asyncio.Future[httpx.Response],
+) -> bool:
+    return (
+        not future.cancelled() and future.exception() is None and future.result().status_code == 200
+    )
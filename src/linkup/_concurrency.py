@@ -0,0 +1,179 @@
+"""Adaptive concurrency limiting of requests to the Linkup API."""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextlib
+import math
+import time
+from typing import TYPE_CHECKING, Literal
+
+from ._errors import LinkupTimeoutError, LinkupTooManyRequestsError
+from ._types import LinkupConcurrencyAdjustment
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+
+class LinkupAdaptiveConcurrencyLimiter:
+    """Adaptive limiter of the number of concurrent asynchronous requests to the Linkup API.
+
+    The concurrency limit follows an additive increase / multiplicative decrease (AIMD) scheme:
+    it is increased by increase_step each time a full window of requests (as many requests as the
+    current limit) succeeds with healthy latencies, and multiplied by decrease_factor when a request
+    fails with a LinkupTooManyRequestsError or a LinkupTimeoutError. Requests started before a
+    decrease don't trigger another decrease, so that a burst of failures only cuts the limit once.
+
+    Requests exceeding the limit wait for a slot to be released, in order. The limiter is meant to
+    be used by the coroutines of a single event loop.
+
+    Args:
+        initial_limit: The initial concurrency limit.
+        min_limit: The minimum concurrency limit.
+        max_limit: The maximum concurrency limit.
+        increase_step: The number of slots added to the limit after a healthy window of requests.
+        decrease_factor: The factor applied to the limit when a request fails, between 0 and 1.
+        latency_threshold: The latency above which a successful request is not considered healthy,
+            in seconds. If None, all successful requests are considered healthy.
+        history_size: The number of most recent limit adjustments kept in history.
+
+    Raises:
+        ValueError: If the limits are inconsistent, or if decrease_factor is not between 0 and 1.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        increase_step: int = 1,
+        decrease_factor: float = 0.5,
+        latency_threshold: float | None = None,
+        history_size: int = 100,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+
+        self.min_limit: int = min_limit
+        self.max_limit: int = max_limit
+        self.increase_step: int = increase_step
+        self.decrease_factor: float = decrease_factor
+        self.latency_threshold: float | None = latency_threshold
+
+        self._limit: int = initial_limit
+        self._in_flight: int = 0
+        self._healthy_count: int = 0
+        self._epoch: int = 0
+        self._waiters: collections.deque[asyncio.Future[None]] = collections.deque()
+        self._history: collections.deque[LinkupConcurrencyAdjustment] = collections.deque(
+            maxlen=history_size
+        )
+
+    @property
+    def limit(self) -> int:
+        """The current concurrency limit."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def history(self) -> list[LinkupConcurrencyAdjustment]:
+        """The most recent adjustments of the concurrency limit, from oldest to newest."""
+        return list(self._history)
+
+    @contextlib.asynccontextmanager
+    async def slot(self, timeout: float | None = None) -> AsyncGenerator[None]:
+        """Hold a concurrency slot while running a request, adjusting the limit with its outcome.
+
+        Args:
+            timeout: The maximum time to wait for a slot, in seconds. If None, there is no limit.
+
+        Yields:
+            Nothing, once a slot is available.
+
+        Raises:
+            LinkupTimeoutError: If no slot is available within timeout.
+        """
+        await self._acquire(timeout)
+        epoch = self._epoch
+        start = time.monotonic()
+        try:
+            yield
+        except (LinkupTooManyRequestsError, LinkupTimeoutError) as e:
+            if epoch == self._epoch:
+                reason: Literal["too_many_requests", "timeout"] = (
+                    "too_many_requests" if isinstance(e, LinkupTooManyRequestsError) else "timeout"
+                )
+                self._decrease(reason=reason)
+            raise
+        else:
+            latency = time.monotonic() - start
+            if self.latency_threshold is not None and latency > self.latency_threshold:
+                self._healthy_count = 0
+            else:
+                self._healthy_count += 1
+                if self._healthy_count >= self._limit:
+                    self._increase()
+        finally:
+            self._release()
+
+    async def _acquire(self, timeout: float | None) -> None:
+        if self._in_flight < self._limit and not self._waiters:
+            self._in_flight += 1
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was granted right before the cancellation, give it to another request
+                self._release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            if isinstance(e, asyncio.TimeoutError):
+                raise LinkupTimeoutError(
+                    "No concurrency slot became available before the timeout."
+                ) from e
+            raise
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._wake_up_waiters()
+
+    def _wake_up_waiters(self) -> None:
+        while self._waiters and self._in_flight < self._limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def _increase(self) -> None:
+        self._healthy_count = 0
+        if self._limit < self.max_limit:
+            self._adjust(min(self.max_limit, self._limit + self.increase_step), reason="healthy")
+            self._wake_up_waiters()
+
+    def _decrease(self, reason: Literal["too_many_requests", "timeout"]) -> None:
+        self._healthy_count = 0
+        self._epoch += 1
+        limit = max(self.min_limit, math.floor(self._limit * self.decrease_factor))
+        if limit < self._limit:
+            self._adjust(limit, reason=reason)
+
+    def _adjust(
+        self, limit: int, reason: Literal["healthy", "too_many_requests", "timeout"]
+    ) -> None:
+        self._history.append(
+            LinkupConcurrencyAdjustment(
+                timestamp=time.time(), previous_limit=self._limit, limit=limit, reason=reason
+            )
+        )
+        self._limit = limit
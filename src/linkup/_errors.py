@@ -139,6 +139,16 @@ class LinkupTaskNotFoundError(Exception):
     pass
 
 
+class LinkupCircuitOpenError(Exception):
+    """Circuit open error, raised when a circuit breaker rejects a request to the Linkup API.
+
+    It is raised without sending the request, when the circuit breaker of the client is open for
+    the endpoint after too many consecutive failures.
+    """
+
+    pass
+
+
 class LinkupTimeoutError(Exception):
     """Timeout error, raised when the HTTP request to the Linkup API times out.
 
@@ -0,0 +1,123 @@
+"""Hedging policy for latency-critical requests to the Linkup API."""
+
+from __future__ import annotations
+
+import collections
+import math
+import threading
+
+from ._types import LinkupHedgingStats
+
+
+class LinkupHedgingPolicy:
+    """Policy to send hedged requests, to reduce the tail latency of fast searches.
+
+    When a request eligible to hedging hasn't answered after the hedging delay, a duplicate hedge
+    request is sent, and the first successful response is used. Asynchronous calls cancel the other
+    request, while synchronous calls can't interrupt it: it completes in the background, on a thread
+    of the hedging pool of the client, and its response is discarded. Hedge requests are billed as
+    any other request.
+
+    Synchronous calls send their requests on the max_workers threads of the hedging pool, so that
+    the calling thread can return the first successful response. Requests never wait for a thread
+    of the pool: when all of them are busy, the request is sent on the calling thread without
+    hedging, and no hedge request is sent. Requests without timeout can keep a thread busy for long
+    after losing, so a timeout should be set on hedged calls.
+
+    The hedging delay is either fixed, or a percentile of the latencies recently observed for
+    successful requests, in which case the fixed delay is used until enough latencies are observed.
+
+    A hedging policy can be shared between threads using synchronous calls, coroutines using
+    asynchronous calls, and several clients.
+
+    Args:
+        delay: The fixed delay after which a hedge request is sent, in seconds. Required if
+            percentile is None.
+        percentile: The percentile of the recently observed latencies after which a hedge request
+            is sent, between 0 and 100, e.g. 95.
+        window_size: The number of most recent latencies the percentile is computed on.
+        min_samples: The number of observed latencies required to use the percentile.
+        depths: The search depths for which requests are hedged.
+        max_workers: The number of threads of the hedging pool of each client, i.e. the maximum
+            number of concurrent requests of hedged synchronous calls, including hedge requests and
+            requests which lost.
+
+    Raises:
+        ValueError: If neither delay nor percentile is provided, if percentile is not between 0
+            and 100, or if max_workers is lower than 1.
+    """
+
+    def __init__(
+        self,
+        delay: float | None = None,
+        percentile: float | None = None,
+        window_size: int = 1000,
+        min_samples: int = 20,
+        depths: tuple[str, ...] = ("fast",),
+        max_workers: int = 64,
+    ) -> None:
+        if delay is None and percentile is None:
+            raise ValueError("Either delay or percentile must be provided")
+        if percentile is not None and not 0 < percentile <= 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.delay: float | None = delay
+        self.percentile: float | None = percentile
+        self.min_samples: int = min_samples
+        self.depths: tuple[str, ...] = depths
+        self.max_workers: int = max_workers
+
+        self._lock = threading.Lock()
+        self._latencies: collections.deque[float] = collections.deque(maxlen=window_size)
+        self._requests: int = 0
+        self._hedged_requests: int = 0
+        self._hedge_wins: int = 0
+
+    def get_delay(self) -> float | None:
+        """Get the delay after which a hedge request should be sent.
+
+        Returns:
+            The hedging delay in seconds, or None if not enough latencies were observed yet to
+            compute the percentile and no fixed delay is provided.
+        """
+        with self._lock:
+            if self.percentile is None or len(self._latencies) < self.min_samples:
+                return self.delay
+            latencies = sorted(self._latencies)
+        rank = math.ceil(self.percentile / 100 * len(latencies))
+        return latencies[max(rank, 1) - 1]
+
+    def record(self, latency: float | None, hedged: bool, hedge_won: bool) -> None:
+        """Record the outcome of a request eligible to hedging.
+
+        Args:
+            latency: The latency of the successful response, in seconds, or None if the request
+                failed.
+            hedged: Whether a hedge request was sent.
+            hedge_won: Whether the response of the hedge request was used.
+        """
+        with self._lock:
+            self._requests += 1
+            self._hedged_requests += hedged
+            self._hedge_wins += hedge_won
+            if latency is not None:
+                self._latencies.append(latency)
+
+    def stats(self) -> LinkupHedgingStats:
+        """Get statistics of the hedged requests.
+
+        Returns:
+            The hedging statistics, including the hedge rate and the win rate.
+        """
+        with self._lock:
+            return LinkupHedgingStats(
+                requests=self._requests,
+                hedged_requests=self._hedged_requests,
+                hedge_wins=self._hedge_wins,
+                hedge_rate=self._hedged_requests / self._requests if self._requests else 0.0,
+                win_rate=(
+                    self._hedge_wins / self._hedged_requests if self._hedged_requests else 0.0
+                ),
+            )
@@ -0,0 +1,117 @@
+"""Polling policy for the tasks of the Linkup API."""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._types import LinkupTask
+
+# Rough durations of the tasks, in seconds, by task type and depth, mode or reasoning depth
+_DEFAULT_EXPECTED_DURATIONS: dict[str, float] = {
+    "search": 3.0,
+    "search:fast": 1.0,
+    "search:standard": 3.0,
+    "search:deep": 20.0,
+    "fetch": 3.0,
+    "fetch:pro": 10.0,
+    "research": 60.0,
+    "research:S": 30.0,
+    "research:M": 90.0,
+    "research:L": 240.0,
+    "research:XL": 600.0,
+}
+
+
+class LinkupPollingPolicy:
+    """Policy to poll the tasks of the Linkup API until they are completed or failed.
+
+    Delays between polls start at initial_interval and are multiplied by backoff_factor after each
+    poll, capped to max_interval. Polling a task long before it can be done only wastes requests,
+    so while a task is expected to still be running, the delay is at least half of its remaining
+    expected duration: polls get closer as the expected completion approaches. With jitter, the
+    actual delay is drawn uniformly between half of this value and this value, so that tasks
+    created at the same time are not polled at the same time.
+
+    Expected durations are looked up by task type and variant, as "<type>:<variant>" where the
+    variant is the depth of search tasks (e.g. "search:deep"), the mode of fetch tasks (e.g.
+    "fetch:pro") or the reasoning depth of research tasks (e.g. "research:XL"), then by task type
+    alone (e.g. "research").
+
+    Args:
+        initial_interval: The delay before the first poll of a task, in seconds.
+        max_interval: The maximum delay between two polls of a task, in seconds.
+        backoff_factor: The factor applied to the delay after each poll.
+        jitter: Whether to apply jitter to the delays.
+        expected_durations: The expected durations of the tasks, in seconds, overriding the default
+            ones for the given keys.
+
+    Raises:
+        ValueError: If initial_interval is not positive, if max_interval is lower than
+            initial_interval, or if backoff_factor is lower than 1.
+    """
+
+    def __init__(
+        self,
+        initial_interval: float = 0.5,
+        max_interval: float = 30.0,
+        backoff_factor: float = 1.5,
+        jitter: bool = True,
+        expected_durations: dict[str, float] | None = None,
+    ) -> None:
+        if initial_interval <= 0:
+            raise ValueError("initial_interval must be positive")
+        if max_interval < initial_interval:
+            raise ValueError("max_interval must be at least initial_interval")
+        if backoff_factor < 1:
+            raise ValueError("backoff_factor must be at least 1")
+
+        self.initial_interval: float = initial_interval
+        self.max_interval: float = max_interval
+        self.backoff_factor: float = backoff_factor
+        self.jitter: bool = jitter
+        self.expected_durations: dict[str, float] = {
+            **_DEFAULT_EXPECTED_DURATIONS,
+            **(expected_durations or {}),
+        }
+
+    def get_expected_duration(self, task: LinkupTask) -> float:
+        """Get the expected duration of a task.
+
+        Args:
+            task: The task.
+
+        Returns:
+            The expected duration of the task in seconds, or 0 if it is unknown.
+        """
+        if task.type == "search":
+            variant = task.input.depth
+        elif task.type == "fetch":
+            variant = task.input.mode
+        else:
+            variant = task.input.reasoning_depth
+        expected_duration = self.expected_durations.get(f"{task.type}:{variant}")
+        if expected_duration is None:
+            expected_duration = self.expected_durations.get(task.type, 0.0)
+        return expected_duration
+
+    def get_poll_delay(self, task: LinkupTask, polls: int, elapsed: float) -> float:
+        """Get the delay to wait before polling a pending or processing task.
+
+        Args:
+            task: The last known state of the task.
+            polls: The number of polls of the task so far.
+            elapsed: The time elapsed since the wait for the task started, in seconds.
+
+        Returns:
+            The delay to wait before the next poll, in seconds.
+        """
+        delay = self.initial_interval * self.backoff_factor**polls
+        remaining = self.get_expected_duration(task) - elapsed
+        if remaining > 0:
+            delay = max(delay, remaining / 2)
+        delay = min(self.max_interval, delay)
+        if self.jitter:
+            delay = random.uniform(delay / 2, delay)  # noqa: S311
+        return delay
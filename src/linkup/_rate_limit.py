@@ -0,0 +1,89 @@
+"""Client-side rate limiting of requests to the Linkup API."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+
+
+class LinkupRateLimiter:
+    """Token bucket rate limiter for requests to the Linkup API.
+
+    The bucket holds up to burst tokens and is refilled at rate tokens per second. Each request
+    takes a token, and waits locally for the bucket to be refilled when it is empty, instead of
+    being rejected by the Linkup API. Waiting requests are served in order.
+
+    A rate limiter can be shared between threads using synchronous calls and coroutines using
+    asynchronous calls, between several endpoints, and between several clients.
+
+    Args:
+        rate: The number of requests allowed per second, on average.
+        burst: The maximum number of requests which can be sent at once after an idle period. If
+            None, defaults to rate rounded up.
+
+    Raises:
+        ValueError: If rate is not positive or burst is lower than 1.
+    """
+
+    def __init__(self, rate: float, burst: int | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst is None:
+            burst = math.ceil(rate)
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate: float = rate
+        self.burst: int = burst
+
+        self._lock = threading.Lock()
+        self._tokens: float = burst
+        self._updated_at: float = time.monotonic()
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """Take a token from the bucket, blocking until one is available.
+
+        Args:
+            timeout: The maximum time to wait for a token, in seconds. If None, there is no limit.
+
+        Returns:
+            Whether a token was taken. If no token is available within timeout, none is taken and
+            the call returns immediately.
+        """
+        delay = self._reserve(timeout)
+        if delay is None:
+            return False
+        if delay > 0:
+            time.sleep(delay)
+        return True
+
+    async def async_acquire(self, timeout: float | None = None) -> bool:
+        """Asynchronously take a token from the bucket, waiting until one is available.
+
+        Args:
+            timeout: The maximum time to wait for a token, in seconds. If None, there is no limit.
+
+        Returns:
+            Whether a token was taken. If no token is available within timeout, none is taken and
+            the call returns immediately.
+        """
+        delay = self._reserve(timeout)
+        if delay is None:
+            return False
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return True
+
+    def _reserve(self, timeout: float | None) -> float | None:
+        # Tokens can go negative, which reserves future tokens for the waiting requests in order
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            delay = max(0.0, (1 - self._tokens) / self.rate)
+            if timeout is not None and delay > timeout:
+                return None
+            self._tokens -= 1
+            return delay
@@ -0,0 +1,113 @@
+"""Retry policy for requests to the Linkup API."""
+
+from __future__ import annotations
+
+import datetime as dt
+import email.utils
+import random
+
+import httpx
+
+from ._errors import LinkupTimeoutError, LinkupTooManyRequestsError
+
+
+class LinkupRetryPolicy:
+    """Policy to automatically retry failed requests to the Linkup API.
+
+    Delays between attempts follow an exponential backoff: the delay before the n-th retry is
+    backoff_base * 2 ** (n - 1) seconds, capped to backoff_cap. With full jitter, the actual delay
+    is drawn uniformly between 0 and this value, so that clients failing at the same time don't
+    retry at the same time.
+
+    Args:
+        max_attempts: The maximum number of attempts for a request, including the first one.
+        backoff_base: The base delay of the exponential backoff, in seconds.
+        backoff_cap: The maximum delay between two attempts, in seconds.
+        jitter: Whether to apply full jitter to the backoff delays.
+        retry_on: The errors which should trigger a retry. Errors are matched with isinstance, so
+            the Linkup errors (e.g. LinkupTooManyRequestsError) or httpx errors (e.g.
+            httpx.TransportError) can be used.
+        retry_status_codes: The HTTP status codes which should trigger a retry, whatever the error
+            they are raised as.
+        respect_retry_after: Whether to wait at least as long as the Retry-After header of the
+            failed response, when provided. If it asks to wait longer than backoff_cap, the request
+            is not retried.
+
+    Raises:
+        ValueError: If max_attempts is lower than 1.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30.0,
+        jitter: bool = True,
+        retry_on: tuple[type[Exception], ...] = (
+            LinkupTooManyRequestsError,
+            LinkupTimeoutError,
+            httpx.TransportError,
+        ),
+        retry_status_codes: tuple[int, ...] = (500, 502, 503, 504),
+        respect_retry_after: bool = True,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts: int = max_attempts
+        self.backoff_base: float = backoff_base
+        self.backoff_cap: float = backoff_cap
+        self.jitter: bool = jitter
+        self.retry_on: tuple[type[Exception], ...] = retry_on
+        self.retry_status_codes: tuple[int, ...] = retry_status_codes
+        self.respect_retry_after: bool = respect_retry_after
+
+    def get_retry_delay(
+        self, attempt: int, error: Exception, response: httpx.Response | None
+    ) -> float | None:
+        """Get the delay to wait before retrying a failed attempt.
+
+        Args:
+            attempt: The number of the failed attempt, starting at 1.
+            error: The error raised by the failed attempt.
+            response: The response of the failed attempt, if any.
+
+        Returns:
+            The delay to wait before the next attempt in seconds, or None if the request should not
+            be retried.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if not isinstance(error, self.retry_on) and (
+            response is None or response.status_code not in self.retry_status_codes
+        ):
+            return None
+
+        delay = min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)  # noqa: S311
+
+        if self.respect_retry_after and response is not None:
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                if retry_after > self.backoff_cap:
+                    return None
+                delay = max(delay, retry_after)
+
+        return delay
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_date.tzinfo is None:
+        retry_date = retry_date.replace(tzinfo=dt.timezone.utc)
+    return max(0.0, (retry_date - dt.datetime.now(dt.timezone.utc)).total_seconds())
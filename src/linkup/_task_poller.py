@@ -0,0 +1,229 @@
+"""Bulk polling of the tasks of the Linkup API."""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import datetime as dt
+from typing import TYPE_CHECKING
+
+from ._client import _TERMINAL_STATUSES
+
+if TYPE_CHECKING:
+    from ._client import LinkupClient
+    from ._types import LinkupTask, LinkupTasksPage
+
+
+class LinkupTaskPoller:
+    """Poller refreshing many tasks of the Linkup API with a few list_tasks requests.
+
+    Polling tasks one get_task at a time costs one request per task and per polling round. Instead,
+    each round lists the completed and failed tasks from the most recently updated, page by page,
+    and stops as soon as it reaches tasks updated before the previous round: a round costs about
+    one request per page_size tasks completed since the previous round, whatever the number of
+    tracked tasks.
+
+    A round lists at most max_pages pages. When more tasks were completed since the previous
+    round, the tracked tasks which could not be found are stragglers: up to max_stragglers of them,
+    the least recently checked first, are retrieved with get_task, and the next round lists the
+    tasks from the same point again.
+
+    A poller is meant to be used by a single thread or coroutine at a time.
+
+    Args:
+        client: The Linkup client used to send the requests.
+        tasks: The tasks to track, e.g. as returned by create_tasks. Other tasks can be added with
+            add.
+        page_size: The number of tasks per page of list_tasks.
+        max_pages: The maximum number of pages listed in a round.
+        max_stragglers: The maximum number of tasks retrieved with get_task in a round.
+        overlap: The margin applied to the update time of the previous round, in seconds, so that
+            tasks whose update becomes visible late are not missed.
+
+    Raises:
+        ValueError: If page_size, max_pages or max_stragglers is lower than 1, or if overlap is
+            negative.
+    """
+
+    def __init__(
+        self,
+        client: LinkupClient,
+        tasks: list[LinkupTask] | None = None,
+        page_size: int = 100,
+        max_pages: int = 10,
+        max_stragglers: int = 50,
+        overlap: float = 5.0,
+    ) -> None:
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if max_pages < 1:
+            raise ValueError("max_pages must be at least 1")
+        if max_stragglers < 1:
+            raise ValueError("max_stragglers must be at least 1")
+        if overlap < 0:
+            raise ValueError("overlap must not be negative")
+
+        self.page_size: int = page_size
+        self.max_pages: int = max_pages
+        self.max_stragglers: int = max_stragglers
+        self.overlap: float = overlap
+
+        self._client: LinkupClient = client
+        # Tracked tasks which are not completed or failed, from the least recently checked
+        self._pending: collections.OrderedDict[str, LinkupTask] = collections.OrderedDict()
+        # Update time from which the completed and failed tasks have not been listed yet
+        self._watermark: dt.datetime | None = None
+        self.add(tasks or [])
+
+    @property
+    def pending_ids(self) -> list[str]:
+        """The identifiers of the tracked tasks which are not completed or failed yet."""
+        return list(self._pending)
+
+    def add(self, tasks: list[LinkupTask]) -> None:
+        """Start tracking tasks.
+
+        Tasks which are already completed or failed are ignored.
+
+        Args:
+            tasks: The tasks to track.
+        """
+        for task in tasks:
+            if task.status in _TERMINAL_STATUSES or task.id in self._pending:
+                continue
+            self._pending[task.id] = task
+            # A task can't be updated before it is created
+            created_at = _parse_timestamp(task.created_at)
+            if self._watermark is None or created_at < self._watermark:
+                self._watermark = created_at
+
+    def poll(self, timeout: float | None = None) -> list[LinkupTask]:
+        """Run a polling round, refreshing the tracked tasks.
+
+        Args:
+            timeout: The timeout for each HTTP request, in seconds. If None, the requests will have
+                no timeout.
+
+        Returns:
+            The tracked tasks which were completed or failed since the previous round. They are not
+            tracked anymore.
+
+        Raises:
+            LinkupAuthenticationError: If the Linkup API key is invalid.
+            LinkupTimeoutError: If a request times out.
+        """
+        done: list[LinkupTask] = []
+        if not self._pending:
+            return done
+
+        round_watermark = None
+        page = 1
+        while True:
+            tasks_page = self._client.list_tasks(
+                page=page,
+                page_size=self.page_size,
+                sort_by="updatedAt",
+                sort_direction="desc",
+                status=["completed", "failed"],
+                timeout=timeout,
+            )
+            if page == 1 and tasks_page.data:
+                round_watermark = _parse_timestamp(tasks_page.data[0].updated_at)
+            if self._process_page(tasks_page, done=done):
+                self._advance_watermark(round_watermark)
+                return done
+            if page >= self.max_pages:
+                break
+            page += 1
+
+        for task_id in self._get_stragglers():
+            self._process_straggler(self._client.get_task(task_id, timeout=timeout), done=done)
+        return done
+
+    async def async_poll(self, timeout: float | None = None) -> list[LinkupTask]:
+        """Asynchronously run a polling round, refreshing the tracked tasks.
+
+        Args:
+            timeout: The timeout for each HTTP request, in seconds. If None, the requests will have
+                no timeout.
+
+        Returns:
+            The tracked tasks which were completed or failed since the previous round. They are not
+            tracked anymore.
+
+        Raises:
+            LinkupAuthenticationError: If the Linkup API key is invalid.
+            LinkupTimeoutError: If a request times out.
+        """
+        done: list[LinkupTask] = []
+        if not self._pending:
+            return done
+
+        round_watermark = None
+        page = 1
+        while True:
+            tasks_page = await self._client.async_list_tasks(
+                page=page,
+                page_size=self.page_size,
+                sort_by="updatedAt",
+                sort_direction="desc",
+                status=["completed", "failed"],
+                timeout=timeout,
+            )
+            if page == 1 and tasks_page.data:
+                round_watermark = _parse_timestamp(tasks_page.data[0].updated_at)
+            if self._process_page(tasks_page, done=done):
+                self._advance_watermark(round_watermark)
+                return done
+            if page >= self.max_pages:
+                break
+            page += 1
+
+        stragglers = await asyncio.gather(
+            *(
+                self._client.async_get_task(task_id, timeout=timeout)
+                for task_id in self._get_stragglers()
+            )
+        )
+        for task in stragglers:
+            self._process_straggler(task, done=done)
+        return done
+
+    def _process_page(self, tasks_page: LinkupTasksPage, done: list[LinkupTask]) -> bool:
+        threshold = None
+        if self._watermark is not None:
+            threshold = self._watermark - dt.timedelta(seconds=self.overlap)
+        for task in tasks_page.data:
+            if threshold is not None and _parse_timestamp(task.updated_at) < threshold:
+                return True
+            if self._pending.pop(task.id, None) is not None:
+                done.append(task)
+        # The round can stop once no tracked task is left or all the tasks were listed
+        return not self._pending or tasks_page.metadata.page >= tasks_page.metadata.total_pages
+
+    def _advance_watermark(self, round_watermark: dt.datetime | None) -> None:
+        if round_watermark is not None and (
+            self._watermark is None or round_watermark > self._watermark
+        ):
+            self._watermark = round_watermark
+
+    def _get_stragglers(self) -> list[str]:
+        return list(self._pending)[: self.max_stragglers]
+
+    def _process_straggler(self, task: LinkupTask, done: list[LinkupTask]) -> None:
+        if task.id not in self._pending:
+            return
+        if task.status in _TERMINAL_STATUSES:
+            del self._pending[task.id]
+            done.append(task)
+        else:
+            self._pending[task.id] = task
+            self._pending.move_to_end(task.id)
+
+
+def _parse_timestamp(timestamp: str) -> dt.datetime:
+    # e.g. "2026-05-18T00:00:00.000Z", which datetime.fromisoformat only supports from Python 3.11
+    parsed = dt.datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt.timezone.utc)
+    return parsed
@@ -383,3 +383,132 @@ class LinkupTasksPage(_LinkupBaseModel):
     data: list[LinkupTask]
     metadata: LinkupTaskMetadata
     quota: LinkupTaskQuota
+
+
+class LinkupPoolStats(_LinkupBaseModel):
+    """Statistics about the HTTP connection pools of a Linkup client.
+
+    Attributes:
+        http2: Whether HTTP/2 is enabled for the client connections.
+        connections: The number of connections currently open.
+        http2_connections: The number of open connections using HTTP/2.
+        idle_connections: The number of open connections without any request in flight.
+        requests_in_flight: The number of requests currently in flight, synchronous and
+            asynchronous, including the ones waiting for a connection.
+        max_requests_in_flight: The highest number of requests simultaneously in flight so far.
+        streams_per_connection: The average number of requests sent over each active (non-idle)
+            HTTP/2 connection, excluding the requests waiting for a connection, or 0.0 without any
+            active HTTP/2 connection. Above 1, requests are multiplexed.
+    """
+
+    http2: bool
+    connections: int
+    http2_connections: int
+    idle_connections: int
+    requests_in_flight: int
+    max_requests_in_flight: int
+    streams_per_connection: float
+
+
+class LinkupConcurrencyAdjustment(_LinkupBaseModel):
+    """An adjustment of the concurrency limit of an adaptive concurrency limiter.
+
+    Attributes:
+        timestamp: The time of the adjustment, as a Unix timestamp in seconds.
+        previous_limit: The concurrency limit before the adjustment.
+        limit: The concurrency limit after the adjustment.
+        reason: The reason of the adjustment: "healthy" when a full window of requests succeeded
+            with healthy latencies, "too_many_requests" or "timeout" when a request failed.
+    """
+
+    timestamp: float
+    previous_limit: int
+    limit: int
+    reason: Literal["healthy", "too_many_requests", "timeout"]
+
+
+class LinkupCircuitStateChange(_LinkupBaseModel):
+    """A state change of a circuit breaker for an endpoint of the Linkup API.
+
+    Attributes:
+        endpoint: The endpoint of the circuit, e.g. "/search".
+        previous_state: The state of the circuit before the change.
+        state: The state of the circuit after the change.
+        timestamp: The time of the change, as a Unix timestamp in seconds.
+    """
+
+    endpoint: str
+    previous_state: Literal["closed", "open", "half_open"]
+    state: Literal["closed", "open", "half_open"]
+    timestamp: float
+
+
+class LinkupHedgingStats(_LinkupBaseModel):
+    """Statistics of the hedged requests sent with a hedging policy.
+
+    Attributes:
+        requests: The number of requests eligible to hedging.
+        hedged_requests: The number of requests for which a hedge request was sent.
+        hedge_wins: The number of hedged requests for which the hedge request answered first.
+        hedge_rate: The share of requests for which a hedge request was sent.
+        win_rate: The share of hedged requests for which the hedge request answered first.
+    """
+
+    requests: int
+    hedged_requests: int
+    hedge_wins: int
+    hedge_rate: float
+    win_rate: float
+
+
+class LinkupX402PaymentStats(_LinkupBaseModel):
+    """Statistics of the pre-emptive x402 payments sent by a client.
+
+    Attributes:
+        hits: The number of requests for which a pre-emptive payment, signed with the cached payment
+            requirements of the endpoint, was accepted.
+        misses: The number of requests which went through the 402 payment required round trip,
+            because no payment requirements were cached for the endpoint, or because they changed.
+        cached_endpoints: The number of endpoints and kinds of requests (e.g. search depths) for
+            which payment requirements are cached.
+    """
+
+    hits: int
+    misses: int
+    cached_endpoints: int
+
+
+class LinkupCacheStats(_LinkupBaseModel):
+    """Statistics of a cache of Linkup API responses.
+
+    Attributes:
+        hits: The number of lookups which found a fresh entry.
+        misses: The number of lookups which found no entry, or an expired one.
+        stale_hits: The number of lookups which found an expired entry which could still be served
+            according to a LinkupStalePolicy.
+        evictions: The number of entries evicted to respect the size bound of the cache.
+        entries: The number of entries currently in the cache.
+        size_bytes: The current size of the entries in the cache, in bytes.
+    """
+
+    hits: int
+    misses: int
+    stale_hits: int = 0
+    evictions: int
+    entries: int
+    size_bytes: int
+
+
+class LinkupCoalescingStats(_LinkupBaseModel):
+    """Statistics of the coalescing of identical concurrent requests by a client.
+
+    Attributes:
+        calls: The number of calls which could be coalesced, i.e. searches and fetches.
+        coalesced_calls: The number of calls which shared the request of an identical call already
+            in flight, instead of sending their own.
+        in_flight: The number of distinct requests currently in flight.
+    """
+
+    calls: int
+    coalesced_calls: int
+    in_flight: int
@@ -1,8 +1,9 @@
 """x402 payment protocol support for the Linkup SDK."""
 
-from ._signer import LinkupX402Signer, create_x402_signer
+from ._signer import LinkupX402Signer, create_x402_signer, get_x402_signer
 
 __all__ = [
     "LinkupX402Signer",
     "create_x402_signer",
+    "get_x402_signer",
 ]
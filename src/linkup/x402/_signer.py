@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
@@ -89,3 +90,33 @@ def create_x402_signer(
         ImportError: If the x402 optional dependencies are not installed.
     """
     return _DefaultX402Signer(account=account)
+
+
+_signers: dict[str, _DefaultX402Signer] = {}
+_signers_lock = threading.Lock()
+
+
+def get_x402_signer(
+    account: LocalAccount,
+) -> _DefaultX402Signer:
+    """Get the x402 signer of an account, shared by the whole process.
+
+    Unlike create_x402_signer, the signer is only created on the first call for the account
+    address, and the same instance is returned by later calls. It can be shared between clients,
+    threads using synchronous calls, and coroutines using asynchronous calls.
+
+    Args:
+        account: An eth_account LocalAccount instance used to sign payments.
+
+    Returns:
+        A signer instance that implements the LinkupX402Signer protocol.
+
+    Raises:
+        ImportError: If the x402 optional dependencies are not installed.
+    """
+    address = str(account.address)
+    with _signers_lock:
+        signer = _signers.get(address)
+        if signer is None:
+            signer = _signers[address] = create_x402_signer(account=account)
+        return signer
@@ -0,0 +1,388 @@
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+import linkup
+
+
+def test_memory_cache_get_set() -> None:
+    cache = linkup.MemoryCache()
+
+    assert cache.get("key") is None
+    cache.set("key", b"value")
+    assert cache.get("key") == b"value"
+
+    assert cache.stats() == linkup.CacheStats(
+        hits=1, misses=1, evictions=0, entries=1, size_bytes=5
+    )
+
+
+def test_memory_cache_ttl(mocker: MockerFixture) -> None:
+    monotonic_mock = mocker.patch("time.monotonic", return_value=100.0)
+    cache = linkup.MemoryCache(ttl=10.0)
+
+    cache.set("key", b"value")
+    cache.set("other-key", b"other", ttl=60.0)
+    monotonic_mock.return_value = 110.0
+
+    assert cache.get("key") is None
+    assert cache.get("other-key") == b"other"
+    assert cache.stats().size_bytes == 5
+
+
+def test_memory_cache_lru_eviction() -> None:
+    cache = linkup.MemoryCache(max_bytes=10)
+
+    cache.set("a", b"aaaa")
+    cache.set("b", b"bbbb")
+    cache.get("a")
+    cache.set("c", b"cccc")
+
+    assert cache.get("a") == b"aaaa"
+    assert cache.get("b") is None
+    assert cache.get("c") == b"cccc"
+    assert cache.stats().evictions == 1
+
+
+def test_memory_cache_too_large_entry() -> None:
+    cache = linkup.MemoryCache(max_bytes=10)
+
+    cache.set("a", b"aaaa")
+    cache.set("b", b"b" * 11)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"aaaa"
+    assert cache.stats().evictions == 0
+
+
+def test_memory_cache_delete_and_clear() -> None:
+    cache = linkup.MemoryCache()
+    cache.set("a", b"a")
+    cache.set("b", b"b")
+
+    cache.delete("a")
+    assert cache.get("a") is None
+    cache.clear()
+    assert cache.get("b") is None
+    assert cache.stats().size_bytes == 0
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [({"max_bytes": 0}, "max_bytes must be positive"), ({"ttl": 0}, "ttl must be positive")],
+)
+def test_memory_cache_invalid_parameters(kwargs: dict[str, float], match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        linkup.MemoryCache(**kwargs)  # type: ignore[arg-type]
+
+
+def test_sqlite_cache_get_set(tmp_path: Path) -> None:
+    cache = linkup.SQLiteCache(tmp_path / "cache.db", compress_min_bytes=None)
+
+    assert cache.get("key") is None
+    cache.set("key", b"value")
+    assert cache.get("key") == b"value"
+
+    assert cache.stats() == linkup.CacheStats(
+        hits=1, misses=1, evictions=0, entries=1, size_bytes=5
+    )
+
+
+def test_sqlite_cache_shared_between_instances(tmp_path: Path) -> None:
+    cache = linkup.SQLiteCache(tmp_path / "cache.db")
+    other_cache = linkup.SQLiteCache(tmp_path / "cache.db")
+
+    cache.set("key", b"value")
+
+    assert other_cache.get("key") == b"value"
+    cache.close()
+    other_cache.close()
+
+
+def test_sqlite_cache_compression(tmp_path: Path) -> None:
+    cache = linkup.SQLiteCache(tmp_path / "cache.db", compress_min_bytes=100)
+    value = b"content " * 1000
+
+    cache.set("key", value)
+    cache.set("small-key", b"small")
+
+    assert cache.get("key") == value
+    assert cache.get("small-key") == b"small"
+    assert cache.stats().size_bytes < 1000
+
+
+def test_sqlite_cache_ttl(mocker: MockerFixture, tmp_path: Path) -> None:
+    time_mock = mocker.patch("time.time", return_value=100.0)
+    cache = linkup.SQLiteCache(tmp_path / "cache.db", ttl=10.0)
+
+    cache.set("key", b"value")
+    cache.set("other-key", b"other-value", ttl=60.0)
+    time_mock.return_value = 110.0
+
+    assert cache.get("key") is None
+    assert cache.get("other-key") == b"other-value"
+
+
+def test_sqlite_cache_lru_eviction(mocker: MockerFixture, tmp_path: Path) -> None:
+    time_mock = mocker.patch("time.time", return_value=100.0)
+    cache = linkup.SQLiteCache(tmp_path / "cache.db", max_bytes=10, compress_min_bytes=None)
+
+    cache.set("a", b"aaaa")
+    time_mock.return_value = 101.0
+    cache.set("b", b"bbbb")
+    time_mock.return_value = 102.0
+    cache.get("a")
+    time_mock.return_value = 103.0
+    cache.set("c", b"cccc")
+
+    assert cache.get("a") == b"aaaa"
+    assert cache.get("b") is None
+    assert cache.get("c") == b"cccc"
+    assert cache.stats().evictions == 1
+
+
+def test_sqlite_cache_delete_and_clear(tmp_path: Path) -> None:
+    cache = linkup.SQLiteCache(tmp_path / "cache.db")
+    cache.set("a", b"a")
+    cache.set("b", b"b")
+
+    cache.delete("a")
+    assert cache.get("a") is None
+    cache.clear()
+    assert cache.get("b") is None
+    assert cache.stats().size_bytes == 0
+
+
+def test_sqlite_cache_totals(mocker: MockerFixture, tmp_path: Path) -> None:
+    time_mock = mocker.patch("time.time", return_value=100.0)
+    cache = linkup.SQLiteCache(tmp_path / "cache.db", max_bytes=10, compress_min_bytes=None)
+
+    cache.set("a", b"aaa", ttl=1.0)
+    cache.set("b", b"bbb")
+    cache.set("b", b"bbbb")
+    cache.set("c", b"cc")
+    cache.delete("c")
+    time_mock.return_value = 102.0
+    cache.set("d", b"dddddd")
+
+    stats = cache.stats()
+    assert (stats.entries, stats.size_bytes, stats.evictions) == (2, 10, 0)
+    cache.set("e", b"e")
+    assert cache.stats().evictions == 1
+    assert cache.size_bytes() == 7
+
+
+def test_sqlite_cache_totals_existing_database(tmp_path: Path) -> None:
+    # Database written before the totals were tracked
+    connection = sqlite3.connect(tmp_path / "cache.db")
+    connection.execute(
+        "CREATE TABLE linkup_cache (key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+        "compressed INTEGER NOT NULL, size INTEGER NOT NULL, expires_at REAL NOT NULL, "
+        "accessed_at REAL NOT NULL)"
+    )
+    connection.execute(
+        "INSERT INTO linkup_cache VALUES ('a', x'6161', 0, 2, 1e12, 0), ('b', x'62', 0, 1, 1e12, 0)"
+    )
+    connection.commit()
+    connection.close()
+
+    cache = linkup.SQLiteCache(tmp_path / "cache.db")
+
+    assert cache.stats().entries == 2
+    assert cache.size_bytes() == 3
+    assert cache.get("a") == b"aa"
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [({"max_bytes": 0}, "max_bytes must be positive"), ({"ttl": 0}, "ttl must be positive")],
+)
+def test_sqlite_cache_invalid_parameters(
+    tmp_path: Path, kwargs: dict[str, float], match: str
+) -> None:
+    with pytest.raises(ValueError, match=match):
+        linkup.SQLiteCache(tmp_path / "cache.db", **kwargs)  # type: ignore[arg-type]
+
+
+def test_memory_cache_get_stale(mocker: MockerFixture) -> None:
+    monotonic_mock = mocker.patch("time.monotonic", return_value=100.0)
+    cache = linkup.MemoryCache(ttl=10.0)
+    cache.set("key", b"value")
+
+    assert cache.get_stale("key", max_stale=5.0) == (b"value", 0.0)
+    monotonic_mock.return_value = 113.0
+    assert cache.get_stale("key", max_stale=5.0) == (b"value", 3.0)
+    monotonic_mock.return_value = 116.0
+    assert cache.get_stale("key", max_stale=5.0) is None
+    assert cache.get_stale("key", max_stale=60.0) is None
+
+    assert cache.stats() == linkup.CacheStats(
+        hits=1, misses=2, stale_hits=1, evictions=0, entries=0, size_bytes=0
+    )
+
+
+def test_stale_policy() -> None:
+    stale_policy = linkup.StalePolicy(
+        stale_while_revalidate=10.0, stale_if_error=60.0, depths=["fast"]
+    )
+
+    assert stale_policy.max_stale == 60.0
+    assert stale_policy.applies_to(depth="fast", output_type="searchResults")
+    assert not stale_policy.applies_to(depth="deep", output_type="searchResults")
+    assert stale_policy.can_serve_while_revalidating(5.0)
+    assert not stale_policy.can_serve_while_revalidating(30.0)
+    assert stale_policy.can_serve_on_error(30.0, error=linkup.TimeoutError())
+    assert not stale_policy.can_serve_on_error(30.0, error=linkup.InvalidRequestError())
+    assert not stale_policy.can_serve_on_error(90.0, error=linkup.TimeoutError())
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"stale_while_revalidate": -1}, "stale_while_revalidate must not be negative"),
+        ({"stale_if_error": -1}, "stale_if_error must not be negative"),
+    ],
+)
+def test_stale_policy_invalid_parameters(kwargs: dict[str, float], match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        linkup.StalePolicy(**kwargs)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_async() -> None:
+    cache = linkup.MemoryCache()
+
+    await cache.async_set("key", b"value")
+    assert await cache.async_get("key") == b"value"
+    assert cache.size_bytes() == 5
+    await cache.async_delete("key")
+    assert await cache.async_get("key") is None
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_async(tmp_path: Path) -> None:
+    cache = linkup.SQLiteCache(tmp_path / "cache.db", compress_min_bytes=None)
+
+    await cache.async_set("key", b"value")
+    assert await cache.async_get("key") == b"value"
+    assert cache.size_bytes() == 5
+    await cache.async_delete("key")
+    assert await cache.async_get("key") is None
+
+
+def test_cache_backends() -> None:
+    assert isinstance(linkup.MemoryCache(), linkup.CacheBackend)
+    assert isinstance(
+        linkup.TieredCache(l1=linkup.MemoryCache(), l2=linkup.MemoryCache()), linkup.CacheBackend
+    )
+
+
+def test_tiered_cache(tmp_path: Path) -> None:
+    l1 = linkup.MemoryCache()
+    l2 = linkup.SQLiteCache(tmp_path / "cache.db", compress_min_bytes=None)
+    cache = linkup.TieredCache(l1=l1, l2=l2)
+
+    cache.set("key", b"value")
+    assert l1.get("key") == b"value"
+    assert l2.get("key") == b"value"
+    assert cache.size_bytes() == 10
+
+    l1.clear()
+    assert cache.get("key") == b"value"
+    assert l1.get("key") == b"value"
+
+    cache.delete("key")
+    assert cache.get("key") is None
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_async(tmp_path: Path) -> None:
+    l1 = linkup.MemoryCache()
+    l2 = linkup.SQLiteCache(tmp_path / "cache.db")
+    cache = linkup.TieredCache(l1=l1, l2=l2, promotion_ttl=60.0)
+
+    await cache.async_set("key", b"value")
+    l1.clear()
+    assert await cache.async_get("key") == b"value"
+    assert l1.get("key") == b"value"
+
+    await cache.async_delete("key")
+    assert await cache.async_get("key") is None
+    assert l2.get("key") is None
+
+
+def test_tiered_cache_get_stale(mocker: MockerFixture, tmp_path: Path) -> None:
+    monotonic_mock = mocker.patch("time.monotonic", return_value=100.0)
+    time_mock = mocker.patch("time.time", return_value=1000.0)
+    l1 = linkup.MemoryCache(ttl=10.0)
+    l2 = linkup.SQLiteCache(tmp_path / "cache.db", ttl=10.0)
+    cache = linkup.TieredCache(l1=l1, l2=l2)
+
+    cache.set("key", b"value")
+    assert cache.get_stale("key", max_stale=60.0) == (b"value", 0.0)
+
+    monotonic_mock.return_value = 115.0
+    time_mock.return_value = 1015.0
+    assert cache.get_stale("key", max_stale=60.0) == (b"value", 5.0)
+
+    l2.set("key", b"new value")
+    assert cache.get_stale("key", max_stale=60.0) == (b"new value", 0.0)
+    assert l1.get("key") == b"new value"
+
+
+def test_tiered_cache_get_stale_unsupported_l1(tmp_path: Path) -> None:
+    cache = linkup.TieredCache(
+        l1=linkup.SQLiteCache(tmp_path / "l1.db"), l2=linkup.SQLiteCache(tmp_path / "l2.db")
+    )
+
+    with pytest.raises(TypeError, match="first tier"):
+        cache.get_stale("key", max_stale=60.0)
+
+
+def test_negative_cache(mocker: MockerFixture) -> None:
+    monotonic_mock = mocker.patch("time.monotonic", return_value=100.0)
+    cache = linkup.NegativeCache(
+        ttls={linkup.FetchUnsupportedContentTypeError: 60.0, linkup.FailedFetchError: 10.0}
+    )
+
+    cache.set("file", linkup.FetchUrlIsFileError("file"))
+    cache.set("failed", linkup.FailedFetchError("failed"))
+    cache.set("timeout", linkup.TimeoutError("timeout"))
+    monotonic_mock.return_value = 110.0
+
+    error = cache.get("file")
+    assert isinstance(error, linkup.FetchUrlIsFileError)
+    assert error.args == ("file",)
+    assert cache.get("failed") is None
+    assert cache.get("timeout") is None
+
+
+def test_negative_cache_eviction() -> None:
+    cache = linkup.NegativeCache(max_entries=2)
+
+    cache.set("a", linkup.NoResultError())
+    cache.set("b", linkup.NoResultError())
+    cache.get("a")
+    cache.set("c", linkup.NoResultError())
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    cache.delete("a")
+    assert cache.get("a") is None
+    cache.clear()
+    assert cache.get("c") is None
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"ttls": {linkup.NoResultError: 0}}, "ttls must be positive"),
+        ({"max_entries": 0}, "max_entries must be at least 1"),
+    ],
+)
+def test_negative_cache_invalid_parameters(kwargs: dict[str, Any], match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        linkup.NegativeCache(**kwargs)
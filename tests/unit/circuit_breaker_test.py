@@ -0,0 +1,131 @@
+import httpx
+import pytest
+from httpx import Response
+from pytest_mock import MockerFixture
+
+import linkup
+
+
+def _fail(circuit_breaker: linkup.CircuitBreaker, endpoint: str = "/search") -> None:
+    circuit_breaker.before_request(endpoint)
+    circuit_breaker.record_failure(endpoint, error=linkup.TimeoutError("Timeout"), response=None)
+
+
+def test_circuit_breaker_opens_after_consecutive_failures() -> None:
+    circuit_breaker = linkup.CircuitBreaker(failure_threshold=3)
+
+    _fail(circuit_breaker)
+    _fail(circuit_breaker)
+    circuit_breaker.before_request("/search")
+    circuit_breaker.record_success("/search")
+    _fail(circuit_breaker)
+    _fail(circuit_breaker)
+    assert circuit_breaker.get_state("/search") == "closed"
+
+    _fail(circuit_breaker)
+    assert circuit_breaker.get_state("/search") == "open"
+    assert circuit_breaker.get_state("/fetch") == "closed"
+    with pytest.raises(linkup.CircuitOpenError, match="open for /search"):
+        circuit_breaker.before_request("/search")
+    circuit_breaker.before_request("/fetch")
+
+
+def test_circuit_breaker_half_open(mocker: MockerFixture) -> None:
+    monotonic_mock = mocker.patch("time.monotonic", return_value=100.0)
+    circuit_breaker = linkup.CircuitBreaker(failure_threshold=1, recovery_timeout=10.0)
+
+    _fail(circuit_breaker)
+    monotonic_mock.return_value = 110.0
+    assert circuit_breaker.get_state("/search") == "half_open"
+    circuit_breaker.before_request("/search")
+    with pytest.raises(linkup.CircuitOpenError, match="half-open for /search"):
+        circuit_breaker.before_request("/search")
+
+    circuit_breaker.record_failure(
+        "/search", error=linkup.UnknownError("Error"), response=Response(status_code=503)
+    )
+    assert circuit_breaker.get_state("/search") == "open"
+
+    monotonic_mock.return_value = 120.0
+    circuit_breaker.before_request("/search")
+    circuit_breaker.record_success("/search")
+    assert circuit_breaker.get_state("/search") == "closed"
+
+
+def test_circuit_breaker_expired_trial(mocker: MockerFixture) -> None:
+    monotonic_mock = mocker.patch("time.monotonic", return_value=100.0)
+    circuit_breaker = linkup.CircuitBreaker(failure_threshold=1, recovery_timeout=10.0)
+
+    _fail(circuit_breaker)
+    monotonic_mock.return_value = 110.0
+    circuit_breaker.before_request("/search")
+    monotonic_mock.return_value = 120.0
+    circuit_breaker.before_request("/search")
+
+
+def test_circuit_breaker_non_failure_errors() -> None:
+    circuit_breaker = linkup.CircuitBreaker(failure_threshold=1)
+
+    circuit_breaker.before_request("/search")
+    circuit_breaker.record_failure(
+        "/search",
+        error=linkup.NoResultError("No result"),
+        response=Response(status_code=400),
+    )
+    circuit_breaker.before_request("/search")
+    circuit_breaker.record_failure(
+        "/search", error=httpx.ConnectError("Connection refused"), response=None
+    )
+
+    assert circuit_breaker.get_state("/search") == "open"
+
+
+def test_circuit_breaker_state_change_listeners(mocker: MockerFixture) -> None:
+    monotonic_mock = mocker.patch("time.monotonic", return_value=100.0)
+    events: list[linkup.CircuitStateChange] = []
+    other_events: list[linkup.CircuitStateChange] = []
+    circuit_breaker = linkup.CircuitBreaker(
+        failure_threshold=1, recovery_timeout=10.0, on_state_change=events.append
+    )
+    circuit_breaker.add_listener(other_events.append)
+
+    _fail(circuit_breaker)
+    monotonic_mock.return_value = 110.0
+    circuit_breaker.before_request("/search")
+    circuit_breaker.remove_listener(other_events.append)
+    circuit_breaker.record_success("/search")
+
+    assert [(e.endpoint, e.previous_state, e.state) for e in events] == [
+        ("/search", "closed", "open"),
+        ("/search", "open", "half_open"),
+        ("/search", "half_open", "closed"),
+    ]
+    assert len(other_events) == 2
+
+
+def test_circuit_breaker_failing_listener(caplog: pytest.LogCaptureFixture) -> None:
+    def failing_listener(_: linkup.CircuitStateChange) -> None:
+        raise RuntimeError("Listener failure")
+
+    events: list[linkup.CircuitStateChange] = []
+    circuit_breaker = linkup.CircuitBreaker(failure_threshold=1, on_state_change=failing_listener)
+    circuit_breaker.add_listener(events.append)
+
+    _fail(circuit_breaker)
+
+    assert circuit_breaker.get_state("/search") == "open"
+    assert len(events) == 1
+    assert "Circuit breaker listener" in caplog.text
+    assert "Listener failure" in caplog.text
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"failure_threshold": 0}, "failure_threshold must be at least 1"),
+        ({"half_open_max_calls": 0}, "half_open_max_calls must be at least 1"),
+    ],
+)
+def test_circuit_breaker_invalid_parameters(kwargs: dict[str, int], match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        linkup.CircuitBreaker(**kwargs)  # type: ignore[arg-type]
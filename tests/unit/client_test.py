@@ -1,6 +1,13 @@
+import asyncio
+import concurrent.futures
+import http.server
 import json
+import threading
+import time
+from collections.abc import Generator
 from datetime import date
-from typing import Any, cast
+from pathlib import Path
+from typing import Any, Literal, cast
 from unittest.mock import AsyncMock, MagicMock
 
 import httpx
@@ -609,6 +616,7 @@ test_search_error_parameters = [
         """,
         linkup.UnknownError,
     ),
+    (502, b"<html><body><h1>502 Bad Gateway</h1></body></html>", linkup.UnknownError),
 ]
 
 
@@ -1323,7 +1331,9 @@ def test_create_tasks(mocker: MockerFixture, client: linkup.Client) -> None:
             },
         ],
         timeout=None,
+        headers=mocker.ANY,
     )
+    assert request_mock.call_args.kwargs["headers"]["Idempotency-Key"]
     assert isinstance(tasks_response[0], linkup.SearchTask)
     assert tasks_response[0].input.query == "query"
     assert tasks_response[0].input.structured_output_schema == {"type": "object"}
@@ -1390,6 +1400,7 @@ def test_create_tasks_research_model(mocker: MockerFixture, client: linkup.Clien
             }
         ],
         timeout=None,
+        headers=mocker.ANY,
     )
     assert isinstance(tasks_response[0], linkup.ResearchTask)
     assert tasks_response[0].input.reasoning_depth == "S"
@@ -2077,3 +2088,1927 @@ async def test_402_without_signer_async(
 
     with pytest.raises(linkup.PaymentRequiredError):
         await client.async_search(query="query", depth="standard", output_type="searchResults")
+
+
+def test_client_reuses_connection_pool(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key")
+    init_spy = mocker.spy(httpx.Client, "__init__")
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        return_value=Response(status_code=200, content=b'{"results": []}'),
+    )
+
+    client.search(query="query", depth="fast", output_type="searchResults")
+    client.search(query="query", depth="fast", output_type="searchResults")
+
+    assert init_spy.call_count == 1
+    assert request_mock.call_count == 2
+
+
+def test_client_context_manager_closes_connection_pool(mocker: MockerFixture) -> None:
+    mocker.patch(
+        "httpx.Client.request",
+        return_value=Response(status_code=200, content=b'{"results": []}'),
+    )
+
+    with linkup.Client(api_key="my-key") as client:
+        client.search(query="query", depth="fast", output_type="searchResults")
+        http_client = client._client  # noqa: SLF001
+
+    assert http_client is not None
+    assert http_client.is_closed
+    assert client._client is None  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_async_client_reuses_connection_pool(mocker: MockerFixture) -> None:
+    init_spy = mocker.spy(httpx.AsyncClient, "__init__")
+    request_mock = mocker.patch(
+        "httpx.AsyncClient.request",
+        return_value=Response(status_code=200, content=b'{"results": []}'),
+    )
+
+    async with linkup.Client(api_key="my-key") as client:
+        await client.async_search(query="query", depth="fast", output_type="searchResults")
+        await client.async_search(query="query", depth="fast", output_type="searchResults")
+        async_http_client = client._async_clients[asyncio.get_running_loop()]  # noqa: SLF001
+
+    assert init_spy.call_count == 1
+    assert request_mock.call_count == 2
+    assert async_http_client.is_closed
+    assert not client._async_clients  # noqa: SLF001
+
+
+def test_async_client_connection_pool_per_event_loop(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key")
+    init_spy = mocker.spy(httpx.AsyncClient, "__init__")
+    mocker.patch(
+        "httpx.AsyncClient.request",
+        return_value=Response(status_code=200, content=b'{"results": []}'),
+    )
+    loop = asyncio.new_event_loop()
+    other_loop = asyncio.new_event_loop()
+
+    try:
+        for event_loop in (loop, other_loop, loop, other_loop):
+            event_loop.run_until_complete(
+                client.async_search(query="query", depth="fast", output_type="searchResults")
+            )
+        async_clients = dict(client._async_clients)  # noqa: SLF001
+        loop.run_until_complete(client.aclose())
+
+        assert init_spy.call_count == 2
+        assert async_clients[loop].is_closed
+        assert not async_clients[other_loop].is_closed
+        assert list(client._async_clients) == [other_loop]  # noqa: SLF001
+    finally:
+        other_loop.run_until_complete(client.aclose())
+        loop.close()
+        other_loop.close()
+
+
+def test_client_http2(mocker: MockerFixture) -> None:
+    mocker.patch("importlib.util.find_spec", return_value=mocker.Mock())
+    client = linkup.Client(api_key="my-key", http2=True)
+
+    client_mock = mocker.patch("httpx.Client")
+    client_mock.return_value.request.return_value = Response(
+        status_code=200, content=b'{"results": []}'
+    )
+    client.search(query="query", depth="fast", output_type="searchResults")
+
+    assert client_mock.call_args[1]["http2"] is True
+    assert client.pool_stats().http2 is True
+
+
+def test_client_http2_missing_deps(mocker: MockerFixture) -> None:
+    mocker.patch("importlib.util.find_spec", return_value=None)
+
+    with pytest.raises(ImportError, match="http2 optional dependencies"):
+        linkup.Client(api_key="my-key", http2=True)
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_requests_in_flight(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key")
+    in_flight: list[int] = []
+
+    async def request(*args: Any, **kwargs: Any) -> Response:  # noqa: ANN401
+        in_flight.append(client.pool_stats().requests_in_flight)
+        await asyncio.sleep(0)
+        return Response(status_code=200, content=b'{"results": []}')
+
+    mocker.patch("httpx.AsyncClient.request", side_effect=request)
+
+    await asyncio.gather(
+        *(
+            client.async_search(query="query", depth="fast", output_type="searchResults")
+            for _ in range(3)
+        )
+    )
+
+    pool_stats = client.pool_stats()
+    assert in_flight == [1, 2, 3]
+    assert pool_stats.requests_in_flight == 0
+    assert pool_stats.max_requests_in_flight == 3
+    assert pool_stats.connections == 0
+    assert pool_stats.streams_per_connection == 0.0
+
+
+def test_client_transport() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> Response:
+        requests.append(request)
+        return Response(status_code=200, content=b'{"results": []}')
+
+    client = linkup.Client(api_key="my-key", transport=httpx.MockTransport(handler))
+    search_response = client.search(query="query", depth="fast", output_type="searchResults")
+
+    assert search_response == linkup.SearchResults(results=[])
+    assert len(requests) == 1
+    assert requests[0].url == "https://api.linkup.so/v1/search"
+    assert requests[0].headers["Authorization"] == "Bearer my-key"
+
+
+@pytest.mark.asyncio
+async def test_async_client_transport() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> Response:
+        requests.append(request)
+        return Response(status_code=200, content=b'{"results": []}')
+
+    client = linkup.Client(api_key="my-key", async_transport=httpx.MockTransport(handler))
+    search_response = await client.async_search(
+        query="query", depth="fast", output_type="searchResults"
+    )
+
+    assert search_response == linkup.SearchResults(results=[])
+    assert len(requests) == 1
+    assert requests[0].url == "https://api.linkup.so/v1/search"
+
+
+def test_client_user_provided_http_client() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> Response:
+        requests.append(request)
+        return Response(status_code=200, content=b'{"results": []}')
+
+    http_client = httpx.Client(
+        transport=httpx.MockTransport(handler), headers={"X-Custom": "custom"}
+    )
+    with linkup.Client(api_key="my-key", http_client=http_client) as client:
+        client.search(query="query", depth="fast", output_type="searchResults")
+
+    assert not http_client.is_closed
+    assert len(requests) == 1
+    assert requests[0].url == "https://api.linkup.so/v1/search"
+    assert requests[0].headers["Authorization"] == "Bearer my-key"
+    assert requests[0].headers["X-Custom"] == "custom"
+    http_client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_user_provided_http_client() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> Response:
+        requests.append(request)
+        return Response(status_code=200, content=b'{"results": []}')
+
+    async_http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with linkup.Client(api_key="my-key", async_http_client=async_http_client) as client:
+        await client.async_search(query="query", depth="fast", output_type="searchResults")
+
+    assert not async_http_client.is_closed
+    assert len(requests) == 1
+    assert requests[0].url == "https://api.linkup.so/v1/search"
+    assert requests[0].headers["Authorization"] == "Bearer my-key"
+    await async_http_client.aclose()
+
+
+def test_client_both_http_client_and_transport_raises() -> None:
+    with pytest.raises(ValueError, match="Cannot provide both http_client and transport"):
+        linkup.Client(
+            api_key="my-key",
+            http_client=httpx.Client(),
+            transport=httpx.MockTransport(lambda _: Response(status_code=200)),
+        )
+
+
+def test_warmup() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> Response:
+        requests.append(request)
+        return Response(status_code=404)
+
+    client = linkup.Client(api_key="my-key", transport=httpx.MockTransport(handler))
+    client.warmup(n_connections=3)
+
+    assert len(requests) == 3
+    assert all(request.method == "HEAD" for request in requests)
+    assert all(request.url == "https://api.linkup.so/v1/" for request in requests)
+
+
+class _LocalHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self) -> None:
+        self.send_response(404)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self) -> None:
+        # A search response trickled byte by byte, each byte well within the read timeout
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = b'{"results": []}'
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            for byte in body:
+                self.wfile.write(bytes([byte]))
+                self.wfile.flush()
+                time.sleep(0.05)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+@pytest.fixture
+def local_server_url() -> Generator[str]:
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _LocalHandler)
+    # Wait for the handlers on close, so that none of them sleeps while another test patches sleep
+    server.daemon_threads = False
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_warmup_local_server(local_server_url: str) -> None:
+    with linkup.Client(api_key="my-key", base_url=local_server_url) as client:
+        client.warmup(n_connections=5)
+
+        assert client.pool_stats().connections == 5
+        assert client.pool_stats().idle_connections == 5
+
+
+def test_warmup_keepalive_limit(local_server_url: str) -> None:
+    with linkup.Client(
+        api_key="my-key",
+        base_url=local_server_url,
+        limits=httpx.Limits(max_keepalive_connections=2),
+    ) as client:
+        client.warmup(n_connections=5)
+
+        assert client.pool_stats().connections == 2
+
+
+def test_warmup_http_client_connection_limit(local_server_url: str) -> None:
+    with (
+        httpx.Client(limits=httpx.Limits(max_connections=2)) as http_client,
+        linkup.Client(
+            api_key="my-key", base_url=local_server_url, http_client=http_client
+        ) as client,
+    ):
+        client.warmup(n_connections=3)
+
+        assert client.pool_stats().connections == 2
+
+
+class _CountingTransport(httpx.BaseTransport):
+    def __init__(self, transport: httpx.BaseTransport) -> None:
+        self.transport = transport
+        self.n_requests = 0
+
+    def handle_request(self, request: httpx.Request) -> Response:
+        response = self.transport.handle_request(request)
+        self.n_requests += 1
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+def test_warmup_http_client_unknown_connection_limit(local_server_url: str) -> None:
+    transport = _CountingTransport(httpx.HTTPTransport(limits=httpx.Limits(max_connections=2)))
+    with (
+        httpx.Client(transport=transport) as http_client,
+        linkup.Client(
+            api_key="my-key", base_url=local_server_url, http_client=http_client
+        ) as client,
+    ):
+        client.warmup(n_connections=3)
+
+    assert transport.n_requests == 2
+
+
+def test_warmup_timeout() -> None:
+    def handler(request: httpx.Request) -> Response:
+        raise httpx.ConnectTimeout("timeout", request=request)
+
+    client = linkup.Client(api_key="my-key", transport=httpx.MockTransport(handler))
+
+    with pytest.raises(linkup.TimeoutError):
+        client.warmup(n_connections=2, timeout=1.0)
+
+
+@pytest.mark.asyncio
+async def test_async_warmup() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> Response:
+        requests.append(request)
+        return Response(status_code=404)
+
+    client = linkup.Client(api_key="my-key", async_transport=httpx.MockTransport(handler))
+    await client.async_warmup(n_connections=3)
+
+    assert len(requests) == 3
+    assert all(request.method == "HEAD" for request in requests)
+
+
+@pytest.mark.asyncio
+async def test_async_warmup_local_server(local_server_url: str) -> None:
+    async with linkup.Client(api_key="my-key", base_url=local_server_url) as client:
+        await client.async_warmup(n_connections=5)
+
+        assert client.pool_stats().connections == 5
+        assert client.pool_stats().idle_connections == 5
+
+
+@pytest.mark.asyncio
+async def test_async_warmup_http_client_connection_limit(local_server_url: str) -> None:
+    async with (
+        httpx.AsyncClient(limits=httpx.Limits(max_connections=2)) as async_http_client,
+        linkup.Client(
+            api_key="my-key", base_url=local_server_url, async_http_client=async_http_client
+        ) as client,
+    ):
+        await client.async_warmup(n_connections=3)
+
+        assert client.pool_stats().connections == 2
+
+
+@pytest.mark.asyncio
+async def test_async_warmup_timeout() -> None:
+    def handler(request: httpx.Request) -> Response:
+        raise httpx.ConnectTimeout("timeout", request=request)
+
+    client = linkup.Client(api_key="my-key", async_transport=httpx.MockTransport(handler))
+
+    with pytest.raises(linkup.TimeoutError):
+        await client.async_warmup(n_connections=2, timeout=1.0)
+
+
+def test_pool_stats_http1_queued_requests(local_server_url: str) -> None:
+    with linkup.Client(
+        api_key="my-key", base_url=local_server_url, limits=httpx.Limits(max_connections=1)
+    ) as client:
+        threads = [
+            threading.Thread(
+                target=client.search,
+                kwargs={"query": "query", "depth": "fast", "output_type": "searchResults"},
+            )
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        while client.pool_stats().connections < 1 or client.pool_stats().requests_in_flight < 2:
+            time.sleep(0.001)
+        pool_stats = client.pool_stats()
+        for thread in threads:
+            thread.join()
+
+    assert pool_stats.connections == 1
+    assert pool_stats.http2_connections == 0
+    assert pool_stats.streams_per_connection == 0.0
+
+
+_429_BODY = b'{"error": {"code": "TOO_MANY_REQUESTS", "message": "Slow down", "details": []}}'
+
+
+def test_retry_policy(mocker: MockerFixture) -> None:
+    client = linkup.Client(
+        api_key="my-key", retry_policy=linkup.RetryPolicy(max_attempts=3, backoff_base=0.1)
+    )
+    sleep_mock = mocker.patch("time.sleep")
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        side_effect=[
+            Response(status_code=429, content=_429_BODY, headers={"Retry-After": "1"}),
+            httpx.ConnectError("connection failed"),
+            Response(status_code=200, content=b'{"results": []}'),
+        ],
+    )
+
+    search_response = client.search(query="query", depth="fast", output_type="searchResults")
+
+    assert search_response == linkup.SearchResults(results=[])
+    assert request_mock.call_count == 3
+    assert sleep_mock.call_count == 2
+    assert sleep_mock.call_args_list[0].args[0] == 1.0
+
+
+def test_retry_policy_max_attempts(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key", retry_policy=linkup.RetryPolicy(max_attempts=2))
+    mocker.patch("time.sleep")
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        return_value=Response(status_code=500, content=_500_BODY),
+    )
+
+    with pytest.raises(linkup.UnknownError):
+        client.search(query="query", depth="fast", output_type="searchResults")
+    assert request_mock.call_count == 2
+
+
+def test_retry_policy_non_retryable_error(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key", retry_policy=linkup.RetryPolicy())
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        return_value=Response(
+            status_code=400,
+            content=b'{"error": {"code": "SEARCH_QUERY_NO_RESULT", "message": "", "details": []}}',
+        ),
+    )
+
+    with pytest.raises(linkup.NoResultError):
+        client.search(query="query", depth="fast", output_type="searchResults")
+    assert request_mock.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_async_retry_policy(mocker: MockerFixture) -> None:
+    client = linkup.Client(
+        api_key="my-key", retry_policy=linkup.RetryPolicy(max_attempts=3, backoff_base=0.1)
+    )
+    sleep_mock = mocker.patch("asyncio.sleep")
+    request_mock = mocker.patch(
+        "httpx.AsyncClient.request",
+        side_effect=[
+            httpx.ReadTimeout("timeout"),
+            Response(status_code=503, content=b"Service Unavailable"),
+            Response(status_code=200, content=b'{"results": []}'),
+        ],
+    )
+
+    search_response = await client.async_search(
+        query="query", depth="fast", output_type="searchResults"
+    )
+
+    assert search_response == linkup.SearchResults(results=[])
+    assert request_mock.call_count == 3
+    assert sleep_mock.call_count == 2
+
+
+def test_rate_limits(mocker: MockerFixture) -> None:
+    search_rate_limiter = MagicMock(spec=linkup.RateLimiter)
+    client = linkup.Client(api_key="my-key", rate_limits={"/search": search_rate_limiter})
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        return_value=Response(
+            status_code=200, content=b'{"results": [], "markdown": "", "favicon": ""}'
+        ),
+    )
+
+    client.search(query="query", depth="fast", output_type="searchResults")
+    client.fetch(url="https://example.com")
+
+    assert request_mock.call_count == 2
+    search_rate_limiter.acquire.assert_called_once_with(timeout=None)
+
+
+@pytest.mark.asyncio
+async def test_async_rate_limits(mocker: MockerFixture) -> None:
+    search_rate_limiter = MagicMock(spec=linkup.RateLimiter)
+    search_rate_limiter.async_acquire = AsyncMock()
+    client = linkup.Client(api_key="my-key", rate_limits={"/search": search_rate_limiter})
+    mocker.patch(
+        "httpx.AsyncClient.request",
+        return_value=Response(status_code=200, content=b'{"results": []}'),
+    )
+
+    await client.async_search(query="query", depth="fast", output_type="searchResults")
+
+    search_rate_limiter.async_acquire.assert_awaited_once_with(timeout=None)
+    search_rate_limiter.acquire.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_adaptive_concurrency(mocker: MockerFixture) -> None:
+    limiter = linkup.AdaptiveConcurrencyLimiter(initial_limit=4)
+    client = linkup.Client(api_key="my-key", adaptive_concurrency=limiter)
+    mocker.patch(
+        "httpx.AsyncClient.request",
+        side_effect=[
+            Response(status_code=200, content=b'{"results": []}'),
+            Response(status_code=429, content=_429_BODY),
+        ],
+    )
+
+    await client.async_search(query="query", depth="fast", output_type="searchResults")
+    with pytest.raises(linkup.TooManyRequestsError):
+        await client.async_search(query="query", depth="fast", output_type="searchResults")
+
+    assert limiter.limit == 2
+    assert limiter.in_flight == 0
+    assert [adjustment.reason for adjustment in limiter.history] == ["too_many_requests"]
+
+
+def test_circuit_breaker(mocker: MockerFixture) -> None:
+    circuit_breaker = linkup.CircuitBreaker(failure_threshold=2)
+    client = linkup.Client(api_key="my-key", circuit_breaker=circuit_breaker)
+    request_mock = mocker.patch(
+        "httpx.Client.request", return_value=Response(status_code=500, content=_500_BODY)
+    )
+
+    for _ in range(2):
+        with pytest.raises(linkup.UnknownError):
+            client.search(query="query", depth="fast", output_type="searchResults")
+    with pytest.raises(linkup.CircuitOpenError):
+        client.search(query="query", depth="fast", output_type="searchResults")
+
+    assert request_mock.call_count == 2
+    assert circuit_breaker.get_state("/search") == "open"
+
+
+@pytest.mark.asyncio
+async def test_async_circuit_breaker(mocker: MockerFixture) -> None:
+    circuit_breaker = linkup.CircuitBreaker(failure_threshold=1)
+    client = linkup.Client(api_key="my-key", circuit_breaker=circuit_breaker)
+    request_mock = mocker.patch(
+        "httpx.AsyncClient.request", side_effect=httpx.ReadTimeout("timeout")
+    )
+
+    with pytest.raises(linkup.TimeoutError):
+        await client.async_fetch(url="https://example.com")
+    with pytest.raises(linkup.CircuitOpenError):
+        await client.async_fetch(url="https://example.com")
+
+    assert request_mock.call_count == 1
+    assert circuit_breaker.get_state("/fetch") == "open"
+
+
+def test_hedging_policy(mocker: MockerFixture) -> None:
+    hedging_policy = linkup.HedgingPolicy(delay=0.01)
+    client = linkup.Client(api_key="my-key", hedging_policy=hedging_policy)
+    requests_count = 0
+
+    def request(*args: object, **kwargs: object) -> Response:
+        nonlocal requests_count
+        requests_count += 1
+        if requests_count == 1:
+            time.sleep(0.5)
+        return Response(status_code=200, content=b'{"results": []}')
+
+    mocker.patch("httpx.Client.request", side_effect=request)
+
+    search_response = client.search(query="query", depth="fast", output_type="searchResults")
+
+    assert search_response == linkup.SearchResults(results=[])
+    assert requests_count == 2
+    assert hedging_policy.stats().hedge_wins == 1
+
+
+def test_hedging_policy_busy_pool(mocker: MockerFixture) -> None:
+    hedging_policy = linkup.HedgingPolicy(delay=0.01, max_workers=1)
+    client = linkup.Client(api_key="my-key", hedging_policy=hedging_policy)
+    release = threading.Event()
+    request_threads: list[threading.Thread] = []
+
+    def request(*args: object, **kwargs: object) -> Response:
+        request_threads.append(threading.current_thread())
+        if len(request_threads) == 1:
+            release.wait(timeout=5)
+        return Response(status_code=200, content=b'{"results": []}')
+
+    mocker.patch("httpx.Client.request", side_effect=request)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        slow_search = executor.submit(
+            client.search, query="query", depth="fast", output_type="searchResults"
+        )
+        while not request_threads:
+            time.sleep(0.001)
+        client.search(query="query", depth="fast", output_type="searchResults")
+        release.set()
+        slow_search.result()
+
+    assert len(request_threads) == 2
+    assert request_threads[1] is threading.current_thread()
+    assert hedging_policy.stats().hedged_requests == 0
+
+
+def test_hedging_policy_not_fast_search(mocker: MockerFixture) -> None:
+    hedging_policy = linkup.HedgingPolicy(delay=0.0)
+    client = linkup.Client(api_key="my-key", hedging_policy=hedging_policy)
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        return_value=Response(status_code=200, content=b'{"results": []}'),
+    )
+
+    client.search(query="query", depth="standard", output_type="searchResults")
+
+    assert request_mock.call_count == 1
+    assert hedging_policy.stats().requests == 0
+
+
+@pytest.mark.asyncio
+async def test_async_hedging_policy(mocker: MockerFixture) -> None:
+    hedging_policy = linkup.HedgingPolicy(delay=0.01)
+    client = linkup.Client(api_key="my-key", hedging_policy=hedging_policy)
+    cancelled = asyncio.Event()
+    requests_count = 0
+
+    async def request(*args: object, **kwargs: object) -> Response:
+        nonlocal requests_count
+        requests_count += 1
+        if requests_count == 1:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return Response(status_code=200, content=b'{"results": []}')
+
+    mocker.patch("httpx.AsyncClient.request", side_effect=request)
+
+    search_response = await client.async_search(
+        query="query", depth="fast", output_type="searchResults"
+    )
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    assert search_response == linkup.SearchResults(results=[])
+    assert hedging_policy.stats() == linkup.HedgingStats(
+        requests=1, hedged_requests=1, hedge_wins=1, hedge_rate=1.0, win_rate=1.0
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_hedging_policy_failed_hedge(mocker: MockerFixture) -> None:
+    hedging_policy = linkup.HedgingPolicy(delay=0.01)
+    client = linkup.Client(api_key="my-key", hedging_policy=hedging_policy)
+    requests_count = 0
+
+    async def request(*args: object, **kwargs: object) -> Response:
+        nonlocal requests_count
+        requests_count += 1
+        if requests_count == 1:
+            await asyncio.sleep(0.05)
+            return Response(status_code=200, content=b'{"results": []}')
+        return Response(status_code=500, content=_500_BODY)
+
+    mocker.patch("httpx.AsyncClient.request", side_effect=request)
+
+    search_response = await client.async_search(
+        query="query", depth="fast", output_type="searchResults"
+    )
+
+    assert search_response == linkup.SearchResults(results=[])
+    assert hedging_policy.stats().hedge_wins == 0
+
+
+def test_deadline(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key")
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        return_value=Response(status_code=200, content=b'{"results": []}'),
+    )
+
+    with client.deadline(seconds=2.0):
+        client.search(query="query", depth="fast", output_type="searchResults", timeout=5.0)
+        with client.deadline(seconds=10.0):
+            client.search(query="query", depth="fast", output_type="searchResults")
+    client.search(query="query", depth="fast", output_type="searchResults", timeout=5.0)
+
+    timeouts = [call.kwargs["timeout"] for call in request_mock.call_args_list]
+    assert 0 < timeouts[0] <= 2.0
+    assert 0 < timeouts[1] <= 2.0
+    assert timeouts[2] == 5.0
+
+
+def test_deadline_exceeded(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key")
+    request_mock = mocker.patch("httpx.Client.request")
+
+    with client.deadline(seconds=0.0), pytest.raises(linkup.TimeoutError, match="deadline"):
+        client.search(query="query", depth="fast", output_type="searchResults")
+
+    request_mock.assert_not_called()
+
+
+def test_deadline_exceeded_circuit_breaker(mocker: MockerFixture) -> None:
+    circuit_breaker = linkup.CircuitBreaker(failure_threshold=2)
+    client = linkup.Client(api_key="my-key", circuit_breaker=circuit_breaker)
+    request_mock = mocker.patch("httpx.Client.request")
+
+    for _ in range(2):
+        with client.deadline(seconds=0), pytest.raises(linkup.TimeoutError):
+            client.search(query="query", depth="standard", output_type="searchResults")
+
+    request_mock.assert_not_called()
+    assert circuit_breaker.get_state("/search") == "closed"
+
+
+def test_deadline_slow_response(local_server_url: str) -> None:
+    with linkup.Client(api_key="my-key", base_url=local_server_url) as client:
+        start = time.monotonic()
+        with client.deadline(seconds=0.2), pytest.raises(linkup.TimeoutError):
+            client.search(query="query", depth="standard", output_type="searchResults")
+
+        # The response is only checked once received
+        assert time.monotonic() - start >= 0.5
+
+
+@pytest.mark.asyncio
+async def test_async_deadline_slow_response(local_server_url: str) -> None:
+    async with linkup.Client(api_key="my-key", base_url=local_server_url) as client:
+        start = time.monotonic()
+        with client.deadline(seconds=0.2), pytest.raises(linkup.TimeoutError):
+            await client.async_search(query="query", depth="standard", output_type="searchResults")
+
+        assert time.monotonic() - start < 0.4
+
+
+def test_deadline_retry_backoff(mocker: MockerFixture) -> None:
+    client = linkup.Client(
+        api_key="my-key",
+        retry_policy=linkup.RetryPolicy(max_attempts=3, backoff_base=10.0, jitter=False),
+    )
+    sleep_mock = mocker.patch("time.sleep")
+    request_mock = mocker.patch(
+        "httpx.Client.request", return_value=Response(status_code=503, content=b"Unavailable")
+    )
+
+    with client.deadline(seconds=5.0), pytest.raises(linkup.TimeoutError, match="deadline"):
+        client.search(query="query", depth="fast", output_type="searchResults")
+
+    assert request_mock.call_count == 1
+    sleep_mock.assert_not_called()
+
+
+def test_deadline_hedged_request(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key", hedging_policy=linkup.HedgingPolicy(delay=0.5))
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        return_value=Response(status_code=200, content=b'{"results": []}'),
+    )
+
+    with client.deadline(seconds=1.0):
+        client.search(query="query", depth="fast", output_type="searchResults")
+
+    assert 0 < request_mock.call_args.kwargs["timeout"] <= 1.0
+
+
+def test_deadline_rate_limiter(mocker: MockerFixture) -> None:
+    rate_limiter = linkup.RateLimiter(rate=0.5, burst=1)
+    client = linkup.Client(api_key="my-key", rate_limits={"/search": rate_limiter})
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        return_value=Response(status_code=200, content=b'{"results": []}'),
+    )
+    client.search(query="query", depth="fast", output_type="searchResults")
+
+    start = time.monotonic()
+    with client.deadline(seconds=0.2), pytest.raises(linkup.TimeoutError, match="deadline"):
+        client.search(query="query", depth="fast", output_type="searchResults")
+
+    assert time.monotonic() - start < 0.1
+    request_mock.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_deadline_adaptive_concurrency(mocker: MockerFixture) -> None:
+    circuit_breaker = linkup.CircuitBreaker(failure_threshold=1)
+    client = linkup.Client(
+        api_key="my-key",
+        adaptive_concurrency=linkup.AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1),
+        circuit_breaker=circuit_breaker,
+    )
+    release = asyncio.Event()
+
+    async def request(*args: object, **kwargs: object) -> Response:
+        await release.wait()
+        return Response(status_code=200, content=b'{"results": []}')
+
+    mocker.patch("httpx.AsyncClient.request", side_effect=request)
+    running = asyncio.ensure_future(
+        client.async_search(query="query", depth="fast", output_type="searchResults")
+    )
+    await asyncio.sleep(0.01)
+
+    with client.deadline(seconds=0.05), pytest.raises(linkup.TimeoutError):
+        await client.async_search(query="query", depth="fast", output_type="searchResults")
+    release.set()
+    await running
+
+    # No request was sent, so the circuit breaker didn't record a failure
+    assert circuit_breaker.get_state("/search") == "closed"
+
+
+@pytest.mark.asyncio
+async def test_async_deadline(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key")
+    request_mock = mocker.patch(
+        "httpx.AsyncClient.request",
+        return_value=Response(status_code=200, content=b'{"results": []}'),
+    )
+
+    with client.deadline(seconds=1.0):
+        await asyncio.gather(
+            client.async_search(query="query", depth="fast", output_type="searchResults"),
+            client.async_search(query="query", depth="fast", output_type="searchResults"),
+        )
+
+    assert all(0 < call.kwargs["timeout"] <= 1.0 for call in request_mock.call_args_list)
+
+
+def test_deadline_x402_retry(
+    mocker: MockerFixture,
+    x402_client: linkup.Client,
+    mock_x402_signer: MagicMock,
+) -> None:
+    monotonic_mock = mocker.patch("time.monotonic", return_value=100.0)
+
+    def create_payment_headers(*args: object, **kwargs: object) -> dict[str, str]:
+        monotonic_mock.return_value = 103.0
+        return {"X-Payment": "signed"}
+
+    mock_x402_signer.create_payment_headers.side_effect = create_payment_headers
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        side_effect=[
+            Response(status_code=402, content=_402_BODY, headers={"X-Payment-Required": "true"}),
+            Response(status_code=200, content=b'{"results": []}'),
+        ],
+    )
+
+    with x402_client.deadline(seconds=5.0):
+        x402_client.search(query="query", depth="standard", output_type="searchResults")
+
+    assert [call.kwargs["timeout"] for call in request_mock.call_args_list] == [5.0, 2.0]
+
+
+_CREATED_TASKS_BODY = b"""
+[
+    {
+        "createdAt": "2026-05-18T00:00:00.000Z",
+        "error": null,
+        "id": "bbd897fb-b761-4dd9-bf6a-b41ec52f2de7",
+        "input": {"mode": "answer", "outputType": "sourcedAnswer", "q": "query"},
+        "output": null,
+        "status": "pending",
+        "type": "research",
+        "updatedAt": "2026-05-18T00:00:00.000Z"
+    }
+]
+"""
+
+
+def test_create_tasks_idempotency_key(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key")
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        return_value=Response(status_code=200, content=_CREATED_TASKS_BODY),
+    )
+    task_input = linkup.ResearchTaskInput(query="query", output_type="sourcedAnswer", mode="answer")
+
+    tasks = client.create_tasks([task_input], idempotency_key="batch-1")
+    retried_tasks = client.create_tasks([task_input], idempotency_key="batch-1")
+    client.create_tasks([task_input], idempotency_key="batch-2")
+
+    assert retried_tasks == tasks
+    assert [call.kwargs["headers"]["Idempotency-Key"] for call in request_mock.call_args_list] == [
+        "batch-1",
+        "batch-2",
+    ]
+
+
+def test_create_tasks_idempotency_key_different_tasks(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key")
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        return_value=Response(status_code=200, content=_CREATED_TASKS_BODY),
+    )
+
+    client.create_tasks(
+        [linkup.ResearchTaskInput(query="query", output_type="sourcedAnswer", mode="answer")],
+        idempotency_key="batch-1",
+    )
+    with pytest.raises(ValueError, match="already used for different tasks"):
+        client.create_tasks(
+            [linkup.ResearchTaskInput(query="other", output_type="sourcedAnswer", mode="answer")],
+            idempotency_key="batch-1",
+        )
+    request_mock.assert_called_once()
+
+
+def test_create_tasks_idempotency_key_concurrent(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key")
+    release = threading.Event()
+
+    def request(*args: object, **kwargs: object) -> Response:
+        release.wait(timeout=5)
+        return Response(status_code=200, content=_CREATED_TASKS_BODY)
+
+    request_mock = mocker.patch("httpx.Client.request", side_effect=request)
+    task_input = linkup.ResearchTaskInput(query="query", output_type="sourcedAnswer", mode="answer")
+    created_tasks: list[list[linkup.Task]] = []
+
+    def create_tasks() -> None:
+        created_tasks.append(client.create_tasks([task_input], idempotency_key="batch-1"))
+
+    threads = [threading.Thread(target=create_tasks) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    while request_mock.call_count < 1:
+        time.sleep(0.001)
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    request_mock.assert_called_once()
+    assert created_tasks[0] == created_tasks[1]
+
+
+def test_create_tasks_idempotency_key_concurrent_error(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key")
+    release = threading.Event()
+    responses = iter(
+        [
+            Response(status_code=500, content=b"Internal Server Error"),
+            Response(status_code=200, content=_CREATED_TASKS_BODY),
+        ]
+    )
+
+    def request(*args: object, **kwargs: object) -> Response:
+        release.wait(timeout=5)
+        return next(responses)
+
+    request_mock = mocker.patch("httpx.Client.request", side_effect=request)
+    task_input = linkup.ResearchTaskInput(query="query", output_type="sourcedAnswer", mode="answer")
+    results: list[object] = []
+
+    def create_tasks() -> None:
+        try:
+            results.append(client.create_tasks([task_input], idempotency_key="batch-1"))
+        except linkup.UnknownError as e:
+            results.append(e)
+
+    threads = [threading.Thread(target=create_tasks) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    while request_mock.call_count < 1:
+        time.sleep(0.001)
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    # The waiting call sends its own request once the first one fails
+    assert request_mock.call_count == 2
+    assert isinstance(results[0], linkup.UnknownError)
+    assert isinstance(results[1], list)
+
+
+def test_create_tasks_idempotency_key_retry(mocker: MockerFixture) -> None:
+    client = linkup.Client(
+        api_key="my-key", retry_policy=linkup.RetryPolicy(max_attempts=2, jitter=False)
+    )
+    mocker.patch("time.sleep")
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        side_effect=[
+            httpx.ReadTimeout("timeout"),
+            Response(status_code=200, content=_CREATED_TASKS_BODY),
+        ],
+    )
+
+    client.create_tasks(
+        [linkup.ResearchTaskInput(query="query", output_type="sourcedAnswer", mode="answer")]
+    )
+
+    idempotency_keys = [
+        call.kwargs["headers"]["Idempotency-Key"] for call in request_mock.call_args_list
+    ]
+    assert len(idempotency_keys) == 2
+    assert idempotency_keys[0] == idempotency_keys[1]
+
+
+@pytest.mark.asyncio
+async def test_async_create_tasks_idempotency_key(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key")
+    request_mock = mocker.patch(
+        "httpx.AsyncClient.request",
+        return_value=Response(status_code=200, content=_CREATED_TASKS_BODY),
+    )
+    task_input = linkup.ResearchTaskInput(query="query", output_type="sourcedAnswer", mode="answer")
+
+    tasks = await client.async_create_tasks([task_input], idempotency_key="batch-1")
+    retried_tasks = await client.async_create_tasks([task_input], idempotency_key="batch-1")
+
+    assert retried_tasks == tasks
+    assert tasks[0].id == "bbd897fb-b761-4dd9-bf6a-b41ec52f2de7"
+    request_mock.assert_called_once()
+    assert request_mock.call_args.kwargs["headers"]["Idempotency-Key"] == "batch-1"
+
+
+@pytest.mark.asyncio
+async def test_async_create_tasks_idempotency_key_concurrent(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key")
+
+    async def request(*args: object, **kwargs: object) -> Response:
+        await asyncio.sleep(0.05)
+        return Response(status_code=200, content=_CREATED_TASKS_BODY)
+
+    request_mock = mocker.patch("httpx.AsyncClient.request", side_effect=request)
+    task_input = linkup.ResearchTaskInput(query="query", output_type="sourcedAnswer", mode="answer")
+
+    tasks, other_tasks = await asyncio.gather(
+        client.async_create_tasks([task_input], idempotency_key="batch-1"),
+        client.async_create_tasks([task_input], idempotency_key="batch-1"),
+    )
+
+    request_mock.assert_called_once()
+    assert tasks == other_tasks
+
+
+def test_x402_preemptive_payment(mocker: MockerFixture, mock_x402_signer: MagicMock) -> None:
+    client = linkup.Client(x402_signer=mock_x402_signer, x402_preemptive_payment=True)
+    mock_x402_signer.create_payment_headers.return_value = {"X-Payment": "signed"}
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        side_effect=[
+            Response(status_code=402, content=_402_BODY, headers={"X-Payment-Required": "v1"}),
+            Response(status_code=200, content=b'{"results": []}'),
+            Response(status_code=200, content=b'{"results": []}'),
+        ],
+    )
+
+    client.search(query="query", depth="standard", output_type="searchResults")
+    client.search(query="query", depth="standard", output_type="searchResults")
+
+    assert request_mock.call_count == 3
+    assert request_mock.call_args_list[2].kwargs["headers"]["X-Payment"] == "signed"
+    assert mock_x402_signer.create_payment_headers.call_count == 2
+    assert (
+        mock_x402_signer.create_payment_headers.call_args.kwargs["response_headers"][
+            "x-payment-required"
+        ]
+        == "v1"
+    )
+    assert client.x402_payment_stats() == linkup.X402PaymentStats(
+        hits=1, misses=1, cached_endpoints=1
+    )
+
+
+def test_x402_preemptive_payment_by_depth(
+    mocker: MockerFixture, mock_x402_signer: MagicMock
+) -> None:
+    client = linkup.Client(x402_signer=mock_x402_signer, x402_preemptive_payment=True)
+    mock_x402_signer.create_payment_headers.return_value = {"X-Payment": "signed"}
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        side_effect=[
+            Response(status_code=402, content=_402_BODY, headers={"X-Payment-Required": "cheap"}),
+            Response(status_code=200, content=b'{"results": []}'),
+            Response(status_code=402, content=_402_BODY, headers={"X-Payment-Required": "pricy"}),
+            Response(status_code=200, content=b'{"results": []}'),
+            Response(status_code=200, content=b'{"results": []}'),
+            Response(status_code=200, content=b'{"results": []}'),
+        ],
+    )
+
+    client.search(query="query", depth="standard", output_type="searchResults")
+    client.search(query="query", depth="deep", output_type="searchResults")
+    client.search(query="other query", depth="standard", output_type="searchResults")
+    client.search(query="other query", depth="deep", output_type="searchResults")
+
+    assert request_mock.call_count == 6
+    assert [
+        call.kwargs["response_headers"]["x-payment-required"]
+        for call in mock_x402_signer.create_payment_headers.call_args_list
+    ] == ["cheap", "pricy", "cheap", "pricy"]
+    assert client.x402_payment_stats() == linkup.X402PaymentStats(
+        hits=2, misses=2, cached_endpoints=2
+    )
+
+
+def test_x402_preemptive_payment_requirements_changed(
+    mocker: MockerFixture, mock_x402_signer: MagicMock
+) -> None:
+    client = linkup.Client(x402_signer=mock_x402_signer, x402_preemptive_payment=True)
+    mock_x402_signer.create_payment_headers.return_value = {"X-Payment": "signed"}
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        side_effect=[
+            Response(status_code=402, content=_402_BODY, headers={"X-Payment-Required": "v1"}),
+            Response(status_code=200, content=b'{"results": []}'),
+            Response(status_code=402, content=_402_BODY, headers={"X-Payment-Required": "v2"}),
+            Response(status_code=200, content=b'{"results": []}'),
+        ],
+    )
+
+    client.search(query="query", depth="standard", output_type="searchResults")
+    client.search(query="query", depth="standard", output_type="searchResults")
+
+    assert request_mock.call_count == 4
+    assert client.x402_payment_stats() == linkup.X402PaymentStats(
+        hits=0, misses=2, cached_endpoints=1
+    )
+
+
+def test_x402_preemptive_payment_signing_failure(
+    mocker: MockerFixture, mock_x402_signer: MagicMock
+) -> None:
+    client = linkup.Client(x402_signer=mock_x402_signer, x402_preemptive_payment=True)
+    mock_x402_signer.create_payment_headers.side_effect = [
+        {"X-Payment": "signed"},
+        ValueError("Expired requirements"),
+        {"X-Payment": "signed"},
+    ]
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        side_effect=[
+            Response(status_code=402, content=_402_BODY),
+            Response(status_code=200, content=b'{"results": []}'),
+            Response(status_code=402, content=_402_BODY),
+            Response(status_code=200, content=b'{"results": []}'),
+        ],
+    )
+
+    client.search(query="query", depth="standard", output_type="searchResults")
+    client.search(query="query", depth="standard", output_type="searchResults")
+
+    assert "headers" not in request_mock.call_args_list[2].kwargs
+    assert client.x402_payment_stats().misses == 2
+
+
+@pytest.mark.asyncio
+async def test_async_x402_preemptive_payment(
+    mocker: MockerFixture, mock_x402_signer: MagicMock
+) -> None:
+    client = linkup.Client(x402_signer=mock_x402_signer, x402_preemptive_payment=True)
+    mock_x402_signer.async_create_payment_headers = AsyncMock(return_value={"X-Payment": "signed"})
+    request_mock = mocker.patch(
+        "httpx.AsyncClient.request",
+        side_effect=[
+            Response(status_code=402, content=_402_BODY),
+            Response(status_code=200, content=b'{"results": []}'),
+            Response(status_code=200, content=b'{"results": []}'),
+        ],
+    )
+
+    await client.async_search(query="query", depth="standard", output_type="searchResults")
+    await client.async_search(query="query", depth="standard", output_type="searchResults")
+
+    assert request_mock.call_count == 3
+    assert client.x402_payment_stats() == linkup.X402PaymentStats(
+        hits=1, misses=1, cached_endpoints=1
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_x402_signing_workers(
+    mocker: MockerFixture, mock_x402_signer: MagicMock
+) -> None:
+    client = linkup.Client(x402_signer=mock_x402_signer, x402_signing_workers=2)
+    signing_threads: list[str] = []
+
+    def create_payment_headers(*args: object, **kwargs: object) -> dict[str, str]:
+        signing_threads.append(threading.current_thread().name)
+        return {"X-Payment": "signed"}
+
+    mock_x402_signer.create_payment_headers.side_effect = create_payment_headers
+    mock_x402_signer.async_create_payment_headers = AsyncMock()
+    request_mock = mocker.patch(
+        "httpx.AsyncClient.request",
+        side_effect=[
+            Response(status_code=402, content=_402_BODY),
+            Response(status_code=200, content=b'{"results": []}'),
+        ],
+    )
+
+    await client.async_search(query="query", depth="standard", output_type="searchResults")
+    client.close()
+
+    assert request_mock.call_args.kwargs["headers"]["X-Payment"] == "signed"
+    assert len(signing_threads) == 1
+    assert signing_threads[0].startswith("linkup-x402")
+    mock_x402_signer.async_create_payment_headers.assert_not_called()
+
+
+def test_client_invalid_x402_signing_workers(mock_x402_signer: MagicMock) -> None:
+    with pytest.raises(ValueError, match="x402_signing_workers must be at least 1"):
+        linkup.Client(x402_signer=mock_x402_signer, x402_signing_workers=0)
+
+
+def test_no_cache_key_without_caches(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key")
+    get_cache_key_mock = mocker.patch("linkup._client.get_cache_key")
+    mocker.patch(
+        "httpx.Client.request",
+        side_effect=[
+            Response(status_code=200, content=b'{"results": []}'),
+            Response(status_code=200, content=b'{"markdown": "content", "favicon": ""}'),
+        ],
+    )
+
+    client.search(query="query", depth="standard", output_type="searchResults")
+    client.fetch(url="https://example.com")
+
+    get_cache_key_mock.assert_not_called()
+
+
+def test_search_cache(mocker: MockerFixture) -> None:
+    search_cache = linkup.MemoryCache()
+    client = linkup.Client(api_key="my-key", search_cache=search_cache)
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        return_value=Response(status_code=200, content=b'{"results": []}'),
+    )
+
+    search_response = client.search(query="query", depth="fast", output_type="searchResults")
+    cached_search_response = client.search(query="query", depth="fast", output_type="searchResults")
+    client.search(query="query", depth="standard", output_type="searchResults")
+
+    assert cached_search_response is search_response
+    assert request_mock.call_count == 2
+    assert search_cache.stats() == linkup.CacheStats(
+        hits=1, misses=2, evictions=0, entries=2, size_bytes=30
+    )
+
+
+def test_search_cache_parsed_responses_disabled(mocker: MockerFixture) -> None:
+    client = linkup.Client(
+        api_key="my-key", search_cache=linkup.MemoryCache(), parsed_responses_max_bytes=0
+    )
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        return_value=Response(status_code=200, content=b'{"results": []}'),
+    )
+
+    search_response = client.search(query="query", depth="fast", output_type="searchResults")
+    cached_search_response = client.search(query="query", depth="fast", output_type="searchResults")
+
+    assert cached_search_response == search_response
+    assert cached_search_response is not search_response
+    request_mock.assert_called_once()
+
+
+def test_client_invalid_parsed_responses_max_bytes() -> None:
+    with pytest.raises(ValueError, match="parsed_responses_max_bytes must not be negative"):
+        linkup.Client(api_key="my-key", parsed_responses_max_bytes=-1)
+
+
+@pytest.mark.asyncio
+async def test_async_search_cache(mocker: MockerFixture) -> None:
+    search_cache = linkup.MemoryCache()
+    client = linkup.Client(api_key="my-key", search_cache=search_cache)
+    request_mock = mocker.patch(
+        "httpx.AsyncClient.request",
+        return_value=Response(status_code=200, content=b'{"answer": "answer", "sources": []}'),
+    )
+
+    search_response = await client.async_search(
+        query="query", depth="fast", output_type="sourcedAnswer"
+    )
+    cached_search_response = await client.async_search(
+        query="query", depth="fast", output_type="sourcedAnswer"
+    )
+
+    assert cached_search_response is search_response
+    assert isinstance(search_response, linkup.SourcedAnswer)
+    request_mock.assert_called_once()
+
+
+def test_fetch_cache(mocker: MockerFixture, tmp_path: Path) -> None:
+    fetch_cache = linkup.SQLiteCache(tmp_path / "cache.db")
+    client = linkup.Client(api_key="my-key", fetch_cache=fetch_cache)
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        return_value=Response(
+            status_code=200, content=b'{"markdown": "Some web page content", "favicon": ""}'
+        ),
+    )
+
+    fetch_response = client.fetch(url="https://example.com")
+    other_client = linkup.Client(api_key="my-key", fetch_cache=fetch_cache)
+    cached_fetch_response = other_client.fetch(url="https://example.com")
+    other_client.fetch(url="https://example.com", render_js=True)
+
+    assert cached_fetch_response == fetch_response
+    assert cached_fetch_response.markdown == "Some web page content"
+    assert request_mock.call_count == 2
+    assert fetch_cache.stats().hits == 1
+
+
+@pytest.mark.asyncio
+async def test_async_fetch_cache(mocker: MockerFixture, tmp_path: Path) -> None:
+    fetch_cache = linkup.SQLiteCache(tmp_path / "cache.db")
+    client = linkup.Client(api_key="my-key", fetch_cache=fetch_cache)
+    request_mock = mocker.patch(
+        "httpx.AsyncClient.request",
+        return_value=Response(
+            status_code=200, content=b'{"markdown": "Some web page content", "favicon": ""}'
+        ),
+    )
+
+    fetch_response = await client.async_fetch(url="https://example.com")
+    cached_fetch_response = await client.async_fetch(url="https://example.com")
+
+    assert cached_fetch_response == fetch_response
+    request_mock.assert_called_once()
+
+
+def test_search_coalesce_requests(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key", coalesce_requests=True)
+    release = threading.Event()
+
+    def request(*args: object, **kwargs: object) -> Response:
+        release.wait(timeout=5)
+        return Response(status_code=200, content=b'{"results": []}')
+
+    request_mock = mocker.patch("httpx.Client.request", side_effect=request)
+    search_responses: list[object] = []
+
+    def search() -> None:
+        search_responses.append(
+            client.search(query="query", depth="fast", output_type="searchResults")
+        )
+
+    threads = [threading.Thread(target=search) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    while client.coalescing_stats().coalesced_calls < 4:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    request_mock.assert_called_once()
+    assert search_responses == [linkup.SearchResults(results=[])] * 5
+    assert client.coalescing_stats() == linkup.CoalescingStats(
+        calls=5, coalesced_calls=4, in_flight=0
+    )
+
+
+def test_search_coalesce_requests_error(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key", coalesce_requests=True)
+    release = threading.Event()
+
+    def request(*args: object, **kwargs: object) -> Response:
+        release.wait(timeout=5)
+        return Response(status_code=429, content=b'{"error": {"code": "TOO_MANY_REQUESTS"}}')
+
+    request_mock = mocker.patch("httpx.Client.request", side_effect=request)
+    errors: list[Exception] = []
+
+    def search() -> None:
+        try:
+            client.search(query="query", depth="fast", output_type="searchResults")
+        except linkup.TooManyRequestsError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=search) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    while client.coalescing_stats().coalesced_calls < 2:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    request_mock.assert_called_once()
+    assert len(errors) == 3
+
+
+def test_search_coalesce_requests_different_params(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key", coalesce_requests=True)
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        return_value=Response(status_code=200, content=b'{"results": []}'),
+    )
+
+    client.search(query="query", depth="fast", output_type="searchResults")
+    client.search(query="query", depth="fast", output_type="searchResults")
+    client.search(query="other query", depth="fast", output_type="searchResults")
+
+    assert request_mock.call_count == 3
+    assert client.coalescing_stats().coalesced_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_async_fetch_coalesce_requests(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key", coalesce_requests=True)
+    release = asyncio.Event()
+
+    async def request(*args: object, **kwargs: object) -> Response:
+        await release.wait()
+        return Response(status_code=200, content=b'{"markdown": "content", "favicon": ""}')
+
+    request_mock = mocker.patch("httpx.AsyncClient.request", side_effect=request)
+
+    fetches = [asyncio.create_task(client.async_fetch(url="https://example.com")) for _ in range(5)]
+    other_fetch = asyncio.create_task(client.async_fetch(url="https://example.com/other"))
+    await asyncio.sleep(0)
+    fetches[0].cancel()
+    release.set()
+    fetch_responses = await asyncio.gather(*fetches[1:], other_fetch)
+
+    assert request_mock.call_count == 2
+    assert all(fetch_response.markdown == "content" for fetch_response in fetch_responses)
+    assert fetches[0].cancelled()
+    assert client.coalescing_stats() == linkup.CoalescingStats(
+        calls=6, coalesced_calls=4, in_flight=0
+    )
+
+
+def test_search_structured_output_schema_serialization_is_cached(mocker: MockerFixture) -> None:
+    class Product(pydantic.BaseModel):
+        name: str
+
+    client = linkup.Client(api_key="my-key")
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        return_value=Response(status_code=200, content=b'{"name": "product"}'),
+    )
+    model_json_schema_spy = mocker.spy(Product, "model_json_schema")
+
+    for _ in range(3):
+        client.search(
+            query="query",
+            depth="standard",
+            output_type="structured",
+            structured_output_schema=Product,
+        )
+
+    model_json_schema_spy.assert_called_once()
+    assert request_mock.call_args.kwargs["json"]["structuredOutputSchema"] == json.dumps(
+        Product.model_json_schema()
+    )
+
+
+def test_search_dict_structured_output_schema_mutated(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key")
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        return_value=Response(status_code=200, content=b'{"name": "product"}'),
+    )
+    schema: dict[str, Any] = {"type": "object", "properties": {"name": {"type": "string"}}}
+
+    client.search(
+        query="query", depth="standard", output_type="structured", structured_output_schema=schema
+    )
+    schema["properties"]["price"] = {"type": "number"}
+    client.search(
+        query="query", depth="standard", output_type="structured", structured_output_schema=schema
+    )
+
+    assert request_mock.call_args.kwargs["json"]["structuredOutputSchema"] == json.dumps(schema)
+
+
+def _get_task_data(task_id: str, status: str) -> dict[str, Any]:
+    return {
+        "createdAt": "2026-05-18T00:00:00.000Z",
+        "error": None,
+        "id": task_id,
+        "input": {"outputType": "sourcedAnswer", "q": "query"},
+        "output": {"answer": "answer", "sources": []} if status == "completed" else None,
+        "status": status,
+        "type": "research",
+        "updatedAt": "2026-05-18T00:00:00.000Z",
+    }
+
+
+def test_get_task_task_cache(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key", task_cache=linkup.MemoryCache())
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        side_effect=[
+            Response(status_code=200, content=json.dumps(_get_task_data("1", "processing"))),
+            Response(status_code=200, content=json.dumps(_get_task_data("1", "completed"))),
+        ],
+    )
+
+    assert client.get_task("1").status == "processing"
+    task = client.get_task("1")
+    cached_task = client.get_task("1")
+
+    assert task.status == "completed"
+    assert cached_task == task
+    assert request_mock.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_get_research_task_cache(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key", task_cache=linkup.MemoryCache())
+    request_mock = mocker.patch(
+        "httpx.AsyncClient.request",
+        return_value=Response(status_code=200, content=json.dumps(_get_task_data("1", "failed"))),
+    )
+
+    research_task = await client.async_get_research("1")
+    cached_research_task = await client.async_get_research("1")
+
+    assert cached_research_task == research_task
+    request_mock.assert_called_once()
+
+
+def test_search_stale_while_revalidate(mocker: MockerFixture) -> None:
+    client = linkup.Client(
+        api_key="my-key",
+        search_cache=linkup.MemoryCache(ttl=0.05),
+        stale_policies=[linkup.StalePolicy(stale_while_revalidate=60.0)],
+    )
+    release = threading.Event()
+
+    def request(*args: object, **kwargs: object) -> Response:
+        if request_mock.call_count == 1:
+            return Response(status_code=200, content=b'{"answer": "old", "sources": []}')
+        release.wait(timeout=5)
+        return Response(status_code=200, content=b'{"answer": "new", "sources": []}')
+
+    request_mock = mocker.patch("httpx.Client.request", side_effect=request)
+
+    search_response = client.search(query="query", depth="standard", output_type="sourcedAnswer")
+    time.sleep(0.06)
+    stale_search_responses = [
+        client.search(query="query", depth="standard", output_type="sourcedAnswer")
+        for _ in range(3)
+    ]
+    while request_mock.call_count < 2:
+        time.sleep(0.001)
+
+    assert all(response == search_response for response in stale_search_responses)
+    assert request_mock.call_count == 2
+    release.set()
+    refreshed_search_response = search_response
+    deadline = time.monotonic() + 5
+    while refreshed_search_response == search_response and time.monotonic() < deadline:
+        time.sleep(0.001)
+        refreshed_search_response = client.search(
+            query="query", depth="standard", output_type="sourcedAnswer"
+        )
+    assert isinstance(refreshed_search_response, linkup.SourcedAnswer)
+    assert refreshed_search_response.answer == "new"
+
+
+@pytest.mark.asyncio
+async def test_async_search_stale_while_revalidate(mocker: MockerFixture) -> None:
+    client = linkup.Client(
+        api_key="my-key",
+        search_cache=linkup.MemoryCache(ttl=0.05),
+        stale_policies=[linkup.StalePolicy(stale_while_revalidate=60.0)],
+    )
+    request_mock = mocker.patch(
+        "httpx.AsyncClient.request",
+        side_effect=[
+            Response(status_code=200, content=b'{"answer": "old", "sources": []}'),
+            Response(status_code=200, content=b'{"answer": "new", "sources": []}'),
+        ],
+    )
+
+    search_response = await client.async_search(
+        query="query", depth="standard", output_type="sourcedAnswer"
+    )
+    await asyncio.sleep(0.06)
+    stale_search_response = await client.async_search(
+        query="query", depth="standard", output_type="sourcedAnswer"
+    )
+    await asyncio.sleep(0.01)
+    refreshed_search_response = await client.async_search(
+        query="query", depth="standard", output_type="sourcedAnswer"
+    )
+
+    assert stale_search_response == search_response
+    assert isinstance(refreshed_search_response, linkup.SourcedAnswer)
+    assert refreshed_search_response.answer == "new"
+    assert request_mock.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ("status_code", "depth", "expected_answer"),
+    [(503, "standard", "old"), (400, "standard", None), (503, "deep", None)],
+)
+def test_search_stale_if_error(
+    mocker: MockerFixture,
+    status_code: int,
+    depth: Literal["standard", "deep"],
+    expected_answer: str | None,
+) -> None:
+    client = linkup.Client(
+        api_key="my-key",
+        search_cache=linkup.MemoryCache(ttl=0.01),
+        stale_policies=[linkup.StalePolicy(stale_if_error=60.0, depths=["standard"])],
+    )
+    mocker.patch(
+        "httpx.Client.request",
+        side_effect=[
+            Response(status_code=200, content=b'{"answer": "old", "sources": []}'),
+            Response(status_code=status_code, content=b'{"error": {"code": "", "message": ""}}'),
+        ],
+    )
+
+    client.search(query="query", depth=depth, output_type="sourcedAnswer")
+    time.sleep(0.02)
+    if expected_answer is None:
+        with pytest.raises((linkup.UnknownError, linkup.InvalidRequestError)):
+            client.search(query="query", depth=depth, output_type="sourcedAnswer")
+    else:
+        search_response = client.search(query="query", depth=depth, output_type="sourcedAnswer")
+        assert isinstance(search_response, linkup.SourcedAnswer)
+        assert search_response.answer == expected_answer
+
+
+def test_search_stale_if_error_non_json_body(mocker: MockerFixture) -> None:
+    client = linkup.Client(
+        api_key="my-key",
+        search_cache=linkup.MemoryCache(ttl=0.01),
+        stale_policies=[linkup.StalePolicy(stale_if_error=60.0)],
+    )
+    mocker.patch(
+        "httpx.Client.request",
+        side_effect=[
+            Response(status_code=200, content=b'{"answer": "old", "sources": []}'),
+            Response(status_code=503, content=b"<html><body>Service Unavailable</body></html>"),
+        ],
+    )
+
+    client.search(query="query", depth="standard", output_type="sourcedAnswer")
+    time.sleep(0.02)
+    search_response = client.search(query="query", depth="standard", output_type="sourcedAnswer")
+
+    assert isinstance(search_response, linkup.SourcedAnswer)
+    assert search_response.answer == "old"
+
+
+def test_search_stale_if_error_tiered_cache(mocker: MockerFixture, tmp_path: Path) -> None:
+    client = linkup.Client(
+        api_key="my-key",
+        search_cache=linkup.TieredCache(
+            l1=linkup.MemoryCache(ttl=0.01), l2=linkup.SQLiteCache(tmp_path / "cache.db", ttl=0.01)
+        ),
+        stale_policies=[linkup.StalePolicy(stale_if_error=60.0)],
+    )
+    mocker.patch(
+        "httpx.Client.request",
+        side_effect=[
+            Response(status_code=200, content=b'{"answer": "old", "sources": []}'),
+            Response(status_code=500, content=b'{"error": {"code": "", "message": ""}}'),
+        ],
+    )
+
+    client.search(query="query", depth="standard", output_type="sourcedAnswer")
+    time.sleep(0.02)
+    search_response = client.search(query="query", depth="standard", output_type="sourcedAnswer")
+
+    assert isinstance(search_response, linkup.SourcedAnswer)
+    assert search_response.answer == "old"
+
+
+def test_stale_policies_unsupported_search_cache(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="stale_policies require"):
+        linkup.Client(
+            api_key="my-key",
+            search_cache=linkup.SQLiteCache(tmp_path / "cache.db"),
+            stale_policies=[linkup.StalePolicy(stale_if_error=60.0)],
+        )
+
+
+def test_list_tasks_task_cache(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key", task_cache=linkup.MemoryCache())
+    tasks_page_content = json.dumps(
+        {
+            "data": [_get_task_data("1", "completed"), _get_task_data("2", "processing")],
+            "metadata": {"page": 1, "pageSize": 2, "total": 2, "totalPages": 1},
+            "quota": {"inFlight": 1, "limit": 100},
+        }
+    )
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        return_value=Response(status_code=200, content=tasks_page_content),
+    )
+
+    tasks_page = client.list_tasks()
+    other_tasks_page = client.list_tasks()
+    task = client.get_task("1")
+
+    assert other_tasks_page.data[0] is tasks_page.data[0]
+    assert other_tasks_page.data[1] is not tasks_page.data[1]
+    assert task is tasks_page.data[0]
+    assert request_mock.call_count == 2
+
+
+def test_get_research_tiered_task_cache(mocker: MockerFixture, tmp_path: Path) -> None:
+    l2 = linkup.SQLiteCache(tmp_path / "cache.db")
+    client = linkup.Client(
+        api_key="my-key", task_cache=linkup.TieredCache(l1=linkup.MemoryCache(), l2=l2)
+    )
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        return_value=Response(
+            status_code=200, content=json.dumps(_get_task_data("1", "completed"))
+        ),
+    )
+
+    research_task = client.get_research("1")
+    other_client = linkup.Client(
+        api_key="my-key", task_cache=linkup.TieredCache(l1=linkup.MemoryCache(), l2=l2)
+    )
+    cached_research_task = other_client.get_research("1")
+
+    assert cached_research_task == research_task
+    request_mock.assert_called_once()
+
+
+def test_search_cache_canonical_key(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key", search_cache=linkup.MemoryCache())
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        return_value=Response(status_code=200, content=b'{"results": []}'),
+    )
+
+    client.search(
+        query="query",
+        depth="fast",
+        output_type="searchResults",
+        include_domains=["b.com", "a.com"],
+        from_date=date(2024, 1, 1),
+    )
+    client.search(
+        query="query",
+        depth="fast",
+        output_type="searchResults",
+        include_domains=["A.com", "b.com", "a.com"],
+        from_date="2024-01-01",
+    )
+    client.search(
+        query="query",
+        depth="fast",
+        output_type="searchResults",
+        include_domains=["a.com"],
+        from_date="2024-01-01",
+    )
+
+    assert request_mock.call_count == 2
+
+
+def test_fetch_cache_canonical_key(mocker: MockerFixture, tmp_path: Path) -> None:
+    client = linkup.Client(api_key="my-key", fetch_cache=linkup.SQLiteCache(tmp_path / "cache.db"))
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        return_value=Response(status_code=200, content=b'{"markdown": "content", "favicon": ""}'),
+    )
+
+    client.fetch(url="https://example.com/page")
+    client.fetch(url="HTTPS://Example.com:443/page/#section")
+    client.fetch(url="https://example.com/other-page")
+    client.fetch(url="https://example.com/page?query=1")
+
+    assert request_mock.call_count == 3
+
+
+def test_fetch_negative_cache(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key", negative_cache=linkup.NegativeCache())
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        return_value=Response(
+            status_code=400,
+            content=b'{"error": {"code": "FETCH_TARGET_UNREACHABLE", "message": "Unreachable"}}',
+        ),
+    )
+
+    for _ in range(3):
+        with pytest.raises(linkup.FetchTargetUnreachableError, match="Unreachable"):
+            client.fetch(url="https://example.com")
+
+    request_mock.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_search_negative_cache(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key", negative_cache=linkup.NegativeCache())
+    request_mock = mocker.patch(
+        "httpx.AsyncClient.request",
+        side_effect=[
+            Response(
+                status_code=400,
+                content=b'{"error": {"code": "SEARCH_QUERY_NO_RESULT", "message": "No result"}}',
+            ),
+            Response(status_code=429, content=b'{"error": {"code": "TOO_MANY_REQUESTS"}}'),
+            Response(status_code=429, content=b'{"error": {"code": "TOO_MANY_REQUESTS"}}'),
+        ],
+    )
+
+    for _ in range(2):
+        with pytest.raises(linkup.NoResultError):
+            await client.async_search(query="query", depth="fast", output_type="searchResults")
+    for _ in range(2):
+        with pytest.raises(linkup.TooManyRequestsError):
+            await client.async_search(query="other", depth="fast", output_type="searchResults")
+
+    assert request_mock.call_count == 3
+
+
+def _get_fast_polling_policy() -> linkup.PollingPolicy:
+    return linkup.PollingPolicy(
+        initial_interval=0.001, max_interval=0.01, jitter=False, expected_durations={"research": 0}
+    )
+
+
+def test_wait_for_tasks(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key", polling_policy=_get_fast_polling_policy())
+    tasks = [
+        client._parse_task(_get_task_data("1", "pending")),  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        client._parse_task(_get_task_data("2", "completed")),  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    ]
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        side_effect=[
+            Response(status_code=200, content=json.dumps(_get_task_data("1", "processing"))),
+            Response(status_code=200, content=json.dumps(_get_task_data("1", "failed"))),
+        ],
+    )
+
+    waited_tasks = client.wait_for_tasks(tasks)
+
+    assert [task.id for task in waited_tasks] == ["1", "2"]
+    assert [task.status for task in waited_tasks] == ["failed", "completed"]
+    assert request_mock.call_count == 2
+    assert request_mock.call_args.kwargs["url"] == "/tasks/1"
+
+
+def test_wait_for_task_deadline(mocker: MockerFixture) -> None:
+    client = linkup.Client(
+        api_key="my-key",
+        polling_policy=linkup.PollingPolicy(initial_interval=0.05, jitter=False),
+    )
+    research_task = client._parse_research_task(_get_task_data("1", "pending"))  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        return_value=Response(
+            status_code=200, content=json.dumps(_get_task_data("1", "processing"))
+        ),
+    )
+
+    with pytest.raises(linkup.TimeoutError):
+        client.wait_for_task(research_task, deadline=0.01)
+    request_mock.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_wait_for_tasks(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key", polling_policy=_get_fast_polling_policy())
+    tasks = [
+        client._parse_task(_get_task_data("1", "pending")),  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        client._parse_task(_get_task_data("2", "processing")),  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    ]
+    statuses = {"1": iter(["processing", "completed"]), "2": iter(["completed"])}
+
+    async def request(*args: object, **kwargs: object) -> Response:
+        task_id = str(kwargs["url"]).removeprefix("/tasks/")
+        task_data = _get_task_data(task_id, next(statuses[task_id]))
+        return Response(status_code=200, content=json.dumps(task_data))
+
+    request_mock = mocker.patch("httpx.AsyncClient.request", side_effect=request)
+
+    waited_tasks = await client.async_wait_for_tasks(tasks)
+
+    assert [task.id for task in waited_tasks] == ["1", "2"]
+    assert [task.status for task in waited_tasks] == ["completed", "completed"]
+    assert request_mock.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_async_wait_for_task_error(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key", polling_policy=_get_fast_polling_policy())
+    research_task = client._parse_research_task(_get_task_data("1", "pending"))  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    mocker.patch(
+        "httpx.AsyncClient.request",
+        return_value=Response(
+            status_code=404,
+            content=json.dumps(
+                {
+                    "statusCode": 404,
+                    "error": {"code": "TASK_NOT_FOUND", "message": "Task not found", "details": []},
+                }
+            ),
+        ),
+    )
+
+    with pytest.raises(linkup.TaskNotFoundError):
+        await client.async_wait_for_task(research_task)
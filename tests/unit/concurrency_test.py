@@ -0,0 +1,171 @@
+import asyncio
+
+import pytest
+
+import linkup
+
+
+async def _run_request(
+    limiter: linkup.AdaptiveConcurrencyLimiter, error: Exception | None = None
+) -> None:
+    async with limiter.slot():
+        await asyncio.sleep(0)
+        if error is not None:
+            raise error
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_limiter_limits_concurrency() -> None:
+    limiter = linkup.AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+    max_in_flight = 0
+
+    async def request() -> None:
+        nonlocal max_in_flight
+        async with limiter.slot():
+            max_in_flight = max(max_in_flight, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(request() for _ in range(6)))
+
+    assert max_in_flight == 2
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_limiter_additive_increase() -> None:
+    limiter = linkup.AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=3, increase_step=1)
+
+    for _ in range(2):
+        await _run_request(limiter)
+    assert limiter.limit == 3
+    for _ in range(10):
+        await _run_request(limiter)
+    assert limiter.limit == 3
+
+    assert [(a.previous_limit, a.limit, a.reason) for a in limiter.history] == [(2, 3, "healthy")]
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_limiter_slow_requests_are_not_healthy() -> None:
+    limiter = linkup.AdaptiveConcurrencyLimiter(initial_limit=1, latency_threshold=0.001)
+
+    for _ in range(2):
+        async with limiter.slot():
+            await asyncio.sleep(0.01)
+
+    assert limiter.limit == 1
+    assert limiter.history == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("error", "reason"),
+    [
+        (linkup.TooManyRequestsError("Too many requests"), "too_many_requests"),
+        (linkup.TimeoutError("Timeout"), "timeout"),
+    ],
+)
+async def test_adaptive_concurrency_limiter_multiplicative_decrease(
+    error: Exception, reason: str
+) -> None:
+    limiter = linkup.AdaptiveConcurrencyLimiter(initial_limit=10, min_limit=3)
+
+    with pytest.raises(type(error)):
+        await _run_request(limiter, error=error)
+    assert limiter.limit == 5
+    with pytest.raises(type(error)):
+        await _run_request(limiter, error=error)
+    assert limiter.limit == 3
+
+    assert [(a.previous_limit, a.limit, a.reason) for a in limiter.history] == [
+        (10, 5, reason),
+        (5, 3, reason),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_limiter_burst_of_failures_decreases_once() -> None:
+    limiter = linkup.AdaptiveConcurrencyLimiter(initial_limit=8)
+
+    results = await asyncio.gather(
+        *(
+            _run_request(limiter, error=linkup.TooManyRequestsError("Too many requests"))
+            for _ in range(8)
+        ),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, linkup.TooManyRequestsError) for result in results)
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_limiter_other_errors_are_neutral() -> None:
+    limiter = linkup.AdaptiveConcurrencyLimiter(initial_limit=1)
+
+    with pytest.raises(linkup.NoResultError):
+        await _run_request(limiter, error=linkup.NoResultError("No result"))
+
+    assert limiter.limit == 1
+    assert limiter.in_flight == 0
+    assert limiter.history == []
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_limiter_cancelled_waiter() -> None:
+    limiter = linkup.AdaptiveConcurrencyLimiter(initial_limit=1)
+    release = asyncio.Event()
+
+    async def request() -> None:
+        async with limiter.slot():
+            await release.wait()
+
+    running = asyncio.create_task(request())
+    await asyncio.sleep(0)
+    waiting = asyncio.create_task(request())
+    await asyncio.sleep(0)
+    waiting.cancel()
+    release.set()
+    await running
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    assert limiter.in_flight == 0
+    await asyncio.wait_for(_run_request(limiter), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_limiter_slot_timeout() -> None:
+    limiter = linkup.AdaptiveConcurrencyLimiter(initial_limit=1)
+    release = asyncio.Event()
+
+    async def request() -> None:
+        async with limiter.slot():
+            await release.wait()
+
+    running = asyncio.create_task(request())
+    await asyncio.sleep(0)
+    with pytest.raises(linkup.TimeoutError):
+        async with limiter.slot(timeout=0.01):
+            pass
+    release.set()
+    await running
+
+    assert limiter.in_flight == 0
+    await asyncio.wait_for(_run_request(limiter), timeout=1)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"initial_limit": 0, "min_limit": 0}, "Limits must satisfy"),
+        ({"initial_limit": 10, "max_limit": 5}, "Limits must satisfy"),
+        ({"decrease_factor": 1.0}, "decrease_factor must be between 0 and 1"),
+    ],
+)
+def test_adaptive_concurrency_limiter_invalid_parameters(
+    kwargs: dict[str, float], match: str
+) -> None:
+    with pytest.raises(ValueError, match=match):
+        linkup.AdaptiveConcurrencyLimiter(**kwargs)  # type: ignore[arg-type]
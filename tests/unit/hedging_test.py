@@ -0,0 +1,61 @@
+import pytest
+
+import linkup
+
+
+def test_hedging_policy_fixed_delay() -> None:
+    hedging_policy = linkup.HedgingPolicy(delay=0.5)
+
+    for _ in range(50):
+        hedging_policy.record(latency=2.0, hedged=False, hedge_won=False)
+
+    assert hedging_policy.get_delay() == 0.5
+
+
+def test_hedging_policy_percentile_delay() -> None:
+    hedging_policy = linkup.HedgingPolicy(percentile=90, min_samples=10)
+    assert hedging_policy.get_delay() is None
+
+    for latency in range(1, 11):
+        hedging_policy.record(latency=latency / 10, hedged=False, hedge_won=False)
+    hedging_policy.record(latency=None, hedged=False, hedge_won=False)
+
+    assert hedging_policy.get_delay() == 0.9
+
+
+def test_hedging_policy_percentile_window() -> None:
+    hedging_policy = linkup.HedgingPolicy(delay=0.5, percentile=50, window_size=4, min_samples=4)
+
+    for latency in [10.0, 10.0, 1.0, 1.0, 1.0, 1.0]:
+        hedging_policy.record(latency=latency, hedged=False, hedge_won=False)
+
+    assert hedging_policy.get_delay() == 1.0
+
+
+def test_hedging_policy_stats() -> None:
+    hedging_policy = linkup.HedgingPolicy(delay=0.5)
+    assert hedging_policy.stats() == linkup.HedgingStats(
+        requests=0, hedged_requests=0, hedge_wins=0, hedge_rate=0.0, win_rate=0.0
+    )
+
+    hedging_policy.record(latency=0.1, hedged=False, hedge_won=False)
+    hedging_policy.record(latency=0.6, hedged=True, hedge_won=False)
+    hedging_policy.record(latency=0.2, hedged=True, hedge_won=True)
+    hedging_policy.record(latency=0.1, hedged=False, hedge_won=False)
+
+    assert hedging_policy.stats() == linkup.HedgingStats(
+        requests=4, hedged_requests=2, hedge_wins=1, hedge_rate=0.5, win_rate=0.5
+    )
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({}, "Either delay or percentile must be provided"),
+        ({"percentile": 0}, "percentile must be between 0 and 100"),
+        ({"percentile": 101}, "percentile must be between 0 and 100"),
+    ],
+)
+def test_hedging_policy_invalid_parameters(kwargs: dict[str, float], match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        linkup.HedgingPolicy(**kwargs)  # type: ignore[arg-type]
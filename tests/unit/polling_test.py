@@ -0,0 +1,98 @@
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+import linkup
+
+
+def _get_task(task_type: str, task_input: dict[str, Any]) -> linkup.Task:
+    task_data = {
+        "createdAt": "2026-05-18T00:00:00.000Z",
+        "id": "1",
+        "input": task_input,
+        "status": "processing",
+        "type": task_type,
+        "updatedAt": "2026-05-18T00:00:00.000Z",
+    }
+    task_classes: dict[str, type[linkup.Task]] = {
+        "search": linkup.SearchTask,
+        "fetch": linkup.FetchTask,
+        "research": linkup.ResearchTask,
+    }
+    return task_classes[task_type].model_validate(task_data)
+
+
+@pytest.mark.parametrize(
+    ("task_type", "task_input", "expected_duration"),
+    [
+        ("search", {"q": "query", "depth": "fast", "outputType": "searchResults"}, 1.0),
+        ("search", {"q": "query", "depth": "deep", "outputType": "searchResults"}, 20.0),
+        ("fetch", {"url": "https://example.com"}, 3.0),
+        ("fetch", {"url": "https://example.com", "mode": "pro"}, 10.0),
+        ("research", {"q": "query", "outputType": "sourcedAnswer"}, 60.0),
+        ("research", {"q": "query", "outputType": "sourcedAnswer", "reasoningDepth": "XL"}, 600.0),
+    ],
+)
+def test_polling_policy_expected_duration(
+    task_type: str, task_input: dict[str, Any], expected_duration: float
+) -> None:
+    policy = linkup.PollingPolicy()
+
+    assert policy.get_expected_duration(_get_task(task_type, task_input)) == expected_duration
+
+
+def test_polling_policy_custom_expected_duration() -> None:
+    policy = linkup.PollingPolicy(expected_durations={"research:XL": 1200.0, "fetch": 1.0})
+    research_task = _get_task(
+        "research", {"q": "query", "outputType": "sourcedAnswer", "reasoningDepth": "XL"}
+    )
+
+    assert policy.get_expected_duration(research_task) == 1200.0
+    assert policy.get_expected_duration(_get_task("fetch", {"url": "https://example.com"})) == 1.0
+
+
+def test_polling_policy_backoff() -> None:
+    policy = linkup.PollingPolicy(
+        initial_interval=1.0, max_interval=5.0, backoff_factor=2.0, jitter=False
+    )
+    task = _get_task("search", {"q": "query", "depth": "fast", "outputType": "searchResults"})
+
+    delays = [policy.get_poll_delay(task, polls=polls, elapsed=10.0) for polls in range(5)]
+
+    assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+def test_polling_policy_expected_duration_delay() -> None:
+    policy = linkup.PollingPolicy(initial_interval=0.5, max_interval=60.0, jitter=False)
+    task = _get_task(
+        "research", {"q": "query", "outputType": "sourcedAnswer", "reasoningDepth": "M"}
+    )
+
+    assert policy.get_poll_delay(task, polls=0, elapsed=0.0) == 45.0
+    assert policy.get_poll_delay(task, polls=1, elapsed=45.0) == 22.5
+    assert policy.get_poll_delay(task, polls=5, elapsed=100.0) == 0.5 * 1.5**5
+
+
+def test_polling_policy_jitter(mocker: MockerFixture) -> None:
+    uniform_mock = mocker.patch("random.uniform", return_value=0.75)
+    policy = linkup.PollingPolicy(initial_interval=1.0)
+    task = _get_task("fetch", {"url": "https://example.com"})
+
+    delay = policy.get_poll_delay(task, polls=0, elapsed=10.0)
+
+    assert delay == 0.75
+    uniform_mock.assert_called_once_with(0.5, 1.0)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"initial_interval": 0.0}, "initial_interval must be positive"),
+        ({"max_interval": 0.1}, "max_interval must be at least initial_interval"),
+        ({"backoff_factor": 0.5}, "backoff_factor must be at least 1"),
+    ],
+)
+def test_polling_policy_invalid_parameters(kwargs: dict[str, float], match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        linkup.PollingPolicy(**kwargs)  # type: ignore[arg-type]
@@ -0,0 +1,78 @@
+import asyncio
+import threading
+
+import pytest
+from pytest_mock import MockerFixture
+
+import linkup
+
+
+def test_rate_limiter_burst(mocker: MockerFixture) -> None:
+    mocker.patch("time.monotonic", return_value=100.0)
+    sleep_mock = mocker.patch("time.sleep")
+    rate_limiter = linkup.RateLimiter(rate=2.0, burst=3)
+
+    for _ in range(3):
+        rate_limiter.acquire()
+    sleep_mock.assert_not_called()
+
+    rate_limiter.acquire()
+    rate_limiter.acquire()
+    assert [call.args[0] for call in sleep_mock.call_args_list] == [0.5, 1.0]
+
+
+def test_rate_limiter_refill(mocker: MockerFixture) -> None:
+    monotonic_mock = mocker.patch("time.monotonic", return_value=100.0)
+    sleep_mock = mocker.patch("time.sleep")
+    rate_limiter = linkup.RateLimiter(rate=1.0)
+
+    rate_limiter.acquire()
+    monotonic_mock.return_value = 101.0
+    rate_limiter.acquire()
+    monotonic_mock.return_value = 101.5
+    rate_limiter.acquire()
+
+    assert [call.args[0] for call in sleep_mock.call_args_list] == [0.5]
+
+
+def test_rate_limiter_shared_between_threads() -> None:
+    rate_limiter = linkup.RateLimiter(rate=1000.0, burst=1)
+    threads = [threading.Thread(target=rate_limiter.acquire) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert rate_limiter._tokens <= 1  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_async_acquire(mocker: MockerFixture) -> None:
+    mocker.patch("time.monotonic", return_value=100.0)
+    sleep_mock = mocker.patch("asyncio.sleep")
+    rate_limiter = linkup.RateLimiter(rate=4.0, burst=1)
+
+    await asyncio.gather(*(rate_limiter.async_acquire() for _ in range(3)))
+
+    assert [call.args[0] for call in sleep_mock.call_args_list] == [0.25, 0.5]
+
+
+def test_rate_limiter_acquire_timeout(mocker: MockerFixture) -> None:
+    mocker.patch("time.monotonic", return_value=100.0)
+    sleep_mock = mocker.patch("time.sleep")
+    rate_limiter = linkup.RateLimiter(rate=0.5, burst=1)
+
+    assert rate_limiter.acquire(timeout=0.0)
+    assert not rate_limiter.acquire(timeout=1.0)
+    assert rate_limiter.acquire(timeout=2.0)
+
+    assert [call.args[0] for call in sleep_mock.call_args_list] == [2.0]
+
+
+@pytest.mark.parametrize(
+    ("rate", "burst", "match"),
+    [(0.0, None, "rate must be positive"), (1.0, 0, "burst must be at least 1")],
+)
+def test_rate_limiter_invalid_parameters(rate: float, burst: int | None, match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        linkup.RateLimiter(rate=rate, burst=burst)
@@ -0,0 +1,86 @@
+import httpx
+import pytest
+from httpx import Response
+from pytest_mock import MockerFixture
+
+import linkup
+
+
+def test_retry_policy_exponential_backoff() -> None:
+    policy = linkup.RetryPolicy(max_attempts=5, backoff_base=1.0, backoff_cap=3.0, jitter=False)
+    error = linkup.TooManyRequestsError()
+
+    assert policy.get_retry_delay(attempt=1, error=error, response=None) == 1.0
+    assert policy.get_retry_delay(attempt=2, error=error, response=None) == 2.0
+    assert policy.get_retry_delay(attempt=3, error=error, response=None) == 3.0
+    assert policy.get_retry_delay(attempt=4, error=error, response=None) == 3.0
+    assert policy.get_retry_delay(attempt=5, error=error, response=None) is None
+
+
+def test_retry_policy_full_jitter(mocker: MockerFixture) -> None:
+    uniform_mock = mocker.patch("random.uniform", return_value=0.25)
+    policy = linkup.RetryPolicy(backoff_base=1.0)
+
+    delay = policy.get_retry_delay(attempt=2, error=linkup.TimeoutError(), response=None)
+
+    assert delay == 0.25
+    uniform_mock.assert_called_once_with(0, 2.0)
+
+
+@pytest.mark.parametrize(
+    ("error", "response", "expected_retry"),
+    [
+        (linkup.TooManyRequestsError(), None, True),
+        (linkup.TimeoutError(), None, True),
+        (httpx.ConnectError("connection failed"), None, True),
+        (linkup.UnknownError(), Response(status_code=503), True),
+        (linkup.UnknownError(), Response(status_code=404), False),
+        (linkup.InsufficientCreditError(), Response(status_code=429), False),
+        (linkup.NoResultError(), Response(status_code=400), False),
+    ],
+)
+def test_retry_policy_retryable_errors(
+    error: Exception, response: Response | None, expected_retry: bool
+) -> None:
+    policy = linkup.RetryPolicy()
+
+    delay = policy.get_retry_delay(attempt=1, error=error, response=response)
+
+    assert (delay is not None) is expected_retry
+
+
+@pytest.mark.parametrize(
+    ("retry_after", "expected_delay"),
+    [
+        ("2", 2.0),
+        ("0.1", 0.5),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0.5),
+        ("invalid", 0.5),
+        ("60", None),
+    ],
+)
+def test_retry_policy_retry_after(retry_after: str, expected_delay: float | None) -> None:
+    policy = linkup.RetryPolicy(backoff_base=0.5, backoff_cap=30.0, jitter=False)
+    response = Response(status_code=429, headers={"Retry-After": retry_after})
+
+    delay = policy.get_retry_delay(
+        attempt=1, error=linkup.TooManyRequestsError(), response=response
+    )
+
+    assert delay == expected_delay
+
+
+def test_retry_policy_ignore_retry_after() -> None:
+    policy = linkup.RetryPolicy(backoff_base=0.5, jitter=False, respect_retry_after=False)
+    response = Response(status_code=429, headers={"Retry-After": "60"})
+
+    delay = policy.get_retry_delay(
+        attempt=1, error=linkup.TooManyRequestsError(), response=response
+    )
+
+    assert delay == 0.5
+
+
+def test_retry_policy_invalid_max_attempts() -> None:
+    with pytest.raises(ValueError, match="max_attempts must be at least 1"):
+        linkup.RetryPolicy(max_attempts=0)
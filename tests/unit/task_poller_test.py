@@ -0,0 +1,198 @@
+import json
+from typing import Any
+
+import pytest
+from httpx import Response
+from pytest_mock import MockerFixture
+
+import linkup
+
+
+def _get_task_data(task_id: str, status: str, updated_at: str) -> dict[str, Any]:
+    return {
+        "createdAt": "2026-05-18T10:00:00.000Z",
+        "error": None,
+        "id": task_id,
+        "input": {"url": "https://example.com"},
+        "output": None,
+        "status": status,
+        "type": "fetch",
+        "updatedAt": updated_at,
+    }
+
+
+def _get_tasks_page_content(tasks_data: list[dict[str, Any]], page: int, total_pages: int) -> str:
+    return json.dumps(
+        {
+            "data": tasks_data,
+            "metadata": {
+                "page": page,
+                "pageSize": 2,
+                "total": 2 * total_pages,
+                "totalPages": total_pages,
+            },
+            "quota": {"inFlight": 3, "limit": 100},
+        }
+    )
+
+
+def _get_tracked_tasks() -> list[linkup.Task]:
+    return [
+        linkup.FetchTask.model_validate(_get_task_data(task_id, "pending", "2026-05-18T10:00:00Z"))
+        for task_id in ("1", "2", "3")
+    ]
+
+
+def test_task_poller_poll(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key")
+    poller = linkup.TaskPoller(client, tasks=_get_tracked_tasks(), page_size=2, overlap=0.0)
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        side_effect=[
+            Response(
+                status_code=200,
+                content=_get_tasks_page_content(
+                    [
+                        _get_task_data("1", "completed", "2026-05-18T10:05:00.000Z"),
+                        _get_task_data("other", "completed", "2026-05-18T10:04:00.000Z"),
+                    ],
+                    page=1,
+                    total_pages=3,
+                ),
+            ),
+            Response(
+                status_code=200,
+                content=_get_tasks_page_content(
+                    [
+                        _get_task_data("3", "failed", "2026-05-18T10:03:00.000Z"),
+                        _get_task_data("older", "completed", "2026-05-18T09:00:00.000Z"),
+                    ],
+                    page=2,
+                    total_pages=3,
+                ),
+            ),
+            Response(
+                status_code=200,
+                content=_get_tasks_page_content(
+                    [_get_task_data("1", "completed", "2026-05-18T10:05:00.000Z")],
+                    page=1,
+                    total_pages=1,
+                ),
+            ),
+        ],
+    )
+
+    done = poller.poll()
+    assert [(task.id, task.status) for task in done] == [("1", "completed"), ("3", "failed")]
+    assert poller.pending_ids == ["2"]
+    assert request_mock.call_count == 2
+    assert request_mock.call_args.kwargs["params"] == {
+        "page": 2,
+        "pageSize": 2,
+        "sortBy": "updatedAt",
+        "sortDirection": "desc",
+        "status": ["completed", "failed"],
+    }
+
+    assert poller.poll() == []
+    assert poller.pending_ids == ["2"]
+    assert request_mock.call_count == 3
+
+
+def test_task_poller_stragglers(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key")
+    poller = linkup.TaskPoller(
+        client, tasks=_get_tracked_tasks(), page_size=2, max_pages=1, max_stragglers=2
+    )
+    request_mock = mocker.patch(
+        "httpx.Client.request",
+        side_effect=[
+            Response(
+                status_code=200,
+                content=_get_tasks_page_content(
+                    [
+                        _get_task_data("other", "completed", "2026-05-18T10:05:00.000Z"),
+                        _get_task_data("2", "completed", "2026-05-18T10:04:00.000Z"),
+                    ],
+                    page=1,
+                    total_pages=10,
+                ),
+            ),
+            Response(
+                status_code=200,
+                content=json.dumps(_get_task_data("1", "processing", "2026-05-18T10:01:00Z")),
+            ),
+            Response(
+                status_code=200,
+                content=json.dumps(_get_task_data("3", "completed", "2026-05-18T10:02:00Z")),
+            ),
+        ],
+    )
+
+    done = poller.poll()
+
+    assert [task.id for task in done] == ["2", "3"]
+    assert poller.pending_ids == ["1"]
+    assert [call.kwargs["url"] for call in request_mock.call_args_list] == [
+        "/tasks",
+        "/tasks/1",
+        "/tasks/3",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_task_poller_async_poll(mocker: MockerFixture) -> None:
+    client = linkup.Client(api_key="my-key")
+    poller = linkup.TaskPoller(client, page_size=2)
+    poller.add(_get_tracked_tasks())
+    request_mock = mocker.patch(
+        "httpx.AsyncClient.request",
+        return_value=Response(
+            status_code=200,
+            content=_get_tasks_page_content(
+                [
+                    _get_task_data("2", "completed", "2026-05-18T10:05:00.000Z"),
+                    _get_task_data("1", "failed", "2026-05-18T10:04:00.000Z"),
+                ],
+                page=1,
+                total_pages=1,
+            ),
+        ),
+    )
+
+    done = await poller.async_poll()
+
+    assert [task.id for task in done] == ["2", "1"]
+    assert poller.pending_ids == ["3"]
+    request_mock.assert_called_once()
+
+
+def test_task_poller_add_ignores_done_tasks(mocker: MockerFixture) -> None:
+    poller = linkup.TaskPoller(linkup.Client(api_key="my-key"))
+    request_mock = mocker.patch("httpx.Client.request")
+
+    poller.add(
+        [
+            linkup.FetchTask.model_validate(
+                _get_task_data("0", "completed", "2026-05-18T10:05:00.000Z")
+            )
+        ]
+    )
+
+    assert poller.pending_ids == []
+    assert poller.poll() == []
+    request_mock.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"page_size": 0}, "page_size must be at least 1"),
+        ({"max_pages": 0}, "max_pages must be at least 1"),
+        ({"max_stragglers": 0}, "max_stragglers must be at least 1"),
+        ({"overlap": -1.0}, "overlap must not be negative"),
+    ],
+)
+def test_task_poller_invalid_parameters(kwargs: dict[str, float], match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        linkup.TaskPoller(linkup.Client(api_key="my-key"), **kwargs)  # type: ignore[arg-type]
@@ -1,11 +1,18 @@
 import builtins
 import sys
+import threading
 from types import ModuleType
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from linkup.x402._signer import LinkupX402Signer, _DefaultX402Signer, create_x402_signer
+from linkup.x402 import _signer
+from linkup.x402._signer import (
+    LinkupX402Signer,
+    _DefaultX402Signer,
+    create_x402_signer,
+    get_x402_signer,
+)
 
 
 def _setup_x402_mocks(monkeypatch: pytest.MonkeyPatch) -> dict[str, MagicMock]:
@@ -79,6 +86,39 @@ def test_create_x402_signer(monkeypatch: pytest.MonkeyPatch) -> None:
     assert isinstance(signer, _DefaultX402Signer)
 
 
+def test_get_x402_signer(monkeypatch: pytest.MonkeyPatch) -> None:
+    mocks = _setup_x402_mocks(monkeypatch)
+    monkeypatch.setattr(_signer, "_signers", {})
+    mocks["account"].address = "0xA"
+    other_account = MagicMock(address="0xB")
+
+    signer = get_x402_signer(mocks["account"])
+
+    assert get_x402_signer(mocks["account"]) is signer
+    assert get_x402_signer(other_account) is not signer
+    assert mocks["evm_signer_class"].call_count == 2
+
+
+def test_get_x402_signer_concurrent(monkeypatch: pytest.MonkeyPatch) -> None:
+    mocks = _setup_x402_mocks(monkeypatch)
+    monkeypatch.setattr(_signer, "_signers", {})
+    mocks["account"].address = "0xA"
+    signers: list[_DefaultX402Signer] = []
+
+    threads = [
+        threading.Thread(target=lambda: signers.append(get_x402_signer(mocks["account"])))
+        for _ in range(10)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(signers) == 10
+    assert all(signer is signers[0] for signer in signers)
+    mocks["evm_signer_class"].assert_called_once()
+
+
 def test_create_x402_signer_missing_deps(monkeypatch: pytest.MonkeyPatch) -> None:
     blocked = (
         "x402",